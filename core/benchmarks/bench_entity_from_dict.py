@@ -0,0 +1,88 @@
+"""
+Benchmark entity parsing with and without the cache of resolved
+spec and status classes, without spec validation (trusted backend payloads)
+and with lazy specs, validated at first access.
+
+Artifacts are always measured. Runs are measured when the runtime of
+--run-kind (e.g. "dbt+run") is installed, as run specs are registered
+by the runtime packages.
+
+Usage: python bench_entity_from_dict.py --iterations 2000 --run-kind dbt+run
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from digitalhub_core.entities._builders.spec import clear_spec_cache
+from digitalhub_core.entities._builders.status import clear_status_cache
+from digitalhub_core.entities.artifacts.entity import Artifact
+from digitalhub_core.entities.runs.entity import Run
+from digitalhub_core.utils.generic_utils import build_uuid
+from digitalhub_core.utils.import_utils import check_module_existence_by_framework
+
+ARTIFACT = {
+    "id": build_uuid(),
+    "project": "bench",
+    "name": "artifact",
+    "kind": "artifact",
+    "metadata": {"project": "bench", "name": "artifact", "embedded": True},
+    "spec": {"path": "s3://bucket/artifact.csv"},
+    "status": {"state": "CREATED"},
+}
+
+
+def build_run(kind: str) -> dict:
+    """
+    Build a run dictionary of the given kind.
+    """
+    runtime = kind.split("+")[0]
+    return {
+        "id": build_uuid(),
+        "project": "bench",
+        "kind": kind,
+        "metadata": {"project": "bench"},
+        "spec": {"task": f"{runtime}+job://bench/function:{build_uuid()}", "local_execution": True},
+        "status": {"state": "CREATED"},
+    }
+
+
+def timeit(cls: type, obj: dict, iterations: int, cached: bool = True, **kwargs) -> float:
+    """
+    Return mean microseconds per from_dict call.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if not cached:
+            clear_spec_cache()
+            clear_status_cache()
+        cls.from_dict(obj, **kwargs)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2_000)
+    parser.add_argument("--run-kind", default="dbt+run")
+    args = parser.parse_args()
+
+    cases = [(Artifact, ARTIFACT)]
+    try:
+        check_module_existence_by_framework(args.run_kind.split("+")[0])
+        cases.append((Run, build_run(args.run_kind)))
+    except ModuleNotFoundError:
+        print(f"Runtime for {args.run_kind} not installed, skipping runs.")
+
+    for cls, obj in cases:
+        uncached = timeit(cls, obj, args.iterations, cached=False)
+        cached = timeit(cls, obj, args.iterations)
+        trusted = timeit(cls, obj, args.iterations, validate=False)
+        lazy = timeit(cls, obj, args.iterations, lazy=True)
+        print(
+            f"{cls.__name__:<10} uncached={uncached:8.1f}us cached={cached:8.1f}us "
+            f"trusted={trusted:8.1f}us lazy={lazy:8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
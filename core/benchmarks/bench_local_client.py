@@ -0,0 +1,69 @@
+"""
+Benchmark ClientLocal.read_object on projects of increasing size.
+
+Each step adds the given number of artifacts and functions to a project
+(plus the same amount to another project, which must not slow down reads)
+and times project reads, latest reads and versioned reads.
+
+Usage: python bench_local_client.py --sizes 100 1000 10000 --reads 200
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from digitalhub_core.client.objects.local import ClientLocal
+
+API_BASE = "/api/v1"
+API_CONTEXT = f"{API_BASE}/-"
+
+
+def fill(client: ClientLocal, project: str, size: int) -> None:
+    """
+    Create a project with size artifacts and functions, two versions each.
+    """
+    client.create_object({"name": project, "spec": {}}, f"{API_BASE}/projects")
+    for dto in ("artifacts", "functions"):
+        for i in range(size):
+            for version in range(2):
+                obj = {
+                    "id": f"{dto}-{i}-{version}",
+                    "name": f"{dto}-{i}",
+                    "project": project,
+                    "metadata": {"embedded": False},
+                    "spec": {"path": f"s3://bucket/{i}"},
+                }
+                client.create_object(obj, f"{API_CONTEXT}/{project}/{dto}")
+
+
+def timeit(func, reads: int) -> float:
+    """
+    Return mean microseconds per call.
+    """
+    start = time.perf_counter()
+    for _ in range(reads):
+        func()
+    return (time.perf_counter() - start) / reads * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        client = ClientLocal()
+        fill(client, "bench", size)
+        fill(client, "other", size)
+
+        project = timeit(lambda: client.read_object(f"{API_BASE}/projects/bench"), max(args.reads // 10, 1))
+        latest = timeit(lambda: client.read_object(f"{API_CONTEXT}/bench/artifacts/artifacts-0/latest"), args.reads)
+        version = timeit(
+            lambda: client.read_object(f"{API_CONTEXT}/bench/artifacts/artifacts-0/artifacts-0-0"), args.reads
+        )
+        print(f"size={size:<8} project={project:12,.1f}us latest={latest:8.2f}us version={version:8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
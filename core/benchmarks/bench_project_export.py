@@ -0,0 +1,72 @@
+"""
+Benchmark project export and import as YAML files and as a bundle.
+
+A local project is filled with the given number of artifacts, half of
+them not embedded. The YAML path writes the project and one file per
+not embedded artifact, and imports them back one file at a time. The
+bundle path writes and reads a single archive.
+
+Usage: python bench_project_export.py --sizes 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from digitalhub_core.entities.artifacts.crud import import_artifact
+from digitalhub_core.entities.projects.crud import get_or_create_project, import_project
+
+
+def timeit(func) -> float:
+    """
+    Return seconds taken by a call.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def import_yaml(project: str) -> None:
+    """
+    Import a project and its artifacts from YAML files.
+    """
+    import_project(Path(project) / f"project_{project}.yml", local=True)
+    for path in Path(project).glob("artifact_*.yml"):
+        import_artifact(path)
+
+
+def import_bundle(project: str) -> None:
+    """
+    Import a project and its artifacts from a bundle.
+    """
+    imported = import_project(Path(project) / f"project_{project}.tar.gz", local=True)
+    imported.spec.artifacts.entities()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000])
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp())
+    for size in args.sizes:
+        name = f"bench-{size}"
+        project = get_or_create_project(name=name, local=True)
+        for i in range(size):
+            project.new_artifact(name=f"artifact-{i}", target_path=f"s3://bucket/{i}.csv", embedded=i % 2 == 0)
+
+        export_yaml = timeit(lambda: project.export())
+        export_bundle = timeit(lambda: project.export(bundle=True))
+        read_yaml = timeit(lambda: import_yaml(name))
+        read_bundle = timeit(lambda: import_bundle(name))
+        print(
+            f"size={size:<6} export yaml={export_yaml:7.3f}s bundle={export_bundle:7.3f}s "
+            f"import yaml={read_yaml:7.3f}s bundle={read_bundle:7.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
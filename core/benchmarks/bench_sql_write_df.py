@@ -0,0 +1,70 @@
+"""
+Benchmark SqlStore.write_df with INSERT (to_sql) and COPY bulk loads.
+
+The database is configured with the same environment variables used by
+the default SQL store: POSTGRES_HOST, POSTGRES_PORT, POSTGRES_USER,
+POSTGRES_PASSWORD and POSTGRES_DATABASE.
+
+Usage: python bench_sql_write_df.py --rows 1000000 --schema public
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from digitalhub_core.stores.objects.sql import SqlStore, SQLStoreConfig
+
+
+def build_df(rows: int) -> pd.DataFrame:
+    """
+    Build a dataframe with mixed column types.
+    """
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.random(rows),
+            "label": rng.choice(["a", "b", "c", None], rows),
+            "created": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 10**6, rows), unit="s"),
+        }
+    )
+
+
+def run(store: SqlStore, df: pd.DataFrame, schema: str, method: str | None) -> float:
+    """
+    Write the dataframe and return elapsed seconds.
+    """
+    dst = f"sql://{store.config.database}/{schema}/bench_write_df"
+    start = time.perf_counter()
+    store.write_df(df, dst, if_exists="replace", method=method)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--schema", default="public")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = SQLStoreConfig(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=os.getenv("POSTGRES_PORT", 5432),
+        user=os.getenv("POSTGRES_USER"),
+        password=os.getenv("POSTGRES_PASSWORD"),
+        database=os.getenv("POSTGRES_DATABASE"),
+    )
+    store = SqlStore("bench", "sql", config)
+    df = build_df(args.rows)
+
+    for method in (None, "multi", "copy"):
+        timings = [run(store, df, args.schema, method) for _ in range(args.repeat)]
+        best = min(timings)
+        print(f"method={str(method):<6} best={best:8.2f}s rows/s={args.rows / best:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
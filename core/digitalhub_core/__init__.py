@@ -1,16 +1,20 @@
 """
 Import modules from submodules.
 """
+
 from digitalhub_core.entities.artifacts.crud import (
     delete_artifact,
     get_artifact,
+    get_artifact_async,
     import_artifact,
+    list_artifacts,
     new_artifact,
     update_artifact,
 )
 from digitalhub_core.entities.functions.crud import (
     delete_function,
     get_function,
+    get_function_async,
     import_function,
     new_function,
     update_function,
@@ -23,19 +27,44 @@ from digitalhub_core.entities.projects.crud import (
     new_project,
     update_project,
 )
-from digitalhub_core.entities.runs.crud import delete_run, get_run, import_run, new_run, update_run
-from digitalhub_core.entities.secrets.crud import delete_secret, get_secret, import_secret, new_secret, update_secret
+from digitalhub_core.entities.runs.futures import wait_all
+from digitalhub_core.entities.runs.crud import (
+    delete_run,
+    get_run,
+    get_run_async,
+    import_run,
+    list_runs,
+    new_run,
+    update_run,
+)
+from digitalhub_core.entities.secrets.crud import (
+    delete_secret,
+    get_secret,
+    get_secret_async,
+    import_secret,
+    new_secret,
+    update_secret,
+)
 from digitalhub_core.entities.services.crud import (
     delete_service,
     get_service,
+    get_service_async,
     import_service,
     new_service,
     update_service,
 )
-from digitalhub_core.entities.tasks.crud import delete_task, get_task, import_task, new_task, update_task
+from digitalhub_core.entities.tasks.crud import (
+    delete_task,
+    get_task,
+    get_task_async,
+    import_task,
+    new_task,
+    update_task,
+)
 from digitalhub_core.entities.workflows.crud import (
     delete_workflow,
     get_workflow,
+    get_workflow_async,
     import_workflow,
     new_workflow,
     update_workflow,
@@ -3,10 +3,13 @@ Client builder module.
 """
 from __future__ import annotations
 
+import os
 import typing
 
 from digitalhub_core.client.objects.dhcore import ClientDHCore
+from digitalhub_core.client.objects.dhcore_async import AsyncClientDHCore
 from digitalhub_core.client.objects.local import ClientLocal
+from digitalhub_core.client.objects.local_sqlite import ClientLocalSQLite
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.client.objects.base import Client
@@ -18,6 +21,8 @@ class ClientBuilder:
 
     It implements the builder pattern to create a client instance.
     The client builder can be used to create a local or non-local client instance.
+    If the DIGITALHUB_CORE_LOCAL_DB environment variable is set, the local
+    client persists objects in the SQLite database at that path.
     """
 
     def __init__(self) -> None:
@@ -26,6 +31,8 @@ class ClientBuilder:
         """
         self._local = None
         self._dhcore = None
+        self._dhcore_async = None
+        self._dhcore_config = None
 
     def build(self, local: bool = False, config: dict = None) -> Client:
         """
@@ -43,13 +50,29 @@ class ClientBuilder:
         """
         if local:
             if self._local is None:
-                self._local = ClientLocal()
+                path = os.getenv("DIGITALHUB_CORE_LOCAL_DB")
+                self._local = ClientLocalSQLite(path) if path else ClientLocal()
             return self._local
 
         if self._dhcore is None:
             self._dhcore = ClientDHCore(config)
+            self._dhcore_config = config
         return self._dhcore
 
+    def build_async(self) -> AsyncClientDHCore:
+        """
+        Method to create an async DHCore client instance. The async client
+        uses the same configuration of the DHCore client.
+
+        Returns
+        -------
+        AsyncClientDHCore
+            Returns the async client instance.
+        """
+        if self._dhcore_async is None:
+            self._dhcore_async = AsyncClientDHCore(self._dhcore_config)
+        return self._dhcore_async
+
 
 def get_client(local: bool = False) -> Client:
     """
@@ -68,6 +91,18 @@ def get_client(local: bool = False) -> Client:
     return client_builder.build(local)
 
 
+def get_async_client() -> AsyncClientDHCore:
+    """
+    Wrapper around ClientBuilder.build_async.
+
+    Returns
+    -------
+    AsyncClientDHCore
+        The async client instance.
+    """
+    return client_builder.build_async()
+
+
 def build_client(local: bool = False, config: dict = None) -> None:
     """
     Wrapper around ClientBuilder.build.
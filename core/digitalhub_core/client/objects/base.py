@@ -4,6 +4,10 @@ Client Base module.
 from __future__ import annotations
 
 from abc import abstractmethod
+from typing import Iterator
+
+# Default number of objects fetched per page when listing
+DEFAULT_PAGE_SIZE = 100
 
 
 class Client:
@@ -39,6 +43,12 @@ class Client:
         Delete object method.
         """
 
+    @abstractmethod
+    def list_objects(self, api: str, filters: dict | None = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[dict]:
+        """
+        List objects method.
+        """
+
     @staticmethod
     @abstractmethod
     def is_local() -> bool:
@@ -4,11 +4,21 @@ DHCore Client module.
 from __future__ import annotations
 
 import os
+import threading
+from typing import Iterator
 
 import requests
-from digitalhub_core.client.objects.base import Client
+from digitalhub_core.client.objects.base import DEFAULT_PAGE_SIZE, Client
 from digitalhub_core.utils.exceptions import BackendError
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# HTTP methods safe to retry
+RETRY_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"])
+
+# Response statuses retried on idempotent methods
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
 
 
 class ClientConfig(BaseModel):
@@ -26,6 +36,162 @@ class ClientConfig(BaseModel):
     token: str = None
     """Token."""
 
+    timeout: float = 60
+    """Seconds to wait for the backend before giving up on a call."""
+
+    pool_maxsize: int = 10
+    """Maximum number of connections kept alive in the session pool."""
+
+    max_retries: int = 3
+    """Number of retries of idempotent calls on connection errors and retryable statuses."""
+
+    backoff_factor: float = 0.5
+    """Exponential backoff factor between retries, in seconds."""
+
+
+class DHCoreConnection:
+    """
+    DHCore connection.
+
+    Endpoint, authentication and configuration of the DHCore backend,
+    shared by the sync and async DHCore clients.
+    """
+
+    def __init__(self, config: dict = None) -> None:
+        """
+        Constructor. Endpoint and authentication parameters are read
+        from the configuration if provided, otherwise from the environment
+        variables.
+
+        Parameters
+        ----------
+        config : dict
+            The client config.
+        """
+        self.endpoint = None
+        self.auth_type = None
+        self.auth_params = None
+        self.config = ClientConfig()
+
+        # Get endpoint at the beginning
+        self.endpoint = self._get_endpoint()
+
+        # Evaluate configuration authentication parameters
+        # In case, override endpoint if provided
+        if config is not None:
+
+            # Validate configuration against pydantic model
+            config = ClientConfig(**config)
+            self.config = config
+
+            # Set connection parameters
+            if config.username is not None and config.password is not None:
+                self.auth_params = (config.username, config.password)
+                self.auth_type = "basic"
+
+            if config.token is not None:
+                self.auth_params = config.token
+                self.auth_type = "token"
+
+            if config.endpoint is not None:
+                self.endpoint = config.endpoint
+
+            return
+
+        # Otherwise, use environment variables
+        self.auth_params = self._get_auth()
+        if isinstance(self.auth_params, tuple):
+            self.auth_type = "basic"
+        if isinstance(self.auth_params, str):
+            self.auth_type = "token"
+
+    def url(self, api: str) -> str:
+        """
+        Build the url of an api.
+
+        Parameters
+        ----------
+        api : str
+            The api.
+
+        Returns
+        -------
+        str
+            The url.
+        """
+        return self.endpoint + api
+
+    def request_kwargs(self, headers: dict | None = None, **kwargs) -> dict:
+        """
+        Build the keyword arguments of a request, adding authentication,
+        headers and the default timeout.
+
+        Parameters
+        ----------
+        headers : dict
+            Additional request headers.
+        **kwargs
+            Keyword arguments of the request.
+
+        Returns
+        -------
+        dict
+            The keyword arguments.
+        """
+        if self.auth_type == "basic":
+            kwargs["auth"] = self.auth_params
+        elif self.auth_type == "token":
+            headers = {**(headers or {}), "Authorization": f"Bearer {self.auth_params}"}
+        if headers:
+            kwargs["headers"] = headers
+        kwargs.setdefault("timeout", self.config.timeout)
+        return kwargs
+
+    @staticmethod
+    def _get_endpoint() -> str:
+        """
+        Get DHub Core endpoint environment variables.
+
+        Returns
+        -------
+        str
+            DHub Core endpoint environment variables.
+
+        Raises
+        ------
+        Exception
+            If the endpoint of DHCore is not set in the env variables.
+        """
+        endpoint = os.getenv("DIGITALHUB_CORE_ENDPOINT")
+        if endpoint is None:
+            raise BackendError("Endpoint not set as environment variables.")
+
+        # Sanitize endpoint string
+        if endpoint.endswith("/"):
+            endpoint = endpoint[:-1]
+
+        return endpoint
+
+    @staticmethod
+    def _get_auth() -> tuple[str, str] | str | None:
+        """
+        Get authentication parameters from the config.
+
+        Returns
+        -------
+        tuple[str, str], str, None
+            The authentication parameters.
+        """
+        user = os.getenv("DIGITALHUB_CORE_USER")
+        password = os.getenv("DIGITALHUB_CORE_PASSWORD")
+
+        if user is None or password is None:
+            token = os.getenv("DIGITALHUB_CORE_TOKEN")
+            if token is not None:
+                return token
+            return None
+        return user, password
+
 
 class ClientDHCore(Client):
     """
@@ -42,10 +208,12 @@ class ClientDHCore(Client):
         """
         super().__init__()
 
-        self._endpoint = None
-        self._auth_type = None
-        self._auth_params = None
-        self._set_connection(config)
+        self._connection = DHCoreConnection(config)
+        self._config = self._connection.config
+
+        # Long-lived session shared by every call
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
 
     def create_object(self, obj: dict, api: str) -> dict:
         """
@@ -118,10 +286,72 @@ class ClientDHCore(Client):
             resp = {"deleted": resp}
         return resp
 
+    def list_objects(self, api: str, filters: dict | None = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[dict]:
+        """
+        List objects. Pages are fetched lazily while the returned
+        generator is consumed, so only one page is kept in memory.
+
+        Parameters
+        ----------
+        api : str
+            The api to list the objects with.
+        filters : dict
+            Filters passed as query parameters (e.g. kind, state).
+        page_size : int
+            Number of objects fetched per page.
+
+        Returns
+        -------
+        Iterator[dict]
+            The objects.
+        """
+        params = dict(filters or {})
+        params["size"] = page_size
+        page = 0
+        while True:
+            params["page"] = page
+            resp = self._call("GET", api, params=params)
+
+            # The backend returns a page object, but plain lists are accepted
+            if isinstance(resp, list):
+                yield from resp
+                return
+            content = resp.get("content", [])
+            yield from content
+            if resp.get("last", True) or len(content) < page_size:
+                return
+            page += 1
+
+    def read_object_conditional(self, api: str, etag: str | None = None) -> tuple[dict | None, str | None]:
+        """
+        Get an object only if it changed. If an ETag is given, it is sent
+        with an If-None-Match header and the backend can answer with
+        304 Not Modified instead of the object.
+
+        Parameters
+        ----------
+        api : str
+            The api to get the object with.
+        etag : str
+            ETag of the object already known by the caller.
+
+        Returns
+        -------
+        tuple[dict | None, str | None]
+            The object (None if not modified) and its ETag (None if the
+            backend does not provide one).
+        """
+        headers = {"If-None-Match": etag} if etag is not None else None
+        response = self._request("GET", api, headers=headers)
+        if response.status_code == 304:
+            return None, etag
+        return self._parse_json(response), response.headers.get("ETag")
+
     def _call(self, call_type: str, api: str, **kwargs) -> dict:
         """
         Make a call to the DHCore API.
         Keyword arguments are passed to the session.request function.
+        The call timeout can be overridden with the timeout keyword argument.
 
         Parameters
         ----------
@@ -137,125 +367,108 @@ class ClientDHCore(Client):
         dict
             The response object.
         """
-        url = self._endpoint + api
+        return self._parse_json(self._request(call_type, api, **kwargs))
 
-        # Choose auth type
-        if self._auth_type == "basic":
-            kwargs["auth"] = self._auth_params
-        elif self._auth_type == "token":
-            kwargs["headers"] = {"Authorization": f"Bearer {self._auth_params}"}
+    def _request(self, call_type: str, api: str, headers: dict | None = None, **kwargs) -> requests.Response:
+        """
+        Make a request to the DHCore API and check the response status.
+
+        Parameters
+        ----------
+        call_type : str
+            The type of call to make.
+        api : str
+            The api to call.
+        headers : dict
+            Additional request headers.
+        **kwargs
+            Keyword arguments passed to the session.request function.
+
+        Returns
+        -------
+        requests.Response
+            The response.
+        """
+        url = self._connection.url(api)
+        kwargs = self._connection.request_kwargs(headers, **kwargs)
 
         # Call
-        response = None
         try:
-            response = requests.request(call_type, url, timeout=60, **kwargs)
+            response = self._get_session().request(call_type, url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return response
         except requests.exceptions.RequestException as e:
             if isinstance(e, requests.exceptions.Timeout):
                 msg = "Request to DHCore backend timed out."
             elif isinstance(e, requests.exceptions.ConnectionError):
                 msg = "Unable to connect to DHCore backend."
-            elif isinstance(e, requests.exceptions.JSONDecodeError):
-                return {}
             else:
                 msg = f"Backend error: {e}"
             raise BackendError(msg) from e
 
-    ################################
-    # Env methods
-    ################################
-
-    def _set_connection(self, config: dict = None) -> None:
+    @staticmethod
+    def _parse_json(response: requests.Response) -> dict:
         """
-        Function to set environment variables for DHub Core config.
+        Parse the response body, returning an empty dictionary if the
+        body is not JSON.
 
         Parameters
         ----------
-        config : ClientConfig
-            The client config.
+        response : requests.Response
+            The response.
 
         Returns
         -------
-        None
+        dict
+            The response object.
         """
+        try:
+            return response.json()
+        except requests.exceptions.JSONDecodeError:
+            return {}
 
-        # Get endpoint at the beginning
-        self._endpoint = self._get_endpoint()
-
-        # Evaluate configuration authentication parameters
-        # In case, override endpoint if provided
-        if config is not None:
-
-            # Validate configuration against pydantic model
-            config = ClientConfig(**config)
-
-            # Set connection parameters
-            if config.username is not None and config.password is not None:
-                self._auth_params = (config.username, config.password)
-                self._auth_type = "basic"
-
-            if config.token is not None:
-                self._auth_params = config.token
-                self._auth_type = "token"
-
-            if config.endpoint is not None:
-                self._endpoint = config.endpoint
-
-            return
-
-        # Otherwise, use environment variables
-        self._auth_params = self._get_auth()
-        if isinstance(self._auth_params, tuple):
-            self._auth_type = "basic"
-        if isinstance(self._auth_params, str):
-            self._auth_type = "token"
-        return
+    ################################
+    # Session methods
+    ################################
 
-    @staticmethod
-    def _get_endpoint() -> str:
+    def _get_session(self) -> requests.Session:
         """
-        Get DHub Core endpoint environment variables.
+        Get the HTTP session. The session is built once and reused by
+        every call, so connections to the backend are kept alive.
 
         Returns
         -------
-        str
-            DHub Core endpoint environment variables.
-
-        Raises
-        ------
-        Exception
-            If the endpoint of DHCore is not set in the env variables.
+        requests.Session
+            The HTTP session.
         """
-        endpoint = os.getenv("DIGITALHUB_CORE_ENDPOINT")
-        if endpoint is None:
-            raise BackendError("Endpoint not set as environment variables.")
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
 
-        # Sanitize endpoint string
-        if endpoint.endswith("/"):
-            endpoint = endpoint[:-1]
-
-        return endpoint
-
-    @staticmethod
-    def _get_auth() -> tuple[str, str] | str | None:
+    def _build_session(self) -> requests.Session:
         """
-        Get authentication parameters from the config.
+        Build a new HTTP session. Idempotent calls are retried with
+        exponential backoff on connection errors and retryable statuses.
 
         Returns
         -------
-        tuple[str, str], str, None
-            The authentication parameters.
+        requests.Session
+            The HTTP session.
         """
-        user = os.getenv("DIGITALHUB_CORE_USER")
-        password = os.getenv("DIGITALHUB_CORE_PASSWORD")
-
-        if user is None or password is None:
-            token = os.getenv("DIGITALHUB_CORE_TOKEN")
-            if token is not None:
-                return token
-            return None
-        return user, password
+        retry = Retry(
+            total=self._config.max_retries,
+            backoff_factor=self._config.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=self._config.pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     @staticmethod
     def is_local() -> bool:
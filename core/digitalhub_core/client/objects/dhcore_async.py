@@ -0,0 +1,307 @@
+"""
+DHCore async client module.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import typing
+import weakref
+from typing import AsyncIterator
+
+from digitalhub_core.client.objects.base import DEFAULT_PAGE_SIZE
+from digitalhub_core.client.objects.dhcore import RETRY_METHODS, RETRY_STATUSES, DHCoreConnection
+from digitalhub_core.utils.exceptions import BackendError
+
+if typing.TYPE_CHECKING:
+    import httpx
+
+
+class AsyncClientDHCore:
+    """
+    DHCore async client.
+
+    The async client exposes the CRUD operations of the DHCore client as
+    coroutines, so that many backend calls can be awaited concurrently
+    (e.g. with asyncio.gather). It shares configuration, authentication
+    and retry policy with the DHCore client. It requires the httpx package.
+    Connections are bound to the event loop they were opened in, so the
+    client keeps one HTTP client per event loop. Close it with aclose()
+    (or use the client with async with) before the event loop ends.
+    """
+
+    def __init__(self, config: dict = None) -> None:
+        """
+        Constructor.
+        """
+        self._connection = DHCoreConnection(config)
+        self._config = self._connection.config
+
+        # HTTP clients by event loop
+        self._sessions: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sessions_lock = threading.Lock()
+
+    async def __aenter__(self) -> AsyncClientDHCore:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def create_object(self, obj: dict, api: str) -> dict:
+        """
+        Create an object.
+
+        Parameters
+        ----------
+        obj : dict
+            The object to create.
+        api : str
+            The api to create the object with.
+
+        Returns
+        -------
+        dict
+            The created object.
+        """
+        return await self._call("POST", api, json=obj)
+
+    async def read_object(self, api: str) -> dict:
+        """
+        Get an object.
+
+        Parameters
+        ----------
+        api : str
+            The api to get the object with.
+
+        Returns
+        -------
+        dict
+            The object.
+        """
+        return await self._call("GET", api)
+
+    async def update_object(self, obj: dict, api: str) -> dict:
+        """
+        Update an object.
+
+        Parameters
+        ----------
+        obj : dict
+            The object to update.
+        api : str
+            The api to update the object with.
+
+        Returns
+        -------
+        dict
+            The updated object.
+        """
+        return await self._call("PUT", api, json=obj)
+
+    async def delete_object(self, api: str) -> dict:
+        """
+        Delete an object.
+
+        Parameters
+        ----------
+        api : str
+            The api to delete the object with.
+
+        Returns
+        -------
+        dict
+            A generic dictionary.
+        """
+        resp = await self._call("DELETE", api)
+        if isinstance(resp, bool):
+            resp = {"deleted": resp}
+        return resp
+
+    async def list_objects(
+        self,
+        api: str,
+        filters: dict | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[dict]:
+        """
+        List objects. Pages are fetched lazily while the returned
+        async generator is consumed, so only one page is kept in memory.
+
+        Parameters
+        ----------
+        api : str
+            The api to list the objects with.
+        filters : dict
+            Filters passed as query parameters (e.g. kind, state).
+        page_size : int
+            Number of objects fetched per page.
+
+        Returns
+        -------
+        AsyncIterator[dict]
+            The objects.
+        """
+        params = dict(filters or {})
+        params["size"] = page_size
+        page = 0
+        while True:
+            params["page"] = page
+            resp = await self._call("GET", api, params=params)
+
+            # The backend returns a page object, but plain lists are accepted
+            if isinstance(resp, list):
+                for obj in resp:
+                    yield obj
+                return
+            content = resp.get("content", [])
+            for obj in content:
+                yield obj
+            if resp.get("last", True) or len(content) < page_size:
+                return
+            page += 1
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP client of the running event loop.
+
+        Returns
+        -------
+        None
+        """
+        with self._sessions_lock:
+            session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.aclose()
+
+    async def _call(self, call_type: str, api: str, **kwargs) -> dict:
+        """
+        Make a call to the DHCore API.
+        Keyword arguments are passed to the httpx request function.
+        Idempotent calls are retried with exponential backoff on
+        connection errors and retryable statuses.
+
+        Parameters
+        ----------
+        call_type : str
+            The type of call to make.
+        api : str
+            The api to call.
+        **kwargs
+            Keyword arguments.
+
+        Returns
+        -------
+        dict
+            The response object.
+        """
+        client = self._get_session()
+        import httpx  # Available, checked when building the session
+
+        url = self._connection.url(api)
+        kwargs = self._connection.request_kwargs(**kwargs)
+        retries = self._config.max_retries if call_type in RETRY_METHODS else 0
+
+        # Call
+        for attempt in range(retries + 1):
+            last = attempt == retries
+            try:
+                response = await client.request(call_type, url, **kwargs)
+            except httpx.TransportError as e:
+                if not last:
+                    await self._backoff(attempt)
+                    continue
+                if isinstance(e, httpx.TimeoutException):
+                    msg = "Request to DHCore backend timed out."
+                else:
+                    msg = "Unable to connect to DHCore backend."
+                raise BackendError(msg) from e
+
+            if response.status_code in RETRY_STATUSES and not last:
+                await self._backoff(attempt)
+                continue
+
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise BackendError(f"Backend error: {e}") from e
+            try:
+                return response.json()
+            except ValueError:
+                return {}
+
+    async def _backoff(self, attempt: int) -> None:
+        """
+        Wait before retrying a call, doubling the wait at each attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of the failed attempt, starting from 0.
+
+        Returns
+        -------
+        None
+        """
+        await asyncio.sleep(self._config.backoff_factor * (2**attempt))
+
+    ################################
+    # Session methods
+    ################################
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """
+        Get the async HTTP client of the running event loop, building it
+        on first use. Each event loop has its own client, so the client
+        can be used from event loops running in different threads.
+
+        Returns
+        -------
+        httpx.AsyncClient
+            The async HTTP client.
+        """
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            session = self._sessions.get(loop)
+            if session is None:
+                session = self._sessions[loop] = self._build_session()
+        return session
+
+    def _build_session(self) -> httpx.AsyncClient:
+        """
+        Build a new httpx async client, keeping alive up to pool_maxsize
+        connections.
+
+        Returns
+        -------
+        httpx.AsyncClient
+            The async HTTP client.
+
+        Raises
+        ------
+        ImportError
+            If httpx is not installed.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("Async client requires httpx. Install it with 'pip install httpx'.") from e
+        limits = httpx.Limits(
+            max_connections=self._config.pool_maxsize,
+            max_keepalive_connections=self._config.pool_maxsize,
+        )
+        return httpx.AsyncClient(limits=limits)
+
+    @staticmethod
+    def is_local() -> bool:
+        """
+        Declare if Client is local.
+
+        Returns
+        -------
+        bool
+            False
+        """
+        return False
@@ -1,9 +1,12 @@
 """
 Local Client module.
 """
+from __future__ import annotations
+
 from copy import deepcopy
+from typing import Iterator
 
-from digitalhub_core.client.objects.base import Client
+from digitalhub_core.client.objects.base import DEFAULT_PAGE_SIZE, Client
 from digitalhub_core.utils.exceptions import BackendError
 
 
@@ -18,14 +21,33 @@ class ClientLocal(Client):
     Main differences are:
         - Local client does delete objects on cascade.
         - The run execution are forced to be local.
+    Versioned objects are indexed by project and DTO, and the latest version
+    of each object is tracked with a pointer to its uuid, so reads and
+    project specs cost proportionally to the objects involved.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, copy_on_read: bool = False) -> None:
         """
         Constructor.
+
+        Parameters
+        ----------
+        copy_on_read : bool
+            If True, read objects are deep copied, so they can be modified
+            without affecting the stored ones. Projects read with their
+            spec are always copied.
         """
         super().__init__()
-        self._db: dict[str, dict[str, dict]] = {}
+        self._copy_on_read = copy_on_read
+
+        # Objects, by dto, (project, name) and uuid (name only for unversioned objects)
+        self._db: dict[str, dict[str | tuple[str, str], dict]] = {}
+
+        # Uuid of the latest version, by (project, dto, name)
+        self._latest: dict[tuple[str, str, str], str] = {}
+
+        # Names of the versioned objects, by (project, dto)
+        self._index: dict[tuple[str, str], dict[str, None]] = {}
 
     ########################
     # CRUD
@@ -53,18 +75,15 @@ class ClientLocal(Client):
             if dto is None:
                 raise TypeError
 
-            # Check if dto exists, if not create a mapping
-            self._db.setdefault(dto, {})
-
             # Unversioned objects uses "base api". For example:
             #
             # POST /api/v1/projects
             if project is None:
                 name = obj["name"]
-                if name in self._db[dto]:
-                    code = 5
-                    raise ValueError
-                self._db[dto][name] = obj
+
+                # Raises ValueError if the object already exists
+                code = 5
+                self._insert(dto, name, obj)
 
             # Versioned objects uses "context api". For example:
             #
@@ -73,17 +92,15 @@ class ClientLocal(Client):
             # POST /api/v1/-/<project-name>/workflows
             #
             # We have bith "name" and "id" attributes for versioned objects
-            # so we use them as storage keys. The "latest" key is used
-            # to store the latest version of the object.
+            # so we use them as storage keys. The latest version of the
+            # object is tracked by uuid.
             else:
                 if dto in ("runs", "tasks"):
                     name = obj["id"]
                 else:
                     name = obj["name"]
                 uuid = obj["id"]
-                self._db[dto].setdefault(name, {})
-                self._db[dto][name][uuid] = obj
-                self._db[dto][name]["latest"] = obj
+                self._insert(dto, name, obj, project=project, uuid=uuid)
 
             # Return the created object
             return obj
@@ -122,7 +139,7 @@ class ClientLocal(Client):
             # self._parse_api() should return only dto
 
             if project is None:
-                obj = self._db[dto][name]
+                obj = self._get(dto, name)
 
                 # If the object is a project, we need to add the project spec,
                 # for example artifacts, functions, workflows, etc.
@@ -137,10 +154,10 @@ class ClientLocal(Client):
             # self._parse_api() should return dto, name and uuid/version
 
             else:
-                if uuid is None:
-                    uuid = name
-                obj = self._db[dto][name][uuid]
+                obj = self._get(dto, name, uuid if uuid is not None else name, project=project)
 
+            if self._copy_on_read:
+                obj = deepcopy(obj)
             return obj
 
         except KeyError:
@@ -171,7 +188,7 @@ class ClientLocal(Client):
             # PUT /api/v1/projects/<name>
 
             if project is None:
-                self._db[dto][name] = obj
+                self._update(dto, name, obj)
 
             # Versioned objects
             # API example
@@ -179,9 +196,7 @@ class ClientLocal(Client):
             # PUT /api/v1/-/<project-name>/artifacts/<uuid>
 
             else:
-                if uuid is None:
-                    uuid = name
-                self._db[dto][name][uuid] = obj
+                self._update(dto, name, obj, uuid if uuid is not None else name, project=project)
 
         except KeyError:
             msg = self._format_msg(code, project, dto, name, uuid)
@@ -211,7 +226,7 @@ class ClientLocal(Client):
             # DELETE /api/v1/projects/<name>
 
             if uuid is None:
-                obj = self._db[dto].pop(name)
+                obj = self._remove(dto, name, project=project)
 
             # Versioned objects
             # API example
@@ -223,13 +238,38 @@ class ClientLocal(Client):
             # not by name nor dto.
 
             else:
-                obj = self._db[dto][name].pop(uuid)
+                obj = self._remove(dto, name, project=project, uuid=uuid)
 
         except KeyError:
             msg = self._format_msg(code, project, dto, name, uuid)
             raise BackendError(msg)
         return {"deleted": obj}
 
+    def list_objects(self, api: str, filters: dict | None = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[dict]:
+        """
+        List the latest version of the objects of a project.
+
+        Parameters
+        ----------
+        api : str
+            The api to list the objects with.
+        filters : dict
+            Filters on object attributes, looked up in the object and in
+            its metadata and status (e.g. kind, state).
+        page_size : int
+            Ignored, objects are kept in memory.
+
+        Returns
+        -------
+        Iterator[dict]
+            The objects.
+        """
+        project, dto, _, _, _ = self._parse_api(api)
+        filters = filters or {}
+        for obj in self._list_latest(project, dto):
+            if all(self._get_attribute(obj, key) == value for key, value in filters.items()):
+                yield deepcopy(obj) if self._copy_on_read else obj
+
     ########################
     # Logic for CRUD
     ########################
@@ -332,44 +372,264 @@ class ClientLocal(Client):
         dict
             The project object with the spec.
         """
-        # Deepcopy to avoid modifying the original object
+        # Copy the project and its objects to avoid modifying the stored ones
         project = deepcopy(obj)
         spec = project.get("spec", {})
 
         # Get all entities associated with the project specs
-        projects_entities = [k for k, _ in self._db.items() if k not in ["projects", "runs", "tasks"]]
+        projects_entities = [k for k in self._list_dtos() if k not in ["projects", "runs", "tasks"]]
 
         for entity_type in projects_entities:
-            # Get all objects of the entity type for the project
-            objs = self._db[entity_type]
-
-            # Set empty list
             spec[entity_type] = []
 
-            # Cycle through named objects
-            for _, named_entities in objs.items():
-                # Get latest version
-                for version, entity in named_entities.items():
-                    if version != "latest":
-                        continue
+            # Cycle through the latest version of the project objects
+            for entity in self._list_latest(name, entity_type):
+                # Remove spec if not embedded
+                if not entity.get("metadata", {}).get("embedded", True):
+                    entity = {k: v for k, v in entity.items() if k != "spec"}
 
-                    # Deepcopy to avoid modifying the original object
-                    copied = deepcopy(entity)
+                spec[entity_type].append(deepcopy(entity))
 
-                    # Remove spec if not embedded
-                    if not copied.get("metadata", {}).get("embedded", True):
-                        copied.pop("spec", None)
+        return project
 
-                    # Add to project spec
-                    if copied["project"] == name:
-                        spec[entity_type].append(copied)
+    ########################
+    # Storage
+    ########################
 
-        return project
+    def _insert(self, dto: str, name: str, obj: dict, project: str | None = None, uuid: str | None = None) -> None:
+        """
+        Store a new object. Versioned objects (with project and uuid)
+        become the latest version of their name.
+
+        Parameters
+        ----------
+        dto : str
+            The DTO name.
+        name : str
+            The object name.
+        obj : dict
+            The object.
+        project : str
+            The project name, None for unversioned objects.
+        uuid : str
+            The object uuid, None for unversioned objects.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If an unversioned object with the same name exists.
+        """
+        objs = self._db.setdefault(dto, {})
+        if project is None:
+            if name in objs:
+                raise ValueError(name)
+            objs[name] = obj
+            return
+        objs.setdefault((project, name), {})[uuid] = obj
+        self._latest[(project, dto, name)] = uuid
+        self._index.setdefault((project, dto), {})[name] = None
+
+    def _get(self, dto: str, name: str, uuid: str | None = None, project: str | None = None) -> dict:
+        """
+        Get a stored object.
+
+        Parameters
+        ----------
+        dto : str
+            The DTO name.
+        name : str
+            The object name.
+        uuid : str
+            The object uuid or "latest", None for unversioned objects.
+        project : str
+            The project name, None for unversioned objects.
+
+        Returns
+        -------
+        dict
+            The object.
+
+        Raises
+        ------
+        KeyError
+            If the object does not exist.
+        """
+        if uuid is None:
+            return self._db[dto][name]
+        if uuid == "latest":
+            uuid = self._latest[(project, dto, name)]
+        return self._db[dto][(project, name)][uuid]
+
+    def _update(
+        self,
+        dto: str,
+        name: str,
+        obj: dict,
+        uuid: str | None = None,
+        project: str | None = None,
+    ) -> None:
+        """
+        Replace a stored object.
+
+        Parameters
+        ----------
+        dto : str
+            The DTO name.
+        name : str
+            The object name.
+        obj : dict
+            The object.
+        uuid : str
+            The object uuid or "latest", None for unversioned objects.
+        project : str
+            The project name, None for unversioned objects.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If the object name does not exist.
+        """
+        if uuid is None:
+            self._db[dto][name] = obj
+            return
+        if uuid == "latest":
+            uuid = self._latest[(project, dto, name)]
+        self._db[dto][(project, name)][uuid] = obj
+
+    def _remove(self, dto: str, name: str, project: str | None = None, uuid: str | None = None) -> dict:
+        """
+        Remove a stored object. Without uuid, every version of the
+        name is removed. If the latest version is removed, latest points
+        to the last created remaining version.
+
+        Parameters
+        ----------
+        dto : str
+            The DTO name.
+        name : str
+            The object name.
+        project : str
+            The project name, None for unversioned objects.
+        uuid : str
+            The object uuid or "latest".
+
+        Returns
+        -------
+        dict
+            The removed object (or versions, if uuid is None).
+
+        Raises
+        ------
+        KeyError
+            If the object does not exist.
+        """
+        if uuid is None:
+            if project is None:
+                return self._db[dto].pop(name)
+            obj = self._db[dto].pop((project, name))
+            self._unindex(project, dto, name)
+            return obj
+
+        versions = self._db[dto][(project, name)]
+        if uuid == "latest":
+            uuid = self._latest[(project, dto, name)]
+        obj = versions.pop(uuid)
+        if not versions:
+            del self._db[dto][(project, name)]
+            self._unindex(project, dto, name)
+        elif self._latest.get((project, dto, name)) == uuid:
+            self._latest[(project, dto, name)] = next(reversed(versions))
+        return obj
+
+    def _list_latest(self, project: str, dto: str) -> Iterator[dict]:
+        """
+        Get the latest version of the objects of a project.
+
+        Parameters
+        ----------
+        project : str
+            The project name.
+        dto : str
+            The DTO name.
+
+        Returns
+        -------
+        Iterator[dict]
+            The objects.
+        """
+        # Copy the names, the store can change while iterating
+        for name in list(self._index.get((project, dto), {})):
+            uuid = self._latest.get((project, dto, name))
+            obj = self._db.get(dto, {}).get((project, name), {}).get(uuid)
+            if obj is not None:
+                yield obj
+
+    def _list_dtos(self) -> list[str]:
+        """
+        Get the stored DTO names.
+
+        Returns
+        -------
+        list[str]
+            The DTO names.
+        """
+        return list(self._db)
+
+    def _unindex(self, project: str, dto: str, name: str) -> None:
+        """
+        Remove an object name from the indexes.
+
+        Parameters
+        ----------
+        project : str
+            The project name.
+        dto : str
+            The DTO name.
+        name : str
+            The object name.
+
+        Returns
+        -------
+        None
+        """
+        self._latest.pop((project, dto, name), None)
+        self._index.get((project, dto), {}).pop(name, None)
 
     ########################
     # Utils
     ########################
 
+    @staticmethod
+    def _get_attribute(obj: dict, key: str) -> str | None:
+        """
+        Get an attribute of an object, looking in the object, then
+        in its metadata and status.
+
+        Parameters
+        ----------
+        obj : dict
+            The object.
+        key : str
+            The attribute name.
+
+        Returns
+        -------
+        str | None
+            The attribute value.
+        """
+        for section in (obj, obj.get("metadata") or {}, obj.get("status") or {}):
+            if key in section:
+                return section[key]
+        return None
+
     @staticmethod
     def _format_msg(
         code: int,
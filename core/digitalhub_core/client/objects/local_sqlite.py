@@ -0,0 +1,304 @@
+"""
+Local SQLite Client module.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from digitalhub_core.client.objects.local import ClientLocal
+
+# Uuid and project stored for unversioned objects
+NO_VERSION = ""
+NO_PROJECT = ""
+
+# Version of the schema, stored as the database user_version
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    dto TEXT NOT NULL,
+    project TEXT NOT NULL,
+    name TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    obj TEXT NOT NULL,
+    UNIQUE (dto, project, name, uuid)
+);
+CREATE INDEX IF NOT EXISTS objects_project ON objects (project, dto, name);
+CREATE TABLE IF NOT EXISTS latest (
+    project TEXT NOT NULL,
+    dto TEXT NOT NULL,
+    name TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    PRIMARY KEY (project, dto, name)
+);
+"""
+
+
+class ClientLocalSQLite(ClientLocal):
+    """
+    Local client persisted on SQLite.
+
+    The client behaves like the Local client, but objects are stored in a
+    SQLite database file, so they survive the end of the session and can
+    be shared between threads and processes running on the same node.
+    The database runs in WAL mode, so readers do not block the writer,
+    and each write is a transaction. Every thread uses its own connection.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the database file. It is created if it does not exist.
+        timeout : float
+            Seconds to wait for a lock held by another connection.
+        """
+        # Objects are deserialized at each read, so they are never shared
+        super().__init__(copy_on_read=False)
+        self.path = Path(path)
+        self.timeout = timeout
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """
+        Close the connection of the current thread.
+
+        Returns
+        -------
+        None
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    ########################
+    # Storage
+    ########################
+
+    def _insert(self, dto: str, name: str, obj: dict, project: str | None = None, uuid: str | None = None) -> None:
+        """
+        Store a new object. Versioned objects (with project and uuid)
+        become the latest version of their name. Unversioned objects
+        are never replaced, so concurrent creations of the same name
+        cannot both succeed.
+        """
+        with self._transaction() as conn:
+            if project is None:
+                try:
+                    conn.execute(
+                        "INSERT INTO objects (dto, project, name, uuid, obj) VALUES (?, ?, ?, ?, ?)",
+                        (dto, NO_PROJECT, name, NO_VERSION, self._dump(obj)),
+                    )
+                except sqlite3.IntegrityError as e:
+                    raise ValueError(name) from e
+                return
+
+            conn.execute(
+                "INSERT INTO objects (dto, project, name, uuid, obj) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (dto, project, name, uuid) DO UPDATE SET obj = excluded.obj",
+                (dto, project, name, uuid, self._dump(obj)),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO latest (project, dto, name, uuid) VALUES (?, ?, ?, ?)",
+                (project, dto, name, uuid),
+            )
+
+    def _get(self, dto: str, name: str, uuid: str | None = None, project: str | None = None) -> dict:
+        """
+        Get a stored object.
+        """
+        project = project or NO_PROJECT
+        query = "SELECT obj FROM objects WHERE dto = ? AND project = ? AND name = ? AND uuid = ?"
+        row = self._connect().execute(query, (dto, project, name, self._resolve(dto, name, uuid, project))).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return json.loads(row[0])
+
+    def _update(
+        self,
+        dto: str,
+        name: str,
+        obj: dict,
+        uuid: str | None = None,
+        project: str | None = None,
+    ) -> None:
+        """
+        Replace a stored object.
+        """
+        project = project or NO_PROJECT
+        with self._transaction() as conn:
+            if uuid is None:
+                cursor = conn.execute(
+                    "UPDATE objects SET obj = ? WHERE dto = ? AND project = ? AND name = ? AND uuid = ?",
+                    (self._dump(obj), dto, project, name, NO_VERSION),
+                )
+                if cursor.rowcount == 0:
+                    raise KeyError(name)
+                return
+
+            # As in memory, an unknown version of an existing name is added
+            row = conn.execute(
+                "SELECT 1 FROM objects WHERE dto = ? AND project = ? AND name = ? LIMIT 1",
+                (dto, project, name),
+            ).fetchone()
+            if row is None:
+                raise KeyError(name)
+            conn.execute(
+                "INSERT INTO objects (dto, project, name, uuid, obj) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (dto, project, name, uuid) DO UPDATE SET obj = excluded.obj",
+                (dto, project, name, self._resolve(dto, name, uuid, project, conn), self._dump(obj)),
+            )
+
+    def _remove(self, dto: str, name: str, project: str | None = None, uuid: str | None = None) -> dict:
+        """
+        Remove a stored object. Without uuid, every version of the
+        name is removed. If the latest version is removed, latest points
+        to the last created remaining version.
+        """
+        key = (dto, project or NO_PROJECT, name)
+        with self._transaction() as conn:
+            if uuid is None:
+                rows = conn.execute(
+                    "SELECT uuid, obj FROM objects WHERE dto = ? AND project = ? AND name = ? ORDER BY seq",
+                    key,
+                ).fetchall()
+                if not rows:
+                    raise KeyError(name)
+                conn.execute("DELETE FROM objects WHERE dto = ? AND project = ? AND name = ?", key)
+                conn.execute("DELETE FROM latest WHERE dto = ? AND project = ? AND name = ?", key)
+                if project is None:
+                    return json.loads(rows[0][1])
+                return {uuid: json.loads(obj) for uuid, obj in rows}
+
+            uuid = self._resolve(dto, name, uuid, project, conn)
+            row = conn.execute(
+                "SELECT obj FROM objects WHERE dto = ? AND project = ? AND name = ? AND uuid = ?",
+                (*key, uuid),
+            ).fetchone()
+            if row is None:
+                raise KeyError(name)
+            conn.execute("DELETE FROM objects WHERE dto = ? AND project = ? AND name = ? AND uuid = ?", (*key, uuid))
+
+            # Point latest to the last created remaining version
+            last = conn.execute(
+                "SELECT uuid FROM objects WHERE dto = ? AND project = ? AND name = ? ORDER BY seq DESC LIMIT 1",
+                key,
+            ).fetchone()
+            if last is None:
+                conn.execute("DELETE FROM latest WHERE dto = ? AND project = ? AND name = ?", key)
+            else:
+                conn.execute(
+                    "UPDATE latest SET uuid = ? WHERE dto = ? AND project = ? AND name = ? AND uuid = ?",
+                    (last[0], *key, uuid),
+                )
+            return json.loads(row[0])
+
+    def _list_latest(self, project: str, dto: str) -> Iterator[dict]:
+        """
+        Get the latest version of the objects of a project.
+        """
+        cursor = self._connect().execute(
+            "SELECT o.obj FROM latest l JOIN objects o "
+            "ON o.dto = l.dto AND o.project = l.project AND o.name = l.name AND o.uuid = l.uuid "
+            "WHERE l.project = ? AND l.dto = ? ORDER BY o.seq",
+            (project, dto),
+        )
+        for row in cursor:
+            yield json.loads(row[0])
+
+    def _list_dtos(self) -> list[str]:
+        """
+        Get the stored DTO names.
+        """
+        return [row[0] for row in self._connect().execute("SELECT DISTINCT dto FROM objects")]
+
+    ########################
+    # Helpers
+    ########################
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the connection of the current thread, opening it if needed.
+
+        Returns
+        -------
+        sqlite3.Connection
+            The connection.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run statements in a write transaction. The write lock is taken
+        at the beginning, so reads made in the transaction are consistent
+        with the writes.
+
+        Returns
+        -------
+        Iterator[sqlite3.Connection]
+            The connection.
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _resolve(
+        self,
+        dto: str,
+        name: str,
+        uuid: str | None,
+        project: str | None = None,
+        conn: sqlite3.Connection | None = None,
+    ) -> str:
+        """
+        Get the uuid an object is stored with, resolving "latest".
+
+        Raises
+        ------
+        KeyError
+            If the latest version of the object does not exist.
+        """
+        if uuid is None:
+            return NO_VERSION
+        if uuid != "latest":
+            return uuid
+        conn = conn or self._connect()
+        query = "SELECT uuid FROM latest WHERE project = ? AND dto = ? AND name = ?"
+        row = conn.execute(query, (project or NO_PROJECT, dto, name)).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return row[0]
+
+    @staticmethod
+    def _dump(obj: dict) -> str:
+        """
+        Serialize an object to JSON.
+        """
+        return json.dumps(obj, default=str)
@@ -0,0 +1,225 @@
+"""
+Read cache module.
+"""
+from __future__ import annotations
+
+import copy
+import threading
+import typing
+from collections import OrderedDict
+
+from digitalhub_core.utils.api import API_CONTEXT
+
+if typing.TYPE_CHECKING:
+    from digitalhub_core.client.objects.dhcore import ClientDHCore
+
+# Entities whose versions never change once created
+VERSIONED_DTOS = frozenset(["artifacts", "dataitems", "models", "functions", "workflows"])
+
+# Default maximum number of cached objects
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class CacheEntry:
+    """
+    Cache entry class.
+    """
+
+    __slots__ = ("obj", "etag", "immutable")
+
+    def __init__(self, obj: dict, etag: str | None, immutable: bool) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        obj : dict
+            Cached object.
+        etag : str
+            ETag of the object, used to revalidate the entry.
+        immutable : bool
+            Whether the object never changes on the backend.
+        """
+        self.obj = obj
+        self.etag = etag
+        self.immutable = immutable
+
+
+class ReadCache:
+    """
+    Read cache class.
+
+    The read cache keeps the objects read by a context in memory. Reads of
+    a specific version of an entity (name and uuid) and of tasks by id are
+    considered immutable and are served from the cache without contacting
+    the backend. Other reads (e.g. "latest" versions or runs) are cached
+    only if the backend returns an ETag and are revalidated at each read
+    with a conditional request. Writes made through the context invalidate
+    the entries of the written entity.
+    Objects are copied when returned, so callers can modify them freely.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        max_entries : int
+            Maximum number of cached objects. Least recently used entries
+            are evicted first.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    ############################
+    # Public methods
+    ############################
+
+    def read(self, api: str, client: ClientDHCore) -> dict:
+        """
+        Read an object through the cache.
+
+        Parameters
+        ----------
+        api : str
+            The api to get the object with.
+        client : ClientDHCore
+            Client used on cache misses and revalidations.
+
+        Returns
+        -------
+        dict
+            The read object.
+        """
+        entry = self._get(api)
+        if entry is not None and entry.immutable:
+            self._count("hits")
+            return copy.deepcopy(entry.obj)
+
+        obj, etag = client.read_object_conditional(api, entry.etag if entry is not None else None)
+        if obj is None:
+            self._count("hits")
+            self._count("revalidations")
+            return copy.deepcopy(entry.obj)
+
+        self._count("misses")
+        immutable = self._is_immutable(api)
+        if immutable or etag is not None:
+            self._put(api, CacheEntry(copy.deepcopy(obj), etag, immutable))
+        return obj
+
+    def invalidate(self, api: str, keep_immutable: bool = False) -> None:
+        """
+        Drop the cached objects under an api path. The query string of
+        the api is ignored.
+
+        Parameters
+        ----------
+        api : str
+            The api of the entity (or of the entity collection) to drop.
+        keep_immutable : bool
+            If True, drop only the entries that must be revalidated.
+
+        Returns
+        -------
+        None
+        """
+        prefix = self._entity_path(api)
+        with self._lock:
+            for key in list(self._entries):
+                if key != prefix and not key.startswith(prefix + "/"):
+                    continue
+                if keep_immutable and self._entries[key].immutable:
+                    continue
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Drop every cached object and reset the counters.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.revalidations = 0
+
+    def info(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns
+        -------
+        dict
+            Hits (including revalidated reads), misses, revalidations and
+            number of cached objects.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "size": len(self._entries),
+            }
+
+    ############################
+    # Private helpers
+    ############################
+
+    def _get(self, api: str) -> CacheEntry | None:
+        """
+        Get an entry and mark it as recently used.
+        """
+        with self._lock:
+            entry = self._entries.get(api)
+            if entry is not None:
+                self._entries.move_to_end(api)
+            return entry
+
+    def _put(self, api: str, entry: CacheEntry) -> None:
+        """
+        Store an entry, evicting the least recently used ones.
+        """
+        with self._lock:
+            self._entries[api] = entry
+            self._entries.move_to_end(api)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _count(self, counter: str) -> None:
+        """
+        Increment a counter.
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def _entity_path(api: str) -> str:
+        """
+        Get the api path without query string and, for context apis,
+        truncated after the entity name (i.e. <project>/<dto>/<name>).
+        """
+        path = api.split("?")[0].rstrip("/")
+        if not path.startswith(f"{API_CONTEXT}/"):
+            return path
+        parts = path[len(API_CONTEXT) + 1 :].split("/")
+        return "/".join([API_CONTEXT, *parts[:3]])
+
+    @staticmethod
+    def _is_immutable(api: str) -> bool:
+        """
+        Check if an api reads an object that never changes, i.e. a
+        specific version of a versioned entity or a task by id.
+        """
+        if "?" in api or not api.startswith(f"{API_CONTEXT}/"):
+            return False
+        parts = api[len(API_CONTEXT) + 1 :].split("/")
+        if len(parts) == 4:
+            return parts[1] in VERSIONED_DTOS and parts[3] != "latest"
+        return len(parts) == 3 and parts[1] == "tasks"
@@ -3,11 +3,21 @@ Context module.
 """
 from __future__ import annotations
 
+import os
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from digitalhub_core.client.builder import get_async_client
+from digitalhub_core.client.objects.base import DEFAULT_PAGE_SIZE
+from digitalhub_core.context.cache import DEFAULT_MAX_ENTRIES, ReadCache
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.projects.entity import Project
 
+# Default number of concurrent reads in a batch
+MAX_WORKERS = 10
+
 
 class Context:
     """
@@ -15,7 +25,10 @@ class Context:
 
     It contains the project name, client and information about the type of client.
     It exposes CRUD operations for the entities and act as a layer between the
-    project object and the client.
+    project object and the client. Async variants of the CRUD operations use
+    the async DHCore client for remote projects.
+    Reads of remote projects go through a read cache, sized with the
+    DIGITALHUB_CORE_READ_CACHE_SIZE environment variable (0 disables it).
     The context is created by the context builder.
     """
 
@@ -31,6 +44,7 @@ class Context:
         self.name = project.name
         self.client = project._client
         self.local = project._client.is_local()
+        self.cache = self._build_cache()
 
     def create_object(self, obj: dict, api: str) -> dict:
         """
@@ -48,7 +62,9 @@ class Context:
         dict
             The created object.
         """
-        return self.client.create_object(obj, api)
+        obj = self.client.create_object(obj, api)
+        self._invalidate(api, keep_immutable=True)
+        return obj
 
     def read_object(self, api: str) -> dict:
         """
@@ -64,8 +80,57 @@ class Context:
         dict
             The read object.
         """
+        if self.cache is not None:
+            return self.cache.read(api, self.client)
         return self.client.read_object(api)
 
+    def read_objects(self, apis: list[str], max_workers: int | None = None) -> list[dict]:
+        """
+        Get many objects. Duplicated apis are read once and remote reads
+        are made concurrently on a bounded thread pool.
+
+        Parameters
+        ----------
+        apis : list[str]
+            The apis to get the objects with.
+        max_workers : int
+            Maximum number of concurrent reads. Defaults to MAX_WORKERS.
+
+        Returns
+        -------
+        list[dict]
+            The read objects, in the same order as the apis.
+        """
+        unique = list(dict.fromkeys(apis))
+        if self.local or len(unique) < 2:
+            objs = [self.read_object(api) for api in unique]
+        else:
+            workers = min(max_workers or MAX_WORKERS, len(unique))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                objs = list(executor.map(self.read_object, unique))
+        read = dict(zip(unique, objs))
+        return [read[api] for api in apis]
+
+    def list_objects(self, api: str, filters: dict | None = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[dict]:
+        """
+        List objects, fetching pages lazily.
+
+        Parameters
+        ----------
+        api : str
+            The api to list the objects with.
+        filters : dict
+            Filters on the objects (e.g. kind, state).
+        page_size : int
+            Number of objects fetched per page.
+
+        Returns
+        -------
+        Iterator[dict]
+            The objects.
+        """
+        return self.client.list_objects(api, filters=filters, page_size=page_size)
+
     def update_object(self, obj: dict, api: str) -> dict:
         """
         Update an object.
@@ -82,7 +147,9 @@ class Context:
         dict
             The updated object.
         """
-        return self.client.update_object(obj, api)
+        obj = self.client.update_object(obj, api)
+        self._invalidate(api)
+        return obj
 
     def delete_object(self, api: str) -> dict:
         """
@@ -98,4 +165,99 @@ class Context:
         dict
             The deleted object.
         """
-        return self.client.delete_object(api)
+        resp = self.client.delete_object(api)
+        self._invalidate(api)
+        return resp
+
+    async def create_object_async(self, obj: dict, api: str) -> dict:
+        """
+        Create an object asynchronously.
+
+        See Also
+        --------
+        create_object
+        """
+        if self.local:
+            return self.client.create_object(obj, api)
+        obj = await get_async_client().create_object(obj, api)
+        self._invalidate(api, keep_immutable=True)
+        return obj
+
+    async def read_object_async(self, api: str) -> dict:
+        """
+        Get an object asynchronously.
+
+        See Also
+        --------
+        read_object
+        """
+        if self.local:
+            return self.client.read_object(api)
+        return await get_async_client().read_object(api)
+
+    async def update_object_async(self, obj: dict, api: str) -> dict:
+        """
+        Update an object asynchronously.
+
+        See Also
+        --------
+        update_object
+        """
+        if self.local:
+            return self.client.update_object(obj, api)
+        obj = await get_async_client().update_object(obj, api)
+        self._invalidate(api)
+        return obj
+
+    async def delete_object_async(self, api: str) -> dict:
+        """
+        Delete an object asynchronously.
+
+        See Also
+        --------
+        delete_object
+        """
+        if self.local:
+            return self.client.delete_object(api)
+        resp = await get_async_client().delete_object(api)
+        self._invalidate(api)
+        return resp
+
+    ############################
+    # Read cache
+    ############################
+
+    def _build_cache(self) -> ReadCache | None:
+        """
+        Build the read cache. Local projects are kept in memory by the
+        client, so they are not cached.
+
+        Returns
+        -------
+        ReadCache | None
+            The read cache, or None if disabled.
+        """
+        if self.local:
+            return None
+        max_entries = int(os.getenv("DIGITALHUB_CORE_READ_CACHE_SIZE", DEFAULT_MAX_ENTRIES))
+        if max_entries <= 0:
+            return None
+        return ReadCache(max_entries)
+
+    def _invalidate(self, api: str, keep_immutable: bool = False) -> None:
+        """
+        Drop the cached objects of the entity written through an api.
+
+        Parameters
+        ----------
+        api : str
+            The api used to write the entity.
+        keep_immutable : bool
+            If True, drop only the entries that must be revalidated.
+
+        Returns
+        -------
+        None
+        """
+        if self.cache is not None:
+            self.cache.invalidate(api, keep_immutable=keep_immutable)
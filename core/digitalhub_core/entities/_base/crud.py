@@ -0,0 +1,59 @@
+"""
+Shared entity operations module.
+"""
+from __future__ import annotations
+
+import typing
+from typing import Callable
+
+from digitalhub_core.context.builder import get_context
+from digitalhub_core.utils.api import api_ctx_read
+from digitalhub_core.utils.generic_utils import parse_entity_key
+
+if typing.TYPE_CHECKING:
+    from digitalhub_core.entities._base.entity import Entity
+
+
+def get_entities_from_keys(
+    keys: list[str],
+    entity_type: str,
+    from_dict: Callable[..., Entity],
+    max_workers: int | None = None,
+    lazy: bool = False,
+) -> list[Entity]:
+    """
+    Get many entities from keys. Duplicated keys are read once and
+    the entities of each project are read concurrently.
+
+    Parameters
+    ----------
+    keys : list[str]
+        Keys of the entities.
+        Their format is store://<project>/<entity_type>/<kind>/<name>:<uuid>.
+    entity_type : str
+        Type of the entities (e.g. artifacts, dataitems).
+    from_dict : Callable[..., Entity]
+        Function building an entity from its dictionary, accepting
+        the lazy keyword argument.
+    max_workers : int
+        Maximum number of concurrent reads.
+    lazy : bool
+        If True, the entity specs are built when first accessed.
+
+    Returns
+    -------
+    list[Entity]
+        Object instances, in the same order as the keys.
+    """
+    # Group keys by project, mapping each key to its read api
+    apis: dict[str, dict[str, str]] = {}
+    for key in dict.fromkeys(keys):
+        project, name, uuid = parse_entity_key(key)
+        apis.setdefault(project, {})[key] = api_ctx_read(project, entity_type, name, uuid=uuid)
+
+    entities = {}
+    for project, project_apis in apis.items():
+        objs = get_context(project).read_objects(list(project_apis.values()), max_workers=max_workers)
+        for key, obj in zip(project_apis, objs):
+            entities[key] = from_dict(obj, lazy=lazy)
+    return [entities[key] for key in keys]
@@ -3,9 +3,11 @@ Abstract entity module.
 """
 from __future__ import annotations
 
+import typing
 from abc import ABCMeta, abstractmethod
 
 from digitalhub_core.entities._base.base import ModelObj
+from digitalhub_core.entities._builders.spec import deferred_specs
 
 
 class Entity(ModelObj, metaclass=ABCMeta):
@@ -51,6 +53,7 @@ class Entity(ModelObj, metaclass=ABCMeta):
         dict
             A dictionary containing the attributes of the entity instance.
         """
+        self._load_spec()
         dict_ = super().to_dict()
         if include_all_non_private:
             return dict_
@@ -61,6 +64,7 @@ class Entity(ModelObj, metaclass=ABCMeta):
         cls,
         obj: dict,
         validate: bool = True,
+        lazy: bool = False,
     ) -> "Entity":
         """
         Create object instance from a dictionary.
@@ -71,17 +75,50 @@ class Entity(ModelObj, metaclass=ABCMeta):
             Dictionary to create object from.
         validate : bool
             Flag to indicate if arguments validation against a pydantic schema must be ignored.
+        lazy : bool
+            If True, the spec is built when first accessed. Useful when
+            reading many entities of which only a few specs are used.
+            Errors in the spec are raised at first access.
 
         Returns
         -------
         Self
             Self instance.
         """
-        parsed_dict = cls._parse_dict(
-            obj,
-            validate=validate,
-        )
-        return cls(**parsed_dict)
+        if not lazy:
+            return cls(**cls._parse_dict(obj, validate=validate))
+
+        with deferred_specs():
+            parsed_dict = cls._parse_dict(obj, validate=validate)
+        entity = cls(**parsed_dict)
+        entity._deferred_spec = entity.__dict__.pop("spec")
+        return entity
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """
+        Build the deferred spec of lazy entities at first access.
+        """
+        if name == "spec":
+            self._load_spec()
+            if "spec" in self.__dict__:
+                return self.__dict__["spec"]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _load_spec(self) -> None:
+        """
+        Build the deferred spec, if any.
+
+        Returns
+        -------
+        None
+        """
+        deferred = self.__dict__.get("_deferred_spec")
+        if deferred is None:
+            return
+        # A spec set after the entity creation replaces the deferred one
+        if "spec" not in self.__dict__:
+            self.__dict__["spec"] = deferred.load()
+        del self.__dict__["_deferred_spec"]
 
     @staticmethod
     @abstractmethod
@@ -4,6 +4,10 @@ Spec factory entity.
 from __future__ import annotations
 
 import typing
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator
 
 from digitalhub_core.utils.import_utils import (
     check_layer_existence,
@@ -15,6 +19,73 @@ from digitalhub_core.utils.import_utils import (
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities._base.spec import Spec, SpecParams
 
+# Whether build_spec must defer the build of specs
+_DEFERRED = ContextVar("deferred_specs", default=False)
+
+
+class DeferredSpec:
+    """
+    Arguments of a spec whose build has been deferred.
+    """
+
+    __slots__ = ("kind", "layer_digitalhub", "framework_runtime", "validate", "kwargs")
+
+    def __init__(
+        self,
+        kind: str,
+        layer_digitalhub: str | None,
+        framework_runtime: str | None,
+        validate: bool,
+        kwargs: dict,
+    ) -> None:
+        """
+        Constructor.
+
+        See Also
+        --------
+        build_spec
+        """
+        self.kind = kind
+        self.layer_digitalhub = layer_digitalhub
+        self.framework_runtime = framework_runtime
+        self.validate = validate
+        self.kwargs = kwargs
+
+    def load(self) -> Spec:
+        """
+        Build the spec object.
+
+        Returns
+        -------
+        Spec
+            Spec object.
+        """
+        return _build_spec(
+            self.kind,
+            self.layer_digitalhub,
+            self.framework_runtime,
+            self.validate,
+            **self.kwargs,
+        )
+
+
+@contextmanager
+def deferred_specs() -> Iterator[None]:
+    """
+    Defer the build of the specs requested with build_spec in the
+    context, which return DeferredSpec objects instead.
+
+    Returns
+    -------
+    Iterator[None]
+        Context.
+    """
+    token = _DEFERRED.set(True)
+    try:
+        yield
+    finally:
+        _DEFERRED.reset(token)
+
 
 def build_spec(
     kind: str,
@@ -42,7 +113,62 @@ def build_spec(
     Returns
     -------
     Spec
-        Spec object.
+        Spec object, or DeferredSpec object in a deferred_specs context.
+    """
+    if _DEFERRED.get():
+        return DeferredSpec(kind, layer_digitalhub, framework_runtime, validate, kwargs)
+    return _build_spec(kind, layer_digitalhub, framework_runtime, validate, **kwargs)
+
+
+def _build_spec(
+    kind: str,
+    layer_digitalhub: str | None = None,
+    framework_runtime: str | None = None,
+    validate: bool = True,
+    **kwargs,
+) -> Spec:
+    """
+    Build entity spec object.
+
+    See Also
+    --------
+    build_spec
+    """
+    class_spec, class_params = resolve_spec_classes(kind, layer_digitalhub, framework_runtime)
+
+    # Validate arguments
+    if validate:
+        kwargs = class_params(**kwargs).dict()
+
+    return class_spec(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def resolve_spec_classes(
+    kind: str,
+    layer_digitalhub: str | None = None,
+    framework_runtime: str | None = None,
+) -> tuple[Spec, SpecParams]:
+    """
+    Resolve spec and params classes of a kind. Resolution looks up the
+    installed distributions, the registry and the classes, so results are
+    cached by kind, layer and framework. Failed resolutions are not cached.
+    Use clear_spec_cache to drop the cache (e.g. after installing a new
+    runtime).
+
+    Parameters
+    ----------
+    kind : str
+        The type of spec to resolve.
+    layer_digitalhub : str
+        Layer name (e.g. "digitalhub_core") where the spec is defined.
+    framework_runtime : str
+        Framework name (e.g. "mlrun", "nefertem") where the spec is defined.
+
+    Returns
+    -------
+    tuple
+        Spec class and params class.
     """
     # Raise error if both layer and framework are not provided or if both are provided.
     # This is because we need some information where to search for the spec class.
@@ -61,13 +187,18 @@ def build_spec(
     registry = import_registry(module_to_import, "spec_registry")
 
     # Import classes
-    class_spec, class_params = import_classes(registry, kind)
+    return import_classes(registry, kind)
 
-    # Validate arguments
-    if validate:
-        kwargs = class_params(**kwargs).dict()
 
-    return class_spec(**kwargs)
+def clear_spec_cache() -> None:
+    """
+    Clear the cache of resolved spec classes.
+
+    Returns
+    -------
+    None
+    """
+    resolve_spec_classes.cache_clear()
 
 
 def import_classes(registry: dict[str, dict[str, str]], kind: str) -> tuple[Spec, SpecParams]:
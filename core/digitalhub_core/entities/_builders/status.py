@@ -4,6 +4,7 @@ Status factory module.
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 
 from digitalhub_core.entities._base.status import State
 from digitalhub_core.utils.import_utils import (
@@ -42,6 +43,36 @@ def build_status(
     Status
         Status object.
     """
+    class_status = resolve_status_class(kind, layer_digitalhub, framework_runtime)
+    kwargs = parse_arguments(**kwargs)
+    return class_status(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def resolve_status_class(
+    kind: str,
+    layer_digitalhub: str | None = None,
+    framework_runtime: str | None = None,
+) -> Status:
+    """
+    Resolve the status class of a kind. Results are cached by kind,
+    layer and framework, failed resolutions are not cached.
+    Use clear_status_cache to drop the cache.
+
+    Parameters
+    ----------
+    kind : str
+        The type of status to resolve.
+    layer_digitalhub : str
+        Layer name (e.g. "digitalhub_core") where the status is defined.
+    framework_runtime : str
+        Framework name (e.g. "mlrun", "nefertem") where the status is defined.
+
+    Returns
+    -------
+    Status
+        Status class.
+    """
     # Raise error if both layer and framework are not provided or if both are provided.
     # This is because we need some information where to search for the status class.
     if (layer_digitalhub is None) == (framework_runtime is None):
@@ -57,10 +88,18 @@ def build_status(
     # Note that this requires the creation of a registry whenever a new status entity is created.
     module_to_import = f"{layer_digitalhub}.entities.registries"
     registry = import_registry(module_to_import, "status_registry")
-    class_status = _import_class(registry, kind)
+    return _import_class(registry, kind)
 
-    kwargs = parse_arguments(**kwargs)
-    return class_status(**kwargs)
+
+def clear_status_cache() -> None:
+    """
+    Clear the cache of resolved status classes.
+
+    Returns
+    -------
+    None
+    """
+    resolve_status_class.cache_clear()
 
 
 def parse_arguments(**kwargs) -> dict:
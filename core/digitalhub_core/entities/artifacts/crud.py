@@ -4,12 +4,15 @@ Artifact operations module.
 from __future__ import annotations
 
 import typing
+from typing import Iterator
 
+from digitalhub_core.client.objects.base import DEFAULT_PAGE_SIZE
 from digitalhub_core.context.builder import check_context, get_context
+from digitalhub_core.entities._base.crud import get_entities_from_keys
 from digitalhub_core.entities.artifacts.entity import artifact_from_dict, artifact_from_parameters
-from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read, api_ctx_update
+from digitalhub_core.utils.api import api_ctx_delete, api_ctx_list, api_ctx_read, api_ctx_update
 from digitalhub_core.utils.generic_utils import parse_entity_key
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.io_utils import read_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.artifacts.entity import Artifact
@@ -32,7 +35,7 @@ def create_artifact(**kwargs) -> Artifact:
     return artifact_from_parameters(**kwargs)
 
 
-def create_artifact_from_dict(obj: dict) -> Artifact:
+def create_artifact_from_dict(obj: dict, lazy: bool = False) -> Artifact:
     """
     Create a new Artifact instance from a dictionary.
 
@@ -40,6 +43,8 @@ def create_artifact_from_dict(obj: dict) -> Artifact:
     ----------
     obj : dict
         Dictionary to create the Artifact from.
+    lazy : bool
+        If True, the artifact spec is built when first accessed.
 
     Returns
     -------
@@ -47,7 +52,7 @@ def create_artifact_from_dict(obj: dict) -> Artifact:
         Artifact object.
     """
     check_context(obj.get("project"))
-    return artifact_from_dict(obj)
+    return artifact_from_dict(obj, lazy=lazy)
 
 
 def new_artifact(
@@ -140,6 +145,29 @@ def get_artifact(project: str, name: str, uuid: str | None = None) -> Artifact:
     return create_artifact_from_dict(obj)
 
 
+async def get_artifact_async(project: str, name: str, uuid: str | None = None) -> Artifact:
+    """
+    Asynchronously retrieve artifact details from the backend.
+
+    Parameters
+    ----------
+    project : str
+        Name of the project.
+    name : str
+        The name of the artifact.
+    uuid : str
+        UUID.
+
+    Returns
+    -------
+    Artifact
+        Object instance.
+    """
+    api = api_ctx_read(project, "artifacts", name, uuid=uuid)
+    obj = await get_context(project).read_object_async(api)
+    return create_artifact_from_dict(obj)
+
+
 def get_artifact_from_key(key: str) -> Artifact:
     """
     Get artifact from key.
@@ -154,6 +182,64 @@ def get_artifact_from_key(key: str) -> Artifact:
     return get_artifact(project, name, uuid)
 
 
+def get_artifacts_from_keys(
+    keys: list[str],
+    max_workers: int | None = None,
+    lazy: bool = False,
+) -> list[Artifact]:
+    """
+    Get many artifacts from keys. Duplicated keys are read once and
+    the artifacts of each project are read concurrently.
+
+    Parameters
+    ----------
+    keys : list[str]
+        Keys of the artifacts.
+        Their format is store://<project>/artifacts/<kind>/<name>:<uuid>.
+    max_workers : int
+        Maximum number of concurrent reads.
+    lazy : bool
+        If True, the artifact specs are built when first accessed.
+
+    Returns
+    -------
+    list[Artifact]
+        Object instances, in the same order as the keys.
+    """
+    return get_entities_from_keys(keys, "artifacts", create_artifact_from_dict, max_workers, lazy)
+
+
+def list_artifacts(
+    project: str,
+    filters: dict | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    lazy: bool = False,
+) -> Iterator[Artifact]:
+    """
+    List the artifacts of a project from the backend. Objects are
+    fetched page by page while iterating.
+
+    Parameters
+    ----------
+    project : str
+        Name of the project.
+    filters : dict
+        Filters on the artifacts (e.g. kind, state).
+    page_size : int
+        Number of artifacts fetched per page.
+    lazy : bool
+        If True, the artifact specs are built when first accessed.
+
+    Returns
+    -------
+    Iterator[Artifact]
+        Object instances.
+    """
+    api = api_ctx_list(project, "artifacts")
+    for obj in get_context(project).list_objects(api, filters=filters, page_size=page_size):
+        yield create_artifact_from_dict(obj, lazy=lazy)
+
+
 def import_artifact(file: str) -> Artifact:
     """
     Import an Artifact object from a file using the specified file path.
@@ -161,14 +247,14 @@ def import_artifact(file: str) -> Artifact:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Artifact
         Object instance.
     """
-    obj: dict = read_yaml(file)
+    obj: dict = read_file(file)
     return create_artifact_from_dict(obj)
 
 
@@ -18,7 +18,7 @@ from digitalhub_core.stores.builder import get_store
 from digitalhub_core.utils.api import api_ctx_create, api_ctx_update
 from digitalhub_core.utils.exceptions import EntityError
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 from digitalhub_core.utils.uri_utils import map_uri_scheme
 
 if typing.TYPE_CHECKING:
@@ -35,6 +35,9 @@ class Artifact(Entity):
     and component as files.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "project", "name", "id"]
+
     def __init__(
         self,
         project: str,
@@ -74,9 +77,6 @@ class Artifact(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.extend(["project", "name", "id"])
-
     #############################
     #  Save / Export
     #############################
@@ -112,7 +112,8 @@ class Artifact(Entity):
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export file, written as JSON if it has a .json suffix, as YAML otherwise.
+            If not specified, the default value is used.
 
         Returns
         -------
@@ -123,7 +124,7 @@ class Artifact(Entity):
             filename = f"{self.kind}_{self.name}_{self.id}.yml"
         pth = Path(self.project) / filename
         pth.parent.mkdir(parents=True, exist_ok=True)
-        write_yaml(pth, obj)
+        write_file(pth, obj)
 
     #############################
     #  Context
@@ -471,7 +472,7 @@ def artifact_from_parameters(
     )
 
 
-def artifact_from_dict(obj: dict) -> Artifact:
+def artifact_from_dict(obj: dict, lazy: bool = False) -> Artifact:
     """
     Create artifact from dictionary.
 
@@ -479,10 +480,12 @@ def artifact_from_dict(obj: dict) -> Artifact:
     ----------
     obj : dict
         Dictionary to create artifact from.
+    lazy : bool
+        If True, the artifact spec is built when first accessed.
 
     Returns
     -------
     Artifact
         Artifact object.
     """
-    return Artifact.from_dict(obj, validate=False)
+    return Artifact.from_dict(obj, validate=False, lazy=lazy)
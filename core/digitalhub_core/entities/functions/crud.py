@@ -8,7 +8,7 @@ import typing
 from digitalhub_core.context.builder import check_context, get_context
 from digitalhub_core.entities.functions.entity import function_from_dict, function_from_parameters
 from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read, api_ctx_update
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.io_utils import read_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.functions.entity import Function
@@ -31,7 +31,7 @@ def create_function(**kwargs) -> Function:
     return function_from_parameters(**kwargs)
 
 
-def create_function_from_dict(obj: dict) -> Function:
+def create_function_from_dict(obj: dict, lazy: bool = False) -> Function:
     """
     Create a new Function instance from a dictionary.
 
@@ -39,6 +39,8 @@ def create_function_from_dict(obj: dict) -> Function:
     ----------
     obj : dict
         Dictionary to create the Function from.
+    lazy : bool
+        If True, the function spec is built when first accessed.
 
     Returns
     -------
@@ -46,7 +48,7 @@ def create_function_from_dict(obj: dict) -> Function:
         Function object.
     """
     check_context(obj.get("project"))
-    return function_from_dict(obj)
+    return function_from_dict(obj, lazy=lazy)
 
 
 def new_function(
@@ -131,6 +133,29 @@ def get_function(project: str, name: str, uuid: str | None = None) -> Function:
     return create_function_from_dict(obj)
 
 
+async def get_function_async(project: str, name: str, uuid: str | None = None) -> Function:
+    """
+    Asynchronously retrieve function details from the backend.
+
+    Parameters
+    ----------
+    project : str
+        Name of the project.
+    name : str
+        The name of the function.
+    uuid : str
+        UUID.
+
+    Returns
+    -------
+    Function
+        Object instance.
+    """
+    api = api_ctx_read(project, "functions", name, uuid=uuid)
+    obj = await get_context(project).read_object_async(api)
+    return create_function_from_dict(obj)
+
+
 def import_function(file: str) -> Function:
     """
     Get object from file.
@@ -138,14 +163,14 @@ def import_function(file: str) -> Function:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Function
         Object instance.
     """
-    obj = read_yaml(file)
+    obj = read_file(file)
     if isinstance(obj, list):
         func_dict = obj[0]
         task_dicts = obj[1:]
@@ -4,7 +4,6 @@ Function module.
 from __future__ import annotations
 
 import typing
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from digitalhub_core.context.builder import get_context
@@ -14,11 +13,12 @@ from digitalhub_core.entities._builders.spec import build_spec
 from digitalhub_core.entities._builders.status import build_status
 from digitalhub_core.entities.functions.metadata import FunctionMetadata
 from digitalhub_core.entities.functions.status import FunctionStatus
+from digitalhub_core.entities.runs.futures import RunFuture, execute_run, submit_run
 from digitalhub_core.entities.tasks.crud import create_task, create_task_from_dict, delete_task, new_task
 from digitalhub_core.utils.api import api_ctx_create, api_ctx_update
 from digitalhub_core.utils.exceptions import BackendError, EntityError
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.context.context import Context
@@ -32,6 +32,9 @@ class Function(Entity):
     A class representing a function.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "project", "name", "id"]
+
     def __init__(
         self,
         project: str,
@@ -71,9 +74,6 @@ class Function(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.extend(["project", "name", "id"])
-
         # Initialize tasks
         self._tasks = {}
 
@@ -112,7 +112,8 @@ class Function(Entity):
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export file, written as JSON if it has a .json suffix, as YAML otherwise.
+            If not specified, the default value is used.
 
         Returns
         -------
@@ -129,7 +130,7 @@ class Function(Entity):
         if self._tasks:
             obj = [obj] + [v.to_dict() for _, v in self._tasks.items()]
 
-        write_yaml(pth, obj)
+        write_file(pth, obj)
 
     #############################
     #  Context
@@ -162,8 +163,9 @@ class Function(Entity):
         outputs: dict | None = None,
         parameters: dict | None = None,
         local_execution: bool = False,
+        wait: bool = True,
         **kwargs,
-    ) -> Run:
+    ) -> Run | RunFuture:
         """
         Run function.
 
@@ -189,13 +191,18 @@ class Function(Entity):
             Function parameters. Run parameter.
         local_execution : bool
             Flag to determine if object has local execution. Run parameter.
+        wait : bool
+            If False, return a RunFuture instead of waiting. Local executions
+            are queued on a shared executor and run one at a time, remote
+            runs are waited by polling the backend. If True, local executions
+            run in the calling thread.
         **kwargs
             Keyword arguments passed to Task builder.
 
         Returns
         -------
-        Run
-            Run instance.
+        Run | RunFuture
+            Run instance, or its future if wait is False.
         """
 
         # Create task if does not exists
@@ -218,13 +225,12 @@ class Function(Entity):
         if not local_execution:
             if self._context().local:
                 raise BackendError("Cannot run remote function with local backend.")
-            return run
+            return run if wait else RunFuture(run)
 
-        # If local execution, build and launch run
-        run.build()
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            result = executor.submit(run.run)
-        return result.result()
+        # If local execution, build and launch run, queued on the shared executor if not waited
+        if wait:
+            return execute_run(run)
+        return submit_run(run)
 
     def _get_function_string(self) -> str:
         """
@@ -518,7 +524,7 @@ def function_from_parameters(
     )
 
 
-def function_from_dict(obj: dict) -> Function:
+def function_from_dict(obj: dict, lazy: bool = False) -> Function:
     """
     Create function from dictionary.
 
@@ -526,10 +532,12 @@ def function_from_dict(obj: dict) -> Function:
     ----------
     obj : dict
         Dictionary to create function from.
+    lazy : bool
+        If True, the function spec is built when first accessed.
 
     Returns
     -------
     Function
         Function object.
     """
-    return Function.from_dict(obj, validate=False)
+    return Function.from_dict(obj, validate=False, lazy=lazy)
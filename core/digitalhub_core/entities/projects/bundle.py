@@ -0,0 +1,140 @@
+"""
+Project bundle module.
+
+A bundle is a gzipped tar archive holding a whole project: the project
+object, the objects of the project as JSON lines (one file per entity
+type) and an index describing the content.
+"""
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+import time
+from pathlib import Path
+
+from digitalhub_core.utils.exceptions import EntityError
+from digitalhub_core.utils.io_utils import read_file
+
+# Version of the bundle layout
+BUNDLE_FORMAT = 1
+
+# Archive members
+INDEX_FILE = "index.json"
+PROJECT_FILE = "project.json"
+
+
+def write_bundle(filepath: str | Path, project: dict, objects: dict[str, list[dict]]) -> None:
+    """
+    Write a project bundle.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path of the bundle.
+    project : dict
+        The project object.
+    objects : dict[str, list[dict]]
+        The objects of the project by entity type.
+
+    Returns
+    -------
+    None
+    """
+    index = {
+        "format": BUNDLE_FORMAT,
+        "project": project.get("name"),
+        "objects": {
+            entity_type: {"file": f"{entity_type}.jsonl", "count": len(objs)} for entity_type, objs in objects.items()
+        },
+    }
+    with tarfile.open(filepath, "w:gz", compresslevel=6) as tar:
+        _add_member(tar, INDEX_FILE, json.dumps(index))
+        _add_member(tar, PROJECT_FILE, _dump(project))
+        for entity_type, objs in objects.items():
+            _add_member(tar, index["objects"][entity_type]["file"], "\n".join(_dump(obj) for obj in objs))
+
+
+def read_bundle(filepath: str | Path) -> tuple[dict, dict[str, list[dict]]]:
+    """
+    Read a project bundle.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path of the bundle.
+
+    Returns
+    -------
+    tuple[dict, dict[str, list[dict]]]
+        The project object and the objects of the project by entity type.
+
+    Raises
+    ------
+    EntityError
+        If the bundle format is not supported.
+    """
+    with tarfile.open(filepath, "r:gz") as tar:
+        index = json.loads(_read_member(tar, INDEX_FILE))
+        if index.get("format") != BUNDLE_FORMAT:
+            raise EntityError(f"Unsupported project bundle format: {index.get('format')}.")
+        project = json.loads(_read_member(tar, PROJECT_FILE))
+        objects = {}
+        for entity_type, entry in index["objects"].items():
+            lines = _read_member(tar, entry["file"]).splitlines()
+            objects[entity_type] = [json.loads(line) for line in lines if line]
+    return project, objects
+
+
+def read_project_file(filepath: str | Path) -> dict:
+    """
+    Read a project from a YAML or JSON file or a bundle. Objects of a bundle
+    are set in the project specification, so they are available
+    without reading them from the backend.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path of the file.
+
+    Returns
+    -------
+    dict
+        The project object.
+    """
+    if not tarfile.is_tarfile(filepath):
+        return read_file(filepath)
+    project, objects = read_bundle(filepath)
+    spec = project.setdefault("spec", {})
+    for entity_type, objs in objects.items():
+        spec[entity_type] = objs
+    return project
+
+
+def _add_member(tar: tarfile.TarFile, name: str, content: str) -> None:
+    """
+    Add a text member to an archive.
+    """
+    data = content.encode("utf-8")
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _read_member(tar: tarfile.TarFile, name: str) -> str:
+    """
+    Read a text member of an archive.
+    """
+    try:
+        member = tar.extractfile(name)
+    except KeyError:
+        raise EntityError(f"Malformed project bundle, missing {name}.")
+    return member.read().decode("utf-8")
+
+
+def _dump(obj: dict) -> str:
+    """
+    Serialize an object to JSON.
+    """
+    return json.dumps(obj, default=str)
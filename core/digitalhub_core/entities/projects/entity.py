@@ -5,39 +5,39 @@ from __future__ import annotations
 
 import typing
 from pathlib import Path
+from typing import Iterator
 
 from digitalhub_core.client.builder import get_client
+from digitalhub_core.client.objects.base import DEFAULT_PAGE_SIZE
 from digitalhub_core.context.builder import set_context
 from digitalhub_core.entities._base.entity import Entity
 from digitalhub_core.entities._builders.metadata import build_metadata
 from digitalhub_core.entities._builders.spec import build_spec
 from digitalhub_core.entities._builders.status import build_status
-from digitalhub_core.entities.artifacts.crud import delete_artifact, get_artifact, new_artifact
+from digitalhub_core.entities.artifacts.crud import delete_artifact, get_artifact, list_artifacts, new_artifact
 from digitalhub_core.entities.functions.crud import delete_function, get_function, new_function
+from digitalhub_core.entities.projects.bundle import write_bundle
 from digitalhub_core.entities.projects.metadata import ProjectMetadata
+from digitalhub_core.entities.projects.objects import ProjectObjects
 from digitalhub_core.entities.projects.status import ProjectStatus
+from digitalhub_core.entities.runs.crud import list_runs
 from digitalhub_core.entities.secrets.crud import delete_secret, get_secret, new_secret
 from digitalhub_core.entities.workflows.crud import delete_workflow, get_workflow, new_workflow
 from digitalhub_core.utils.api import api_base_create, api_base_read, api_base_update
 from digitalhub_core.utils.exceptions import BackendError, EntityError
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.artifacts.entity import Artifact
     from digitalhub_core.entities.functions.entity import Function
     from digitalhub_core.entities.projects.spec import ProjectSpec
+    from digitalhub_core.entities.runs.entity import Run
     from digitalhub_core.entities.secrets.entity import Secret
     from digitalhub_core.entities.workflows.entity import Workflow
 
 
 CTX_ENTITIES = ["artifacts", "functions", "workflows", "secrets"]
-FUNC_MAP = {
-    "artifacts": get_artifact,
-    "functions": get_function,
-    "workflows": get_workflow,
-    "secrets": get_secret,
-}
 
 
 class Project(Entity):
@@ -45,6 +45,9 @@ class Project(Entity):
     A class representing a project.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "name"]
+
     def __init__(
         self,
         name: str,
@@ -79,9 +82,6 @@ class Project(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.append("name")
-
         # Set client
         self._client = get_client(local)
 
@@ -120,37 +120,48 @@ class Project(Entity):
         api = api_base_update("projects", self.id)
         return self._client.update_object(obj, api)
 
-    def export(self, filename: str | None = None) -> None:
+    def export(self, filename: str | None = None, bundle: bool = False, max_workers: int | None = None) -> None:
         """
         Export object as a YAML file. If the objects are not embedded, the objects are
-        exported as a YAML file.
+        exported as a YAML file. With bundle, the project and all its objects are
+        exported in a single archive (see import_project). Objects not embedded are
+        read concurrently from the backend.
 
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export YAML file (or bundle). If not specified, the default value is used.
+        bundle : bool
+            Whether to export the project as a bundle.
+        max_workers : int
+            Maximum number of concurrent reads.
 
         Returns
         -------
         None
         """
         # Try to refresh project if local client
-        if self._client.is_local():
-            obj = self._refresh().to_dict()
-        else:
-            obj = self.to_dict()
+        project = self._refresh() if self._client.is_local() else self
+        obj = project.to_dict()
 
         if filename is None:
-            filename = f"{self.kind}_{self.name}.yml"
+            filename = f"{self.kind}_{self.name}.tar.gz" if bundle else f"{self.kind}_{self.name}.yml"
         pth = Path(self.name) / filename
         pth.parent.mkdir(parents=True, exist_ok=True)
-        write_yaml(pth, obj)
+
+        if bundle:
+            objects = {
+                entity_type: [e.to_dict() for e in project._get_objects(entity_type).entities(max_workers)]
+                for entity_type in CTX_ENTITIES
+            }
+            write_bundle(pth, obj, objects)
+            return
+
+        write_file(pth, obj)
 
         # Export objects related to project if not embedded
         for entity_type in CTX_ENTITIES:
-            for entity in self._get_objects(entity_type):
-                name, version = entity["name"], entity["id"]
-                ctx_obj = FUNC_MAP[entity_type](self.name, name, uuid=version)
+            for ctx_obj in project._get_objects(entity_type).entities(max_workers):
                 if not ctx_obj.metadata.embedded:
                     ctx_obj.export()
 
@@ -166,6 +177,7 @@ class Project(Entity):
         try:
             api = api_base_read("projects", self.name)
             obj = self._client.read_object(api)
+            obj["local"] = self._client.is_local()
             return self.from_dict(obj, validate=False)
         except BackendError:
             return self
@@ -199,7 +211,7 @@ class Project(Entity):
             obj_representation.pop("spec")
 
         # Get list of objects related to project by entity type
-        attr = getattr(self.spec, entity_type, [])
+        attr = self._get_objects(entity_type)
 
         # If empty, append directly
         if not attr:
@@ -238,11 +250,10 @@ class Project(Entity):
         else:
             attr_name = "id"
             var = uuid
-        self._check_entity_type(entity_type)
-        spec_list = getattr(self.spec, entity_type, [])
-        setattr(self.spec, entity_type, [i for i in spec_list if i.get(attr_name) != var])
+        spec_list = self._get_objects(entity_type)
+        setattr(self.spec, entity_type, ProjectObjects(entity_type, [i for i in spec_list if i.get(attr_name) != var]))
 
-    def _get_objects(self, entity_type: str) -> list[dict]:
+    def _get_objects(self, entity_type: str) -> ProjectObjects:
         """
         Get entity type related to project.
 
@@ -253,11 +264,15 @@ class Project(Entity):
 
         Returns
         -------
-        list[dict]
+        ProjectObjects
             List of objects related to project.
         """
         self._check_entity_type(entity_type)
-        return getattr(self.spec, entity_type, [])
+        objects = getattr(self.spec, entity_type, None)
+        if not isinstance(objects, ProjectObjects):
+            objects = ProjectObjects(entity_type, objects)
+            setattr(self.spec, entity_type, objects)
+        return objects
 
     @staticmethod
     def _check_entity_type(entity_type: str) -> None:
@@ -362,6 +377,33 @@ class Project(Entity):
         """
         self._add_object(artifact, "artifacts")
 
+    def list_artifacts(
+        self,
+        filters: dict | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        lazy: bool = False,
+    ) -> Iterator[Artifact]:
+        """
+        List the artifacts of the project from backend. Artifacts are
+        fetched page by page while iterating and are not added to the
+        project spec.
+
+        Parameters
+        ----------
+        filters : dict
+            Filters on the artifacts (e.g. kind).
+        page_size : int
+            Number of artifacts fetched per page.
+        lazy : bool
+            If True, the artifact specs are built when first accessed.
+
+        Returns
+        -------
+        Iterator[Artifact]
+            Instances of Artifact class.
+        """
+        return list_artifacts(self.name, filters=filters, page_size=page_size, lazy=lazy)
+
     #############################
     #  Functions
     #############################
@@ -602,6 +644,36 @@ class Project(Entity):
         """
         self._add_object(secret, "secrets")
 
+    #############################
+    #  Runs
+    #############################
+
+    def list_runs(
+        self,
+        filters: dict | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        lazy: bool = False,
+    ) -> Iterator[Run]:
+        """
+        List the runs of the project from backend. Runs are fetched
+        page by page while iterating.
+
+        Parameters
+        ----------
+        filters : dict
+            Filters on the runs (e.g. kind, state).
+        page_size : int
+            Number of runs fetched per page.
+        lazy : bool
+            If True, the run specs are built when first accessed.
+
+        Returns
+        -------
+        Iterator[Run]
+            Instances of Run class.
+        """
+        return list_runs(self.name, filters=filters, page_size=page_size, lazy=lazy)
+
     #############################
     #  Static interface methods
     #############################
@@ -709,7 +781,7 @@ def project_from_parameters(
     )
 
 
-def project_from_dict(obj: dict) -> Project:
+def project_from_dict(obj: dict, lazy: bool = False) -> Project:
     """
     Create project from dictionary.
 
@@ -717,10 +789,12 @@ def project_from_dict(obj: dict) -> Project:
     ----------
     obj : dict
         Dictionary to create project from.
+    lazy : bool
+        If True, the project spec is built when first accessed.
 
     Returns
     -------
     Project
         Project object.
     """
-    return Project.from_dict(obj, validate=False)
+    return Project.from_dict(obj, validate=False, lazy=lazy)
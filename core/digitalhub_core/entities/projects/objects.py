@@ -0,0 +1,161 @@
+"""
+Project objects module.
+"""
+from __future__ import annotations
+
+import typing
+
+from digitalhub_core.context.builder import get_context
+from digitalhub_core.entities.artifacts.crud import create_artifact_from_dict
+from digitalhub_core.entities.functions.crud import create_function_from_dict
+from digitalhub_core.entities.secrets.crud import create_secret_from_dict
+from digitalhub_core.entities.workflows.crud import create_workflow_from_dict
+from digitalhub_core.utils.api import api_ctx_read
+from digitalhub_core.utils.exceptions import EntityError
+
+if typing.TYPE_CHECKING:
+    from digitalhub_core.entities._base.entity import Entity
+
+
+DICT_MAP = {
+    "artifacts": create_artifact_from_dict,
+    "functions": create_function_from_dict,
+    "workflows": create_workflow_from_dict,
+    "secrets": create_secret_from_dict,
+}
+
+
+class ProjectObjects(list):
+    """
+    Objects of a project of an entity type.
+
+    The list holds the objects as listed in the project specification,
+    i.e. dictionaries with the full object for embedded objects and
+    without spec otherwise. Entities are resolved on first access
+    with get: embedded objects are built from the list, the others
+    are read from the backend. Use prefetch to read all of them
+    concurrently beforehand.
+    """
+
+    def __init__(self, entity_type: str, objects: list[dict] | None = None) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        entity_type : str
+            Type of the objects (e.g. "artifacts").
+        objects : list[dict]
+            Objects listed in the project specification.
+        """
+        super().__init__(objects if objects is not None else [])
+        self.entity_type = entity_type
+
+        # Resolved entities by name and uuid
+        self._entities: dict[tuple[str, str], Entity] = {}
+
+    def get(self, name: str, uuid: str | None = None) -> Entity:
+        """
+        Get an object as entity, resolving it on first access.
+
+        Parameters
+        ----------
+        name : str
+            Name of the object.
+        uuid : str
+            Version of the object. If not provided, the version listed
+            in the project is returned.
+
+        Returns
+        -------
+        Entity
+            Object instance.
+
+        Raises
+        ------
+        EntityError
+            If the object is not listed in the project.
+        """
+        for obj in self:
+            if obj.get("name") == name and uuid in (None, obj.get("id")):
+                return self._resolve([obj])[0]
+        raise EntityError(f"Object '{name}' not found in project {self.entity_type}.")
+
+    def entities(self, max_workers: int | None = None, lazy: bool = False) -> list[Entity]:
+        """
+        Get all the objects as entities.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of concurrent reads.
+        lazy : bool
+            If True, the specs of the objects resolved now are built
+            when first accessed.
+
+        Returns
+        -------
+        list[Entity]
+            Object instances.
+        """
+        return self._resolve(list(self), max_workers, lazy)
+
+    def prefetch(self, max_workers: int | None = None, lazy: bool = False) -> None:
+        """
+        Resolve all the objects, reading the ones not embedded in the
+        project concurrently.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of concurrent reads.
+        lazy : bool
+            If True, the specs of the objects resolved now are built
+            when first accessed.
+
+        Returns
+        -------
+        None
+        """
+        self._resolve(list(self), max_workers, lazy)
+
+    def _resolve(self, objs: list[dict], max_workers: int | None = None, lazy: bool = False) -> list[Entity]:
+        """
+        Get objects as entities. Objects not resolved yet are built if
+        embedded, otherwise read from the backend with one batch read
+        per project.
+
+        Parameters
+        ----------
+        objs : list[dict]
+            Objects to resolve.
+        max_workers : int
+            Maximum number of concurrent reads.
+        lazy : bool
+            If True, the specs are built when first accessed.
+
+        Returns
+        -------
+        list[Entity]
+            Object instances, in the same order as objs.
+        """
+        from_dict = DICT_MAP[self.entity_type]
+        keys = [(obj.get("name"), obj.get("id")) for obj in objs]
+
+        # Read not embedded objects, grouped by project
+        apis: dict[str, dict[tuple[str, str], str]] = {}
+        for key, obj in zip(keys, objs):
+            if key in self._entities:
+                continue
+            if "spec" in obj:
+                self._entities[key] = from_dict(obj, lazy=lazy)
+                continue
+            project = obj["project"]
+            apis.setdefault(project, {})[key] = api_ctx_read(project, self.entity_type, key[0], uuid=key[1])
+
+        for project, project_apis in apis.items():
+            read = get_context(project).read_objects(list(project_apis.values()), max_workers=max_workers)
+            for key, obj in zip(project_apis, read):
+                self._entities[key] = from_dict(obj, lazy=lazy)
+
+        return [self._entities[key] for key in keys]
@@ -4,6 +4,7 @@ Project base specification module.
 from __future__ import annotations
 
 from digitalhub_core.entities._base.spec import Spec, SpecParams
+from digitalhub_core.entities.projects.objects import ProjectObjects
 
 
 class ProjectSpec(Spec):
@@ -34,12 +35,23 @@ class ProjectSpec(Spec):
             List of project's workflows.
         """
         self.context = context
-        self.functions = functions if functions is not None else []
-        self.artifacts = artifacts if artifacts is not None else []
-        self.workflows = workflows if workflows is not None else []
+        self.functions = ProjectObjects("functions", functions)
+        self.artifacts = ProjectObjects("artifacts", artifacts)
+        self.workflows = ProjectObjects("workflows", workflows)
 
         self._any_setter(**kwargs)
 
+    def to_dict(self) -> dict:
+        """
+        Return object as dict, with the project objects as lists.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the attributes of the entity instance.
+        """
+        return {k: list(v) if isinstance(v, ProjectObjects) else v for k, v in super().to_dict().items()}
+
 
 class ProjectParams(SpecParams):
     """
@@ -4,11 +4,13 @@ Module for performing operations on runs.
 from __future__ import annotations
 
 import typing
+from typing import Iterator
 
+from digitalhub_core.client.objects.base import DEFAULT_PAGE_SIZE
 from digitalhub_core.context.builder import check_context, get_context
 from digitalhub_core.entities.runs.entity import run_from_dict, run_from_parameters
-from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read_no_version, api_ctx_update_name_only
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.api import api_ctx_delete, api_ctx_list, api_ctx_read_no_version, api_ctx_update_name_only
+from digitalhub_core.utils.io_utils import read_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.runs.entity import Run
@@ -31,7 +33,7 @@ def create_run(**kwargs) -> Run:
     return run_from_parameters(**kwargs)
 
 
-def create_run_from_dict(obj: dict) -> Run:
+def create_run_from_dict(obj: dict, lazy: bool = False) -> Run:
     """
     Create a new Run instance from a dictionary.
 
@@ -39,6 +41,8 @@ def create_run_from_dict(obj: dict) -> Run:
     ----------
     obj : dict
         Dictionary to create the Run from.
+    lazy : bool
+        If True, the run spec is built when first accessed.
 
     Returns
     -------
@@ -46,7 +50,7 @@ def create_run_from_dict(obj: dict) -> Run:
         Run object.
     """
     check_context(obj.get("project"))
-    return run_from_dict(obj)
+    return run_from_dict(obj, lazy=lazy)
 
 
 def new_run(
@@ -139,6 +143,58 @@ def get_run(project: str, name: str) -> Run:
     return create_run_from_dict(obj)
 
 
+async def get_run_async(project: str, name: str) -> Run:
+    """
+    Asynchronously retrieve run details from the backend.
+
+    Parameters
+    ----------
+    project : str
+        Name of the project.
+    name : str
+        The name of the run.
+
+    Returns
+    -------
+    Run
+        Object instance.
+    """
+    api = api_ctx_read_no_version(project, "runs", name)
+    obj = await get_context(project).read_object_async(api)
+    return create_run_from_dict(obj)
+
+
+def list_runs(
+    project: str,
+    filters: dict | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    lazy: bool = False,
+) -> Iterator[Run]:
+    """
+    List the runs of a project from the backend. Objects are
+    fetched page by page while iterating.
+
+    Parameters
+    ----------
+    project : str
+        Name of the project.
+    filters : dict
+        Filters on the runs (e.g. kind, state).
+    page_size : int
+        Number of runs fetched per page.
+    lazy : bool
+        If True, the run specs are built when first accessed.
+
+    Returns
+    -------
+    Iterator[Run]
+        Object instances.
+    """
+    api = api_ctx_list(project, "runs")
+    for obj in get_context(project).list_objects(api, filters=filters, page_size=page_size):
+        yield create_run_from_dict(obj, lazy=lazy)
+
+
 def import_run(file: str) -> Run:
     """
     Get object from file.
@@ -146,14 +202,14 @@ def import_run(file: str) -> Run:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Run
         Object instance.
     """
-    obj: dict = read_yaml(file)
+    obj: dict = read_file(file)
     return create_run_from_dict(obj)
 
 
@@ -13,13 +13,14 @@ from digitalhub_core.entities._base.status import State
 from digitalhub_core.entities._builders.metadata import build_metadata
 from digitalhub_core.entities._builders.spec import build_spec
 from digitalhub_core.entities._builders.status import build_status
+from digitalhub_core.entities.runs.futures import BACKOFF, MAX_POLL_INTERVAL, POLL_INTERVAL, wait_all
 from digitalhub_core.entities.runs.metadata import RunMetadata
 from digitalhub_core.entities.runs.status import RunStatus
 from digitalhub_core.runtimes.builder import build_runtime
 from digitalhub_core.utils.api import api_ctx_create, api_ctx_read, api_ctx_read_no_version, api_ctx_update_name_only
 from digitalhub_core.utils.exceptions import EntityError
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.context.context import Context
@@ -38,6 +39,9 @@ class Run(Entity):
     A class representing a run.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "project", "id"]
+
     def __init__(
         self,
         project: str,
@@ -73,9 +77,6 @@ class Run(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.extend(["project", "id"])
-
     #############################
     #  Save / Export
     #############################
@@ -111,7 +112,8 @@ class Run(Entity):
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export file, written as JSON if it has a .json suffix, as YAML otherwise.
+            If not specified, the default value is used.
 
         Returns
         -------
@@ -122,7 +124,7 @@ class Run(Entity):
             filename = f"{self.kind}_{self.name}_{self.id}.yml"
         pth = Path(self.project) / filename
         pth.parent.mkdir(parents=True, exist_ok=True)
-        write_yaml(pth, obj)
+        write_file(pth, obj)
 
     #############################
     #  Context
@@ -210,11 +212,42 @@ class Run(Entity):
         """
         api = api_ctx_read_no_version(self.project, "runs", self.id)
         obj = self._context().read_object(api)
-        refreshed_run = self.from_dict(obj, validate=False)
-        self.kind = refreshed_run.kind
-        self.metadata = refreshed_run.metadata
-        self.spec = refreshed_run.spec
-        self.status = refreshed_run.status
+        self._refresh_from_dict(obj)
+        return self
+
+    def wait(
+        self,
+        timeout: float | None = None,
+        poll_interval: float = POLL_INTERVAL,
+        backoff: float = BACKOFF,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> Run:
+        """
+        Wait for the run to reach a final state, polling the backend
+        with exponential backoff.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum number of seconds to wait. If None, wait indefinitely.
+        poll_interval : float
+            Initial seconds between polls.
+        backoff : float
+            Factor applied to the poll interval after each poll.
+        max_interval : float
+            Maximum seconds between polls.
+
+        Returns
+        -------
+        Run
+            Run object.
+
+        Raises
+        ------
+        TimeoutError
+            If the run is not finished within timeout.
+        """
+        wait_all([self], timeout=timeout, poll_interval=poll_interval, backoff=backoff, max_interval=max_interval)
         return self
 
     def logs(self) -> dict:
@@ -232,6 +265,25 @@ class Run(Entity):
         api = api_ctx_read_no_version(self.project, "runs", self.id) + "/log"
         return self._context().read_object(api)
 
+    def _refresh_from_dict(self, obj: dict) -> None:
+        """
+        Update run from a backend object.
+
+        Parameters
+        ----------
+        obj : dict
+            Run object read from backend.
+
+        Returns
+        -------
+        None
+        """
+        refreshed_run = self.from_dict(obj, validate=False)
+        self.kind = refreshed_run.kind
+        self.metadata = refreshed_run.metadata
+        self.spec = refreshed_run.spec
+        self.status = refreshed_run.status
+
     def _set_status(self, status: dict) -> None:
         """
         Set run status.
@@ -439,7 +491,7 @@ def run_from_parameters(
     )
 
 
-def run_from_dict(obj: dict) -> Run:
+def run_from_dict(obj: dict, lazy: bool = False) -> Run:
     """
     Create run from dictionary.
 
@@ -447,10 +499,12 @@ def run_from_dict(obj: dict) -> Run:
     ----------
     obj : dict
         Dictionary to create run from.
+    lazy : bool
+        If True, the run spec is built when first accessed.
 
     Returns
     -------
     Run
         Run object.
     """
-    return Run.from_dict(obj, validate=False)
+    return Run.from_dict(obj, validate=False, lazy=lazy)
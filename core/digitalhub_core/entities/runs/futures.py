@@ -0,0 +1,277 @@
+"""
+Run futures module.
+
+Local executions that are not waited for are submitted to an executor
+shared by all the functions, so a driver can submit many runs without
+waiting for each of them. Runtimes are not thread-safe (e.g. the dbt
+runtime changes the working directory of the process), so submitted
+executions run one at a time, in submission order. Executions that are
+waited for run in the calling thread, so a local run can itself execute
+functions locally without waiting on the queue it occupies. Remote runs
+are waited for by polling the backend, reading the pending runs of a
+project in one batch per poll and backing off exponentially between
+polls.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from digitalhub_core.context.builder import get_context
+from digitalhub_core.entities._base.status import State
+from digitalhub_core.utils.api import api_ctx_read_no_version
+
+if typing.TYPE_CHECKING:
+    from digitalhub_core.entities.runs.entity import Run
+
+
+# States after which a run does not change anymore
+FINAL_STATES = (State.COMPLETED.value, State.ERROR.value, State.STOP.value)
+
+# Polling defaults, in seconds
+POLL_INTERVAL = 1.0
+MAX_POLL_INTERVAL = 30.0
+BACKOFF = 2.0
+
+# Local executions run one at a time, runtimes are not thread-safe
+LOCAL_WORKERS = 1
+
+# Shared executor for local executions
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the executor shared by local executions, creating it on
+    first use. The executor has a single worker, so local executions
+    are serialized.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        The shared executor.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=LOCAL_WORKERS, thread_name_prefix="digitalhub-run")
+        return _executor
+
+
+class RunFuture:
+    """
+    A run being executed.
+
+    A future of a local execution completes when the run has been
+    executed on the shared executor. A future of a remote run
+    completes when the run reaches a final state on the backend.
+    """
+
+    def __init__(self, run: Run, future: Future | None = None) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        run : Run
+            The run.
+        future : Future
+            Future of the local execution. None for remote runs.
+        """
+        self.run = run
+        self._future = future
+
+    def done(self) -> bool:
+        """
+        Check whether the run is finished. For remote runs, the run is
+        refreshed from the backend.
+
+        Returns
+        -------
+        bool
+            True if the run is finished.
+        """
+        if self._future is not None:
+            return self._future.done()
+        return self.run.refresh().status.state in FINAL_STATES
+
+    def result(
+        self,
+        timeout: float | None = None,
+        poll_interval: float = POLL_INTERVAL,
+        backoff: float = BACKOFF,
+    ) -> Run:
+        """
+        Wait for the run to finish and return it.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum number of seconds to wait. If None, wait indefinitely.
+        poll_interval : float
+            Initial seconds between polls. Remote runs only.
+        backoff : float
+            Factor applied to the poll interval after each poll. Remote runs only.
+
+        Returns
+        -------
+        Run
+            The finished run.
+
+        Raises
+        ------
+        TimeoutError
+            If the run is not finished within timeout.
+        """
+        if self._future is not None:
+            try:
+                return self._future.result(timeout)
+            except FutureTimeoutError as err:
+                raise TimeoutError(f"Run {self.run.id} not finished after {timeout} seconds.") from err
+        return self.run.wait(timeout=timeout, poll_interval=poll_interval, backoff=backoff)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        """
+        Get the exception raised by a local execution, if any.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum number of seconds to wait. If None, wait indefinitely.
+
+        Returns
+        -------
+        BaseException | None
+            The exception raised, None for remote runs or if none was raised.
+        """
+        if self._future is not None:
+            return self._future.exception(timeout)
+        return None
+
+    def __repr__(self) -> str:
+        return f"RunFuture(run={self.run.id})"
+
+
+def submit_run(run: Run) -> RunFuture:
+    """
+    Build and execute a local run on the shared executor. The run
+    starts after the local runs submitted before it are finished.
+
+    Parameters
+    ----------
+    run : Run
+        The run to execute.
+
+    Returns
+    -------
+    RunFuture
+        The future of the execution.
+    """
+    return RunFuture(run, get_executor().submit(execute_run, run))
+
+
+def execute_run(run: Run) -> Run:
+    """
+    Build and execute a local run in the calling thread.
+
+    Parameters
+    ----------
+    run : Run
+        The run to execute.
+
+    Returns
+    -------
+    Run
+        The executed run.
+    """
+    run.build()
+    return run.run()
+
+
+def wait_all(
+    runs: list[Run | RunFuture],
+    timeout: float | None = None,
+    poll_interval: float = POLL_INTERVAL,
+    backoff: float = BACKOFF,
+    max_interval: float = MAX_POLL_INTERVAL,
+) -> list[Run]:
+    """
+    Wait for many runs to finish. Runs executed locally are waited on
+    their futures. The other runs are polled from the backend: at each
+    poll the pending runs of a project are read in one batch, and the
+    interval between polls grows by backoff up to max_interval.
+
+    Parameters
+    ----------
+    runs : list[Run | RunFuture]
+        Runs or run futures to wait for.
+    timeout : float
+        Maximum number of seconds to wait. If None, wait indefinitely.
+    poll_interval : float
+        Initial seconds between polls.
+    backoff : float
+        Factor applied to the poll interval after each poll.
+    max_interval : float
+        Maximum seconds between polls.
+
+    Returns
+    -------
+    list[Run]
+        The finished runs, in the same order as runs.
+
+    Raises
+    ------
+    TimeoutError
+        If the runs are not finished within timeout.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    # Wait local executions first, they are already running
+    results: list[Run] = []
+    for run in runs:
+        if isinstance(run, RunFuture):
+            if run._future is not None:
+                run = run.result(_remaining(deadline))
+            else:
+                run = run.run
+        results.append(run)
+
+    pending = [run for run in results if run.status.state not in FINAL_STATES]
+    interval = poll_interval
+    while pending:
+        _poll(pending)
+        pending = [run for run in pending if run.status.state not in FINAL_STATES]
+        if not pending:
+            break
+        remaining = _remaining(deadline)
+        if remaining is not None and remaining <= 0:
+            raise TimeoutError(f"{len(pending)} runs not finished after {timeout} seconds.")
+        time.sleep(interval if remaining is None else min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+    return results
+
+
+def _poll(runs: list[Run]) -> None:
+    """
+    Refresh runs from the backend, with one batch read per project.
+    """
+    projects: dict[str, list[Run]] = {}
+    for run in runs:
+        projects.setdefault(run.project, []).append(run)
+    for project, project_runs in projects.items():
+        apis = [api_ctx_read_no_version(project, "runs", run.id) for run in project_runs]
+        for run, obj in zip(project_runs, get_context(project).read_objects(apis)):
+            run._refresh_from_dict(obj)
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """
+    Seconds left before deadline.
+    """
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
@@ -8,7 +8,7 @@ import typing
 from digitalhub_core.context.builder import check_context, get_context
 from digitalhub_core.entities.secrets.entity import secret_from_dict, secret_from_parameters
 from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read, api_ctx_update
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.io_utils import read_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.secrets.entity import Secret
@@ -31,7 +31,7 @@ def create_secret(**kwargs) -> Secret:
     return secret_from_parameters(**kwargs)
 
 
-def create_secret_from_dict(obj: dict) -> Secret:
+def create_secret_from_dict(obj: dict, lazy: bool = False) -> Secret:
     """
     Create a new Secret instance from a dictionary.
 
@@ -39,6 +39,8 @@ def create_secret_from_dict(obj: dict) -> Secret:
     ----------
     obj : dict
         Dictionary to create the Secret from.
+    lazy : bool
+        If True, the secret spec is built when first accessed.
 
     Returns
     -------
@@ -46,7 +48,7 @@ def create_secret_from_dict(obj: dict) -> Secret:
         Secret object.
     """
     check_context(obj.get("project"))
-    return secret_from_dict(obj)
+    return secret_from_dict(obj, lazy=lazy)
 
 
 def new_secret(
@@ -133,6 +135,30 @@ def get_secret(project: str, name: str, uuid: str | None = None) -> Secret:
     return create_secret_from_dict(obj)
 
 
+async def get_secret_async(project: str, name: str, uuid: str | None = None) -> Secret:
+    """
+    Asynchronously retrieve secret details from the backend.
+
+    Parameters
+    ----------
+
+    project : str
+        Name of the project.
+    name : str
+        The name of the secret.
+    uuid : str
+        UUID.
+
+    Returns
+    -------
+    Secret
+        Object instance.
+    """
+    api = api_ctx_read(project, "secrets", name, uuid=uuid)
+    obj = await get_context(project).read_object_async(api)
+    return create_secret_from_dict(obj)
+
+
 def import_secret(file: str) -> Secret:
     """
     Import an Secret object from a file using the specified file path.
@@ -140,14 +166,14 @@ def import_secret(file: str) -> Secret:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Secret
         Object instance.
     """
-    obj: dict = read_yaml(file)
+    obj: dict = read_file(file)
     return create_secret_from_dict(obj)
 
 
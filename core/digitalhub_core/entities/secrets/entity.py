@@ -15,7 +15,7 @@ from digitalhub_core.entities.secrets.metadata import SecretMetadata
 from digitalhub_core.entities.secrets.status import SecretStatus
 from digitalhub_core.utils.api import api_base_read, api_base_update, api_ctx_create, api_ctx_update
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.context.context import Context
@@ -27,6 +27,9 @@ class Secret(Entity):
     A class representing a secret.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "project", "name", "id"]
+
     def __init__(
         self,
         project: str,
@@ -66,9 +69,6 @@ class Secret(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.extend(["project", "name", "id"])
-
     #############################
     #  Save / Export
     #############################
@@ -104,7 +104,8 @@ class Secret(Entity):
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export file, written as JSON if it has a .json suffix, as YAML otherwise.
+            If not specified, the default value is used.
 
         Returns
         -------
@@ -115,7 +116,7 @@ class Secret(Entity):
             filename = f"{self.kind}_{self.name}_{self.id}.yml"
         pth = Path(self.project) / filename
         pth.parent.mkdir(parents=True, exist_ok=True)
-        write_yaml(pth, obj)
+        write_file(pth, obj)
 
     #############################
     #  Context
@@ -299,7 +300,7 @@ def secret_from_parameters(
     )
 
 
-def secret_from_dict(obj: dict) -> Secret:
+def secret_from_dict(obj: dict, lazy: bool = False) -> Secret:
     """
     Create Secret instance from a dictionary.
 
@@ -307,10 +308,12 @@ def secret_from_dict(obj: dict) -> Secret:
     ----------
     obj : dict
         Dictionary to create Secret from.
+    lazy : bool
+        If True, the secret spec is built when first accessed.
 
     Returns
     -------
     Secret
         Secret instance.
     """
-    return Secret.from_dict(obj, validate=False)
+    return Secret.from_dict(obj, validate=False, lazy=lazy)
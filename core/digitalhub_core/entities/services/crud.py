@@ -8,7 +8,7 @@ import typing
 from digitalhub_core.context.builder import check_context, get_context
 from digitalhub_core.entities.services.entity import service_from_dict, service_from_parameters
 from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read, api_ctx_update
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.io_utils import read_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.services.entity import Service
@@ -128,6 +128,30 @@ def get_service(project: str, name: str, uuid: str | None = None) -> Service:
     return create_service_from_dict(obj)
 
 
+async def get_service_async(project: str, name: str, uuid: str | None = None) -> Service:
+    """
+    Asynchronously retrieve service details from the backend.
+
+    Parameters
+    ----------
+
+    project : str
+        Name of the project.
+    name : str
+        The name of the service.
+    uuid : str
+        UUID.
+
+    Returns
+    -------
+    Service
+        Object instance.
+    """
+    api = api_ctx_read(project, "services", name, uuid=uuid)
+    obj = await get_context(project).read_object_async(api)
+    return create_service_from_dict(obj)
+
+
 def import_service(file: str) -> Service:
     """
     Import an Service object from a file using the specified file path.
@@ -135,14 +159,14 @@ def import_service(file: str) -> Service:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Service
         Object instance.
     """
-    obj: dict = read_yaml(file)
+    obj: dict = read_file(file)
     return create_service_from_dict(obj)
 
 
@@ -15,7 +15,7 @@ from digitalhub_core.entities.services.metadata import ServiceMetadata
 from digitalhub_core.entities.services.status import ServiceStatus
 from digitalhub_core.utils.api import api_ctx_create, api_ctx_update
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.context.context import Context
@@ -27,6 +27,9 @@ class Service(Entity):
     A class representing a service.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "project", "name", "id"]
+
     def __init__(
         self,
         project: str,
@@ -66,9 +69,6 @@ class Service(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.extend(["project", "name", "id"])
-
     #############################
     #  Save / Export
     #############################
@@ -104,7 +104,8 @@ class Service(Entity):
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export file, written as JSON if it has a .json suffix, as YAML otherwise.
+            If not specified, the default value is used.
 
         Returns
         -------
@@ -115,7 +116,7 @@ class Service(Entity):
             filename = f"{self.kind}_{self.name}_{self.id}.yml"
         pth = Path(self.project) / filename
         pth.parent.mkdir(parents=True, exist_ok=True)
-        write_yaml(pth, obj)
+        write_file(pth, obj)
 
     #############################
     #  Context
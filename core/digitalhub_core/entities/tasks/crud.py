@@ -8,7 +8,7 @@ import typing
 from digitalhub_core.context.builder import check_context, get_context
 from digitalhub_core.entities.tasks.entity import task_from_dict, task_from_parameters
 from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read_no_version, api_ctx_update_name_only
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.io_utils import read_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.tasks.entity import Task
@@ -149,6 +149,27 @@ def get_task(project: str, name: str) -> Task:
     return create_task_from_dict(obj)
 
 
+async def get_task_async(project: str, name: str) -> Task:
+    """
+    Asynchronously retrieve task details from the backend.
+
+    Parameters
+    ----------
+    project : str
+        Name of the project.
+    name : str
+        The name of the task.
+
+    Returns
+    -------
+    Task
+        Object instance.
+    """
+    api = api_ctx_read_no_version(project, "tasks", name)
+    obj = await get_context(project).read_object_async(api)
+    return create_task_from_dict(obj)
+
+
 def import_task(file: str) -> Task:
     """
     Get object from file.
@@ -156,14 +177,14 @@ def import_task(file: str) -> Task:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Task
         Object instance.
     """
-    obj: dict = read_yaml(file)
+    obj: dict = read_file(file)
     return create_task_from_dict(obj)
 
 
@@ -16,7 +16,7 @@ from digitalhub_core.entities.tasks.metadata import TaskMetadata
 from digitalhub_core.entities.tasks.status import TaskStatus
 from digitalhub_core.utils.api import api_ctx_create, api_ctx_update_name_only
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.context.context import Context
@@ -29,6 +29,9 @@ class Task(Entity):
     A class representing a task.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "project", "id"]
+
     def __init__(
         self,
         project: str,
@@ -64,9 +67,6 @@ class Task(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.extend(["project", "id"])
-
     #############################
     #  Save / Export
     #############################
@@ -102,7 +102,8 @@ class Task(Entity):
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export file, written as JSON if it has a .json suffix, as YAML otherwise.
+            If not specified, the default value is used.
 
         Returns
         -------
@@ -113,7 +114,7 @@ class Task(Entity):
             filename = f"{self.kind}_{self.name}_{self.id}.yml"
         pth = Path(self.project) / filename
         pth.parent.mkdir(parents=True, exist_ok=True)
-        write_yaml(pth, obj)
+        write_file(pth, obj)
 
     #############################
     #  Context
@@ -8,7 +8,7 @@ import typing
 from digitalhub_core.context.builder import check_context, get_context
 from digitalhub_core.entities.workflows.entity import workflow_from_dict, workflow_from_parameters
 from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read, api_ctx_update
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.io_utils import read_file
 
 if typing.TYPE_CHECKING:
     from digitalhub_core.entities.workflows.entity import Workflow
@@ -31,7 +31,7 @@ def create_workflow(**kwargs) -> Workflow:
     return workflow_from_parameters(**kwargs)
 
 
-def create_workflow_from_dict(obj: dict) -> Workflow:
+def create_workflow_from_dict(obj: dict, lazy: bool = False) -> Workflow:
     """
     Create a new Workflow instance from a dictionary.
 
@@ -39,6 +39,8 @@ def create_workflow_from_dict(obj: dict) -> Workflow:
     ----------
     obj : dict
         Dictionary to create the Workflow from.
+    lazy : bool
+        If True, the workflow spec is built when first accessed.
 
     Returns
     -------
@@ -46,7 +48,7 @@ def create_workflow_from_dict(obj: dict) -> Workflow:
         Workflow object.
     """
     check_context(obj.get("project"))
-    return workflow_from_dict(obj)
+    return workflow_from_dict(obj, lazy=lazy)
 
 
 def new_workflow(
@@ -125,6 +127,30 @@ def get_workflow(project: str, name: str, uuid: str | None = None) -> Workflow:
     return create_workflow_from_dict(obj)
 
 
+async def get_workflow_async(project: str, name: str, uuid: str | None = None) -> Workflow:
+    """
+    Asynchronously retrieve workflow details from the backend.
+
+    Parameters
+    ----------
+
+    project : str
+        Name of the project.
+    name : str
+        The name of the workflow.
+    uuid : str
+        UUID.
+
+    Returns
+    -------
+    Workflow
+        Object instance.
+    """
+    api = api_ctx_read(project, "workflows", name, uuid=uuid)
+    obj = await get_context(project).read_object_async(api)
+    return create_workflow_from_dict(obj)
+
+
 def import_workflow(file: str) -> Workflow:
     """
     Import an Workflow object from a file using the specified file path.
@@ -132,14 +158,14 @@ def import_workflow(file: str) -> Workflow:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Workflow
         Object instance.
     """
-    obj: dict = read_yaml(file)
+    obj: dict = read_file(file)
     return create_workflow_from_dict(obj)
 
 
@@ -0,0 +1,354 @@
+"""
+Download cache module.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from hashlib import sha256
+from pathlib import Path
+
+from digitalhub_core.utils.file_utils import link_or_copy
+from digitalhub_core.utils.generic_utils import build_uuid
+
+# Default cache location and size cap (bytes) once the cache is enabled
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "digitalhub" / "downloads"
+DEFAULT_CACHE_MAX_SIZE = 10 * 1024**3
+
+# Cache entry files
+META_FILE = "meta.json"
+TMP_PREFIX = ".tmp-"
+
+
+class DownloadCache:
+    """
+    Download cache class.
+
+    The download cache is an on-disk, content-addressed store shared by
+    every store and every process running on the same node. Entries are
+    keyed by the source URI and a fingerprint of the remote object (e.g.
+    ETag, Last-Modified, row count), so a changed object is never served
+    from cache. Each entry is a directory containing the downloaded file
+    and a small metadata file whose modification time is used as last
+    access time for LRU eviction.
+    Files are cloned in and out of the cache (reflinked where the filesystem
+    supports it, copied otherwise), so entries never share their content
+    with the downloaded files and either can be modified independently.
+    """
+
+    def __init__(self, path: str | Path, max_size: int) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        path : str | Path
+            Cache root directory.
+        max_size : int
+            Maximum size of the cache in bytes. A value lower or equal
+            to 0 disables the cache.
+        """
+        self.path = Path(path)
+        self.max_size = max_size
+
+    def is_enabled(self) -> bool:
+        """
+        Check if the cache is enabled.
+
+        Returns
+        -------
+        bool
+            True if enabled, False otherwise.
+        """
+        return self.max_size > 0
+
+    ############################
+    # Public methods
+    ############################
+
+    def get(self, uri: str, fingerprint: str) -> Path | None:
+        """
+        Look up an object in the cache and mark it as recently used.
+
+        Parameters
+        ----------
+        uri : str
+            Source URI of the object.
+        fingerprint : str
+            Fingerprint of the remote object.
+
+        Returns
+        -------
+        Path | None
+            Path of the cached file or None if the object is not cached.
+        """
+        entry = self._entry_path(uri, fingerprint)
+        try:
+            cached = entry / self._read_meta(entry)["filename"]
+        except (OSError, KeyError, ValueError):
+            return None
+        if not cached.is_file():
+            return None
+        self._touch(entry)
+        return cached
+
+    def materialize(self, cached: Path, dst: str) -> str:
+        """
+        Clone a cached file into the destination path.
+
+        Parameters
+        ----------
+        cached : Path
+            Path of the cached file.
+        dst : str
+            Destination path.
+
+        Returns
+        -------
+        str
+            The destination path.
+
+        Raises
+        ------
+        OSError
+            If the cached file has been evicted in the meantime.
+        """
+        self._clone(cached, Path(dst))
+        return dst
+
+    def put(self, uri: str, fingerprint: str, src: str) -> None:
+        """
+        Register a downloaded file in the cache. The file is cloned
+        into a staging directory which is atomically renamed into place, so concurrent writers never expose
+        partial entries.
+
+        Parameters
+        ----------
+        uri : str
+            Source URI of the object.
+        fingerprint : str
+            Fingerprint of the remote object.
+        src : str
+            Path of the downloaded file.
+
+        Returns
+        -------
+        None
+        """
+        src_pth = Path(src)
+        size = src_pth.stat().st_size
+        if size > self.max_size:
+            return
+
+        entry = self._entry_path(uri, fingerprint)
+        if entry.exists():
+            self._touch(entry)
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        staging = self.path / f"{TMP_PREFIX}{build_uuid()}"
+        staging.mkdir()
+        try:
+            cached = staging / src_pth.name
+            self._clone(src_pth, cached)
+            meta = {"uri": uri, "fingerprint": fingerprint, "filename": src_pth.name, "size": size}
+            (staging / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+            staging.rename(entry)
+        except OSError:
+            # Another process won the race or the entry cannot be written
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Evict least recently used entries until the cache size is
+        under the configured cap.
+
+        Returns
+        -------
+        None
+        """
+        entries = []
+        for entry in self._list_entries():
+            try:
+                meta = self._read_meta(entry)
+                entries.append(((entry / META_FILE).stat().st_mtime, int(meta["size"]), entry))
+            except (OSError, KeyError, ValueError):
+                continue
+
+        total = sum(i[1] for i in entries)
+        for _, size, entry in sorted(entries, key=lambda x: x[0]):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+
+        Returns
+        -------
+        None
+        """
+        for entry in self._list_entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def size(self) -> int:
+        """
+        Get the current size of the cache in bytes.
+
+        Returns
+        -------
+        int
+            Cache size.
+        """
+        total = 0
+        for entry in self._list_entries():
+            try:
+                total += int(self._read_meta(entry)["size"])
+            except (OSError, KeyError, ValueError):
+                continue
+        return total
+
+    ############################
+    # Private helper methods
+    ############################
+
+    def _entry_path(self, uri: str, fingerprint: str) -> Path:
+        """
+        Get the entry directory of an object.
+
+        Parameters
+        ----------
+        uri : str
+            Source URI of the object.
+        fingerprint : str
+            Fingerprint of the remote object.
+
+        Returns
+        -------
+        Path
+            Entry directory.
+        """
+        key = sha256(f"{uri}\n{fingerprint}".encode()).hexdigest()
+        return self.path / key
+
+    def _list_entries(self) -> list[Path]:
+        """
+        List committed cache entries.
+
+        Returns
+        -------
+        list[Path]
+            List of entry directories.
+        """
+        if not self.path.is_dir():
+            return []
+        return [i for i in self.path.iterdir() if i.is_dir() and not i.name.startswith(TMP_PREFIX)]
+
+    @staticmethod
+    def _read_meta(entry: Path) -> dict:
+        """
+        Read entry metadata.
+
+        Parameters
+        ----------
+        entry : Path
+            Entry directory.
+
+        Returns
+        -------
+        dict
+            Entry metadata.
+        """
+        return json.loads((entry / META_FILE).read_text(encoding="utf-8"))
+
+    @staticmethod
+    def _touch(entry: Path) -> None:
+        """
+        Update entry last access time.
+
+        Parameters
+        ----------
+        entry : Path
+            Entry directory.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            os.utime(entry / META_FILE)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _clone(src: Path, dst: Path) -> None:
+        """
+        Clone a file into destination, reflinking it where supported
+        and copying it otherwise, so that cache entries and downloaded
+        files never share their content.
+
+        Parameters
+        ----------
+        src : Path
+            Source file.
+        dst : Path
+            Destination file.
+
+        Returns
+        -------
+        None
+        """
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        link_or_copy(src, dst, "clone")
+
+
+def get_download_cache() -> DownloadCache:
+    """
+    Get the download cache instance. The cache is disabled unless it is
+    enabled with set_download_cache() or with the environment variables
+    DIGITALHUB_CACHE_DIR and DIGITALHUB_CACHE_MAX_SIZE (in bytes, 0
+    disables the cache).
+
+    Returns
+    -------
+    DownloadCache
+        Download cache instance.
+    """
+    global _download_cache
+    if _download_cache is None:
+        path = os.getenv("DIGITALHUB_CACHE_DIR")
+        max_size = os.getenv("DIGITALHUB_CACHE_MAX_SIZE")
+        if path is None and max_size is None:
+            max_size = 0
+        elif max_size is None:
+            max_size = DEFAULT_CACHE_MAX_SIZE
+        _download_cache = DownloadCache(path or DEFAULT_CACHE_DIR, int(max_size))
+    return _download_cache
+
+
+def set_download_cache(path: str | Path, max_size: int = DEFAULT_CACHE_MAX_SIZE) -> None:
+    """
+    Set a new download cache instance.
+
+    Parameters
+    ----------
+    path : str | Path
+        Cache root directory.
+    max_size : int
+        Maximum size of the cache in bytes. A value lower or equal
+        to 0 disables the cache.
+
+    Returns
+    -------
+    None
+    """
+    global _download_cache
+    _download_cache = DownloadCache(path, max_size)
+
+
+_download_cache: DownloadCache | None = None
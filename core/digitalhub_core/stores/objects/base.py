@@ -3,16 +3,25 @@ Store module.
 """
 from __future__ import annotations
 
+import shutil
+import typing
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import mkdtemp
-from typing import Literal
+from typing import Callable, Iterator, Literal
 
 import pandas as pd
+from digitalhub_core.stores.cache import get_download_cache
+from digitalhub_core.stores.readers import DEFAULT_BATCH_SIZE, filter_df, iter_parquet, read_parquet
 from digitalhub_core.utils.exceptions import StoreError
 from digitalhub_core.utils.uri_utils import map_uri_scheme
 from pydantic import BaseModel
 
+if typing.TYPE_CHECKING:
+    from pyarrow.dataset import Expression
+    from pyarrow.fs import FileSystem
+
 
 class Store(metaclass=ABCMeta):
     """
@@ -76,6 +85,28 @@ class Store(metaclass=ABCMeta):
         Write pandas DataFrame as parquet or csv.
         """
 
+    ############################
+    # Bulk IO methods
+    ############################
+
+    @abstractmethod
+    def upload_dir(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Method to upload every file of a local directory to storage.
+        """
+
+    @abstractmethod
+    def download_prefix(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Method to download every artifact under a prefix from storage.
+        """
+
+    @abstractmethod
+    def list(self, src: str) -> list[dict]:
+        """
+        Method to list artifacts under a prefix in storage.
+        """
+
     @staticmethod
     def read_df(path: str, extension: str, **kwargs) -> pd.DataFrame:
         """
@@ -106,10 +137,291 @@ class Store(metaclass=ABCMeta):
             return pd.read_parquet(path, **kwargs)
         raise ValueError(f"Format {extension} not supported.")
 
+    ############################
+    # Read methods
+    ############################
+
+    def scan_df(
+        self,
+        src: str,
+        extension: str,
+        columns: list[str] | None = None,
+        filters: list | Expression | None = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Read a DataFrame from storage, selecting columns and rows.
+        Parquet files the store can open in place are read without being
+        downloaded: only the footer and the column chunks of the selected
+        columns in the row groups matching the filters are transferred.
+        Other files are downloaded and read with column projection, and
+        filters are applied after reading if the format cannot push them down.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+        extension : str
+            Extension of the file.
+        columns : list[str]
+            Columns to read. None reads every column.
+        filters : list | Expression
+            Row filters, as pyarrow expression or in the DNF format used by
+            pandas.read_parquet (e.g. [("year", ">=", 2020)]).
+        **kwargs
+            Keyword arguments passed to the pandas reader of downloaded files.
+
+        Returns
+        -------
+        pd.DataFrame
+            Pandas DataFrame.
+        """
+        if extension == "parquet":
+            source = self._open_source(src)
+            if source is not None:
+                return read_parquet(*source, columns=columns, filters=filters)
+
+        path, downloaded = self._get_local_path(src)
+        try:
+            if extension == "parquet":
+                return self.read_df(path, extension, columns=columns, filters=filters, **kwargs)
+            if columns is not None:
+                kwargs["usecols"] = columns
+            return filter_df(self.read_df(path, extension, **kwargs), filters)
+        finally:
+            if downloaded:
+                self._remove_download(path)
+
+    def iter_df(
+        self,
+        src: str,
+        extension: str,
+        columns: list[str] | None = None,
+        filters: list | Expression | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over a DataFrame in storage in batches of at most batch_size
+        rows, selecting columns and rows.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+        extension : str
+            Extension of the file.
+        columns : list[str]
+            Columns to read. None reads every column.
+        filters : list | Expression
+            Row filters.
+        batch_size : int
+            Maximum number of rows of each batch.
+        **kwargs
+            Keyword arguments passed to the pandas reader of downloaded CSV files.
+
+        Yields
+        ------
+        pd.DataFrame
+            Pandas DataFrame batches.
+
+        See Also
+        --------
+        scan_df
+        """
+        if extension == "parquet":
+            source = self._open_source(src)
+            if source is not None:
+                yield from iter_parquet(*source, columns=columns, filters=filters, batch_size=batch_size)
+                return
+
+        path, downloaded = self._get_local_path(src)
+        try:
+            if extension == "parquet":
+                yield from iter_parquet(path, columns=columns, filters=filters, batch_size=batch_size)
+            elif extension == "csv":
+                if columns is not None:
+                    kwargs["usecols"] = columns
+                for chunk in pd.read_csv(path, chunksize=batch_size, **kwargs):
+                    yield filter_df(chunk, filters)
+            else:
+                raise ValueError(f"Format {extension} not supported.")
+        finally:
+            if downloaded:
+                self._remove_download(path)
+
+    def _open_source(self, src: str) -> tuple[str | typing.IO, FileSystem | None] | None:
+        """
+        Open a file for in place reading. Stores that can read byte
+        ranges of remote files should override this method.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+
+        Returns
+        -------
+        tuple[str | IO, FileSystem | None] | None
+            Path and filesystem, or file-like object and None. None if
+            the file must be downloaded to be read.
+        """
+        return None
+
+    def _get_local_path(self, src: str) -> tuple[str, bool]:
+        """
+        Get a local path of an artifact, downloading it if needed.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+
+        Returns
+        -------
+        tuple[str, bool]
+            The local path and whether it was downloaded.
+        """
+        if map_uri_scheme(src) == "local":
+            return src, False
+        return self.download(src), True
+
+    @staticmethod
+    def _remove_download(path: str) -> None:
+        """
+        Remove the temporary folder of a downloaded artifact.
+
+        Parameters
+        ----------
+        path : str
+            The downloaded file path.
+
+        Returns
+        -------
+        None
+        """
+        pth = Path(path)
+        if pth.is_file():
+            pth = pth.parent
+        shutil.rmtree(pth, ignore_errors=True)
+
+    ############################
+    # Download cache methods
+    ############################
+
+    def _download_cached(self, src: str, dst: str | None = None) -> str:
+        """
+        Download an artifact through the download cache. The remote object is
+        fingerprinted and, if an entry for the same URI and fingerprint exists,
+        it is materialized in the destination path instead of being downloaded
+        again. Otherwise the artifact is fetched and registered in the cache.
+        If the store cannot fingerprint the object, the cache is bypassed.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+        dst : str
+            The destination of the artifact.
+
+        Returns
+        -------
+        str
+            The path of the downloaded artifact.
+        """
+        cache = get_download_cache()
+        fingerprint = self._get_fingerprint(src) if cache.is_enabled() else None
+        if fingerprint is None:
+            return self.fetch_artifact(src, dst)
+
+        cached = cache.get(src, fingerprint)
+        if cached is not None:
+            try:
+                return cache.materialize(cached, self._get_download_dst(src, dst))
+            except OSError:
+                # Entry evicted in the meantime, fetch it again
+                pass
+
+        path = self.fetch_artifact(src, dst)
+        try:
+            cache.put(src, fingerprint, path)
+        except OSError:
+            pass
+        return path
+
+    def _get_fingerprint(self, src: str) -> str | None:
+        """
+        Get a fingerprint of the remote object, used together with the
+        URI as download cache key. Stores that support the download
+        cache must override this method.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+
+        Returns
+        -------
+        str | None
+            The fingerprint or None if the object cannot be fingerprinted.
+        """
+        return None
+
+    def _get_download_dst(self, src: str, dst: str | None = None) -> str:
+        """
+        Get the local file path an artifact is downloaded to.
+        If the destination is not provided, a temporary path is built.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+        dst : str
+            The destination of the artifact.
+
+        Returns
+        -------
+        str
+            The local file path.
+        """
+        return dst if dst is not None else self._build_temp(src)
+
     ############################
     # Helpers methods
     ############################
 
+    @staticmethod
+    def _transfer_many(
+        func: Callable[[str, str], str],
+        transfers: list[dict],
+        max_workers: int,
+    ) -> list[dict]:
+        """
+        Transfer many files concurrently with a pool of workers.
+
+        Parameters
+        ----------
+        func : Callable
+            Function that transfers a single file. It is called with
+            source and destination and returns the final destination.
+        transfers : list[dict]
+            Manifest entries with keys "src", "dst" and "size".
+        max_workers : int
+            Maximum number of concurrent transfers.
+
+        Returns
+        -------
+        list[dict]
+            Manifest of the transferred files, in the same order as
+            the input entries. The destination of each entry is the
+            one returned by the transfer function.
+        """
+        if not transfers:
+            return []
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            futures = [executor.submit(func, i["src"], i["dst"]) for i in transfers]
+            return [{**i, "dst": f.result()} for i, f in zip(transfers, futures)]
+
     def _check_local_dst(self, dst: str) -> None:
         """
         Check if the local destination directory exists. Create in case it does not.
@@ -3,11 +3,14 @@ Local store module.
 """
 from __future__ import annotations
 
-import shutil
+import mmap
 import typing
 from pathlib import Path
+from typing import Literal
 
 from digitalhub_core.stores.objects.base import Store, StoreConfig
+from digitalhub_core.utils.exceptions import StoreError
+from digitalhub_core.utils.file_utils import link_or_copy
 
 if typing.TYPE_CHECKING:
     import pandas as pd
@@ -21,6 +24,14 @@ class LocalStoreConfig(StoreConfig):
     path: str
     """Local path."""
 
+    max_workers: int = 8
+    """Maximum number of files copied concurrently by bulk operations."""
+
+    link_strategy: Literal["link", "clone", "copy"] = "clone"
+    """How files are copied: reflink/in-kernel copy first, hardlink first or plain copy.
+    Hardlinked files share their content with the source, so "link" must be used only
+    if neither file is modified in place."""
+
 
 class LocalStore(Store):
     """
@@ -60,11 +71,12 @@ class LocalStore(Store):
         """
         raise NotImplementedError("Local store does not support download. Use as_file() instead.")
 
-    def fetch_artifact(self, src: str, dst: str | None = None) -> str:
+    def fetch_artifact(self, src: str, dst: str | None = None, as_mmap: bool = False) -> str | mmap.mmap:
         """
         Method to fetch an artifact from the backend and to register it on the paths registry.
         If destination is not provided, return the source path, otherwise the path of the copied
-        file.
+        file. Files are cloned instead of copied when possible (see link_strategy).
+        If as_mmap is True, a read-only memory map of the file is returned instead of its path.
 
         Parameters
         ----------
@@ -72,16 +84,22 @@ class LocalStore(Store):
             The source location of the artifact.
         dst : str
             The destination of the artifact.
+        as_mmap : bool
+            Return a read-only memory map of the artifact.
 
         Returns
         -------
-        str
-            Returns the path of the artifact.
+        str | mmap.mmap
+            Returns the path of the artifact or its memory map.
         """
         if dst is None:
-            return src
-        self._check_local_dst(dst)
-        return shutil.copy(src, dst)
+            path = src
+        else:
+            self._check_local_dst(dst)
+            path = link_or_copy(src, dst, self.config.link_strategy)
+        if as_mmap:
+            return self._open_mmap(path)
+        return path
 
     def upload(self, src: str, dst: str | None = None) -> str:
         """
@@ -103,7 +121,8 @@ class LocalStore(Store):
         """
         Method to persist (copy) an artifact on local filesystem.
         If destination is not provided, the artifact is written to the default
-        store path with source name.
+        store path with source name. Files are cloned instead of copied when
+        possible (see link_strategy).
 
         Parameters
         ----------
@@ -122,7 +141,7 @@ class LocalStore(Store):
         if dst is None:
             dst = str(Path(self.config.path) / Path(src).name)
         self._check_local_dst(dst)
-        return shutil.copy(src, dst)
+        return link_or_copy(src, dst, self.config.link_strategy)
 
     def write_df(self, df: pd.DataFrame, dst: str | None = None, **kwargs) -> str:
         """
@@ -150,6 +169,168 @@ class LocalStore(Store):
         df.to_parquet(dst, index=False, **kwargs)
         return dst
 
+    ############################
+    # Bulk IO methods
+    ############################
+
+    def upload_dir(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Method to upload (copy) a directory on local filesystem with a pool of workers.
+        If destination is not provided, the directory is written to the default store
+        path with source name.
+
+        Parameters
+        ----------
+        src : str
+            The source directory.
+        dst : str
+            The destination directory.
+
+        Returns
+        -------
+        list[dict]
+            Manifest of the copied files, with keys "src", "dst" and "size".
+        """
+        if dst is None:
+            dst = str(Path(self.config.path) / Path(src).name)
+        return self._copy_dir(src, dst)
+
+    def download_prefix(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Method to fetch every file of a local directory. If destination is not provided,
+        the files are not copied and the manifest refers to the source files, otherwise
+        the directory tree is copied into the destination with a pool of workers.
+
+        Parameters
+        ----------
+        src : str
+            The source directory.
+        dst : str
+            The destination directory.
+
+        Returns
+        -------
+        list[dict]
+            Manifest of the fetched files, with keys "src", "dst" and "size".
+        """
+        if dst is None:
+            return [{"src": i["path"], "dst": i["path"], "size": i["size"]} for i in self.list(src)]
+        return self._copy_dir(src, dst)
+
+    def list(self, src: str) -> list[dict]:
+        """
+        List files under a local path, recursively.
+
+        Parameters
+        ----------
+        src : str
+            The directory (or file) to list.
+
+        Returns
+        -------
+        list[dict]
+            List of files, with keys "path", "size" and "last_modified".
+        """
+        root = Path(src)
+        files = [root] if root.is_file() else sorted(i for i in root.rglob("*") if i.is_file())
+        listing = []
+        for pth in files:
+            stat = pth.stat()
+            listing.append({"path": str(pth), "size": stat.st_size, "last_modified": stat.st_mtime})
+        return listing
+
+    ############################
+    # Read methods
+    ############################
+
+    def _open_source(self, src: str) -> tuple[str, None]:
+        """
+        Local files are always read in place.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+
+        Returns
+        -------
+        tuple[str, None]
+            The file path.
+        """
+        return src, None
+
+    ############################
+    # Private helper methods
+    ############################
+
+    def _copy_dir(self, src: str, dst: str) -> list[dict]:
+        """
+        Copy a directory tree with a pool of workers.
+
+        Parameters
+        ----------
+        src : str
+            The source directory.
+        dst : str
+            The destination directory.
+
+        Returns
+        -------
+        list[dict]
+            Manifest of the copied files.
+        """
+        root = Path(src)
+        transfers = []
+        for i in self.list(src):
+            target = Path(dst) / Path(i["path"]).relative_to(root)
+            transfers.append({"src": i["path"], "dst": str(target), "size": i["size"]})
+        return self._transfer_many(self._copy_file, transfers, self.config.max_workers)
+
+    def _copy_file(self, src: str, dst: str) -> str:
+        """
+        Copy a single file, creating the destination directory.
+
+        Parameters
+        ----------
+        src : str
+            The source file.
+        dst : str
+            The destination file.
+
+        Returns
+        -------
+        str
+            The destination file.
+        """
+        Path(dst).parent.mkdir(parents=True, exist_ok=True)
+        return link_or_copy(src, dst, self.config.link_strategy)
+
+    @staticmethod
+    def _open_mmap(path: str) -> mmap.mmap:
+        """
+        Open a read-only memory map of a file.
+
+        Parameters
+        ----------
+        path : str
+            The file path.
+
+        Returns
+        -------
+        mmap.mmap
+            The memory map.
+
+        Raises
+        ------
+        StoreError
+            If the file is empty.
+        """
+        with open(path, "rb") as f:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as ex:
+                raise StoreError(f"Cannot memory map file '{path}': {ex}")
+
     ############################
     # Store interface methods
     ############################
@@ -3,11 +3,18 @@ Remote store module.
 """
 from __future__ import annotations
 
+import json
+import os
+import threading
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 from digitalhub_core.stores.objects.base import Store, StoreConfig
+from digitalhub_core.stores.transfer import HttpRangeReader
+from digitalhub_core.utils.exceptions import StoreError
+from requests.adapters import HTTPAdapter
 
 if typing.TYPE_CHECKING:
     import pandas as pd
@@ -18,6 +25,24 @@ class RemoteStoreConfig(StoreConfig):
     Remote store configuration class.
     """
 
+    chunk_size: int = 1024**2
+    """Size in bytes of the chunks read from the response stream."""
+
+    timeout: float = 60
+    """Seconds to wait for the server before giving up."""
+
+    max_pool_connections: int = 10
+    """Maximum number of connections kept in the session connection pool per host."""
+
+    max_concurrency: int = 4
+    """Maximum number of segments of a single file downloaded concurrently."""
+
+    segment_size: int = 16 * 1024**2
+    """Size in bytes of the segments of a parallel ranged download."""
+
+    parallel_threshold: int = 64 * 1024**2
+    """Size in bytes above which files are downloaded in parallel segments."""
+
 
 class RemoteStore(Store):
     """
@@ -41,6 +66,10 @@ class RemoteStore(Store):
         super().__init__(name, store_type)
         self.config = config
 
+        # Long-lived session shared by every operation
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+
     ############################
     # IO methods
     ############################
@@ -61,7 +90,7 @@ class RemoteStore(Store):
         str
             The path of the downloaded artifact.
         """
-        return self._registry.get(src, self.fetch_artifact(src, dst))
+        return self._download_cached(src, dst)
 
     def fetch_artifact(self, src: str, dst: str | None = None) -> str:
         """
@@ -81,9 +110,7 @@ class RemoteStore(Store):
         str
             Returns the path of the artifact.
         """
-        dst = dst if dst is not None else self._build_temp("remote")
-        if not dst.endswith(".csv") and not dst.endswith(".parquet"):
-            dst = str(Path(dst) / "temp.file")
+        dst = self._get_download_dst(src, dst)
         return self._download_file(src, dst)
 
     def upload(self, src: str, dst: str | None = None) -> str:
@@ -122,14 +149,165 @@ class RemoteStore(Store):
         """
         raise NotImplementedError("Remote store does not support write_df.")
 
+    ############################
+    # Bulk IO methods
+    ############################
+
+    def upload_dir(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Method to upload a directory. Note that this method is not implemented
+        since the remote store is not meant to upload artifacts.
+
+        Raises
+        ------
+        NotImplementedError
+            This method is not implemented.
+        """
+        raise NotImplementedError("Remote store does not support upload_dir.")
+
+    def download_prefix(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Method to download every artifact under a prefix. Note that this method
+        is not implemented since the remote store cannot list artifacts.
+
+        Raises
+        ------
+        NotImplementedError
+            This method is not implemented.
+        """
+        raise NotImplementedError("Remote store does not support download_prefix.")
+
+    def list(self, src: str) -> list[dict]:
+        """
+        Method to list artifacts under a prefix. Note that this method
+        is not implemented since the remote store cannot list artifacts.
+
+        Raises
+        ------
+        NotImplementedError
+            This method is not implemented.
+        """
+        raise NotImplementedError("Remote store does not support list.")
+
+    ############################
+    # Download cache methods
+    ############################
+
+    def _get_fingerprint(self, src: str) -> str | None:
+        """
+        Get a fingerprint of a remote file from the ETag or Last-Modified
+        and Content-Length headers.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+
+        Returns
+        -------
+        str | None
+            The fingerprint or None if the server does not expose validators.
+        """
+        try:
+            r = self._head(src)
+        except requests.exceptions.RequestException:
+            return None
+        validator = r.headers.get("ETag") or r.headers.get("Last-Modified")
+        if validator is None:
+            return None
+        return f"{validator}:{r.headers.get('Content-Length')}"
+
+    def _get_download_dst(self, src: str, dst: str | None = None) -> str:
+        """
+        Get the local file path an artifact is downloaded to.
+        If the destination is not provided, a temporary folder will be created.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+        dst : str
+            The destination of the artifact.
+
+        Returns
+        -------
+        str
+            The local file path.
+        """
+        dst = dst if dst is not None else self._build_temp("remote")
+        if not dst.endswith(".csv") and not dst.endswith(".parquet"):
+            dst = str(Path(dst) / "temp.file")
+        return dst
+
+    ############################
+    # Read methods
+    ############################
+
+    def _open_source(self, src: str) -> tuple[HttpRangeReader, None] | None:
+        """
+        Open a remote file for in place reading, if the server
+        accepts byte ranges.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact.
+
+        Returns
+        -------
+        tuple[HttpRangeReader, None] | None
+            A ranged reader over the file, or None if the server does
+            not accept byte ranges.
+        """
+        try:
+            head = self._head(src)
+        except requests.exceptions.RequestException:
+            return None
+        size = head.headers.get("Content-Length")
+        if head.headers.get("Accept-Ranges", "").lower() != "bytes" or size is None or not size.isdigit():
+            return None
+        return HttpRangeReader(self._get_session(), src, int(size), self.config.timeout), None
+
     ############################
     # Private helper methods
     ############################
 
-    @staticmethod
-    def _check_head(src) -> None:
+    def _get_session(self) -> requests.Session:
+        """
+        Get the HTTP session. The session is built once and reused by every
+        operation, so connections are kept alive across requests.
+
+        Returns
+        -------
+        requests.Session
+            The HTTP session.
         """
-        Check if the source exists.
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        """
+        Build a new HTTP session with a connection pool sized by the
+        max_pool_connections configuration parameter.
+
+        Returns
+        -------
+        requests.Session
+            The HTTP session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max(self.config.max_pool_connections, self.config.max_concurrency))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _head(self, src: str) -> requests.Response:
+        """
+        Send a HEAD request for the source. The identity encoding is requested,
+        so the Content-Length header is the size of the file.
 
         Parameters
         ----------
@@ -138,19 +316,30 @@ class RemoteStore(Store):
 
         Returns
         -------
-        None
+        requests.Response
+            The response.
 
         Raises
         ------
         HTTPError
             If an error occurs while checking the source.
         """
-        r = requests.head(src, timeout=60)
+        r = self._get_session().head(
+            src,
+            timeout=self.config.timeout,
+            allow_redirects=True,
+            headers={"Accept-Encoding": "identity"},
+        )
         r.raise_for_status()
+        return r
 
     def _download_file(self, url: str, dst: str) -> str:
         """
-        Method to download a file from a given url.
+        Method to download a file from a given url. The file is written to
+        a partial file (dst.part) which is renamed to the destination once
+        complete. If the server accepts byte ranges, large files are
+        downloaded in parallel segments and interrupted downloads are
+        resumed from the partial file on the next call.
 
         Parameters
         ----------
@@ -164,15 +353,199 @@ class RemoteStore(Store):
         str
             The path of the downloaded file.
         """
-        self._check_head(url)
+        head = self._head(url)
         self._check_local_dst(dst)
-        with requests.get(url, stream=True, timeout=60) as r:
-            r.raise_for_status()
-            with open(dst, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
+
+        size = head.headers.get("Content-Length")
+        size = int(size) if size is not None and size.isdigit() else None
+        validator = self._get_range_validator(head.headers)
+        ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+        part = f"{dst}.part"
+        if ranges and size is not None and size >= self.config.parallel_threshold and self.config.max_concurrency > 1:
+            self._download_segments(url, part, size, validator)
+        else:
+            self._download_stream(url, part, size, validator if ranges else None)
+        os.replace(part, dst)
         return dst
 
+    @staticmethod
+    def _get_range_validator(headers: dict) -> str | None:
+        """
+        Get the validator to send in the If-Range header. If-Range requires
+        a strong validator, so a weak ETag (W/"...") is never used: the
+        server would answer every range request with the whole file.
+
+        Parameters
+        ----------
+        headers : dict
+            Headers of the HEAD response.
+
+        Returns
+        -------
+        str | None
+            The strong ETag or the Last-Modified date, None if there is none.
+        """
+        etag = headers.get("ETag")
+        if etag is not None and not etag.startswith("W/"):
+            return etag
+        return headers.get("Last-Modified")
+
+    def _download_stream(self, url: str, part: str, size: int | None, validator: str | None) -> None:
+        """
+        Download a file sequentially into a partial file. If a validator is
+        given and the partial file exists, the download resumes from the end
+        of the partial file. The If-Range header makes the server send the
+        whole file again if it changed in the meantime. If the server rejects
+        the range (416), the partial file is discarded and the download
+        starts over.
+
+        Parameters
+        ----------
+        url : str
+            The url of the file to download.
+        part : str
+            The partial file path.
+        size : int
+            Size of the file, if known.
+        validator : str
+            ETag or Last-Modified of the file. None disables resume.
+
+        Returns
+        -------
+        None
+        """
+        offset = 0
+        headers = {"Accept-Encoding": "identity"}
+        # A partial file left by a parallel download may have holes
+        resumable = validator is not None and not Path(f"{part}.json").exists()
+        if resumable and Path(part).is_file():
+            offset = Path(part).stat().st_size
+            if size is not None and offset == size:
+                return
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+
+        with self._get_session().get(url, stream=True, headers=headers, timeout=self.config.timeout) as r:
+            restart = offset > 0 and r.status_code == 416
+            if not restart:
+                r.raise_for_status()
+                mode = "ab" if offset and r.status_code == 206 else "wb"
+                with open(part, mode) as f:
+                    for chunk in r.iter_content(chunk_size=self.config.chunk_size):
+                        f.write(chunk)
+
+        # The partial file does not match the remote file, start over
+        if restart:
+            Path(part).unlink(missing_ok=True)
+            Path(f"{part}.json").unlink(missing_ok=True)
+            self._download_stream(url, part, size, None)
+
+    def _download_segments(self, url: str, part: str, size: int, validator: str | None) -> None:
+        """
+        Download a file in parallel ranged segments into a partial file.
+        Completed segments are recorded in a state file (part.json) so an
+        interrupted download only fetches missing segments on the next call,
+        provided the file validator did not change. A segment is recorded
+        only if all its bytes were received. If the server answers a segment
+        with the whole file (e.g. the file changed) or rejects its range
+        (416), the file is downloaded again from the start in a single stream.
+
+        Parameters
+        ----------
+        url : str
+            The url of the file to download.
+        part : str
+            The partial file path.
+        size : int
+            Size of the file.
+        validator : str
+            ETag or Last-Modified of the file. None disables resume.
+
+        Returns
+        -------
+        None
+        """
+        segment_size = self.config.segment_size
+        segments = [(i, min(i + segment_size, size) - 1) for i in range(0, size, segment_size)]
+        state_path = Path(f"{part}.json")
+
+        done = self._read_segments_state(state_path, size, validator)
+        if not done or not Path(part).is_file():
+            done = set()
+            with open(part, "wb") as f:
+                f.truncate(size)
+
+        lock = threading.Lock()
+        fallback = threading.Event()
+
+        def fetch(start: int, end: int) -> None:
+            if fallback.is_set():
+                return
+            headers = {"Accept-Encoding": "identity", "Range": f"bytes={start}-{end}"}
+            if validator is not None:
+                headers["If-Range"] = validator
+            with self._get_session().get(url, stream=True, headers=headers, timeout=self.config.timeout) as r:
+                if r.status_code == 416:
+                    fallback.set()
+                    return
+                r.raise_for_status()
+                if r.status_code != 206:
+                    fallback.set()
+                    return
+                received = 0
+                with open(part, "r+b") as f:
+                    f.seek(start)
+                    for chunk in r.iter_content(chunk_size=self.config.chunk_size):
+                        received += f.write(chunk)
+            if received != end - start + 1:
+                raise StoreError(f"Segment {start}-{end} of {url} is incomplete: {received} bytes received.")
+            with lock:
+                done.add(start)
+                state = {"size": size, "validator": validator, "done": sorted(done)}
+                state_path.write_text(json.dumps(state), encoding="utf-8")
+
+        pending = [i for i in segments if i[0] not in done]
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            futures = [executor.submit(fetch, start, end) for start, end in pending]
+            for future in futures:
+                future.result()
+        state_path.unlink(missing_ok=True)
+
+        # The range request was not honoured, download the whole file
+        if fallback.is_set():
+            self._download_stream(url, part, size, None)
+
+    @staticmethod
+    def _read_segments_state(state_path: Path, size: int, validator: str | None) -> set[int]:
+        """
+        Read the completed segments of a previous parallel download. The
+        state is discarded if the file size or validator changed.
+
+        Parameters
+        ----------
+        state_path : Path
+            The state file path.
+        size : int
+            Size of the file.
+        validator : str
+            ETag or Last-Modified of the file.
+
+        Returns
+        -------
+        set[int]
+            Start offsets of the completed segments.
+        """
+        if validator is None:
+            return set()
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return set()
+        if state.get("size") != size or state.get("validator") != validator:
+            return set()
+        return set(state.get("done", []))
+
     ############################
     # Store interface methods
     ############################
@@ -3,15 +3,22 @@ S3Store module.
 """
 from __future__ import annotations
 
+import threading
+import time
 import typing
-from io import BytesIO
-from typing import Type
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import Callable, Type
 from urllib.parse import urlparse
 
 import boto3
 import botocore.client  # pylint: disable=unused-import
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import BotoCoreError, ClientError
+from pyarrow.fs import S3FileSystem
 from digitalhub_core.stores.objects.base import Store, StoreConfig
+from digitalhub_core.stores.transfer import MIN_PART_SIZE, S3MultipartWriter, TransferProgress
 from digitalhub_core.utils.exceptions import StoreError
 
 if typing.TYPE_CHECKING:
@@ -39,6 +46,24 @@ class S3StoreConfig(StoreConfig):
     bucket_name: str
     """S3 bucket name."""
 
+    max_pool_connections: int = 10
+    """Maximum number of connections kept in the client connection pool."""
+
+    bucket_check_ttl: float = 300
+    """Seconds a successful bucket access check is memoized for."""
+
+    multipart_threshold: int = 8 * 1024**2
+    """Size in bytes above which files are transferred in multiple parts."""
+
+    multipart_chunksize: int = 8 * 1024**2
+    """Size in bytes of each part of a multipart transfer."""
+
+    max_concurrency: int = 10
+    """Maximum number of parts transferred concurrently for a single object."""
+
+    max_workers: int = 10
+    """Maximum number of objects transferred concurrently by bulk operations."""
+
 
 class S3Store(Store):
     """
@@ -62,6 +87,18 @@ class S3Store(Store):
         super().__init__(name, store_type)
         self.config = config
 
+        # Long-lived client shared by every operation and
+        # memo of verified buckets (bucket -> check time)
+        self._client: S3Client | None = None
+        self._client_lock = threading.Lock()
+        self._verified_buckets: dict[str, float] = {}
+
+        # Filesystem used to read files in place
+        self._filesystem: S3FileSystem | None = None
+
+        # User callback for transfers progress
+        self._progress_callback: Callable[[TransferProgress], None] | None = None
+
     ############################
     # IO methods
     ############################
@@ -74,7 +111,7 @@ class S3Store(Store):
         --------
         fetch_artifact
         """
-        return self._registry.get(src, self.fetch_artifact(src, dst))
+        return self._download_cached(src, dst)
 
     def fetch_artifact(self, src: str, dst: str | None = None) -> str:
         """
@@ -93,7 +130,7 @@ class S3Store(Store):
         str
             Returns the path of the downloaded artifact.
         """
-        dst = dst if dst is not None else self._build_temp(src)
+        dst = self._get_download_dst(src, dst)
         bucket = urlparse(src).netloc
         key = self._get_key(src)
         return self._download_file(bucket, key, dst)
@@ -148,10 +185,200 @@ class S3Store(Store):
         """
         if dst is None or not dst.endswith(".parquet"):
             raise StoreError("Destination must be a parquet file!")
-        fileobj = BytesIO()
-        df.to_parquet(fileobj, index=False, **kwargs)
         key = self._get_key(dst)
-        return self._upload_fileobj(fileobj, key)
+        return self._upload_df(df, key, **kwargs)
+
+    ############################
+    # Bulk IO methods
+    ############################
+
+    def upload_dir(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Upload every file of a local directory to S3 based storage with a pool
+        of workers. Keys are built by joining the destination prefix with the
+        path of each file relative to the source directory. If the destination
+        is not provided, the name of the source directory is used as prefix.
+
+        Parameters
+        ----------
+        src : str
+            The source directory on local filesystem.
+        dst : str
+            The destination prefix on S3 based storage.
+
+        Returns
+        -------
+        list[dict]
+            Manifest of the uploaded files, with keys "src", "dst" and "size".
+        """
+        root = Path(src)
+        if not root.is_dir():
+            raise StoreError(f"Source '{src}' is not a directory.")
+        prefix = self._get_key(dst) if dst is not None else root.name
+        prefix = prefix.strip("/")
+
+        self._check_factory()
+        transfers = []
+        for pth in sorted(i for i in root.rglob("*") if i.is_file()):
+            key = "/".join(filter(None, [prefix, pth.relative_to(root).as_posix()]))
+            transfers.append({"src": str(pth), "dst": key, "size": pth.stat().st_size})
+        return self._transfer_many(self._upload_file, transfers, self.config.max_workers)
+
+    def download_prefix(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Download every object under a prefix from S3 based storage with a pool
+        of workers. Objects are written in the destination directory keeping
+        their path relative to the prefix. If the destination is not provided,
+        a temporary directory is created.
+
+        Parameters
+        ----------
+        src : str
+            The source prefix on S3.
+        dst : str
+            The destination directory on local filesystem.
+
+        Returns
+        -------
+        list[dict]
+            Manifest of the downloaded files, with keys "src", "dst" and "size".
+        """
+        if dst is None:
+            dst = mkdtemp()
+        bucket = urlparse(src).netloc
+        prefix = self._get_prefix(src)
+
+        transfers = []
+        for obj in self.list(src):
+            relative = self._get_key(obj["path"])[len(prefix) :]
+            transfers.append({"src": obj["path"], "dst": str(Path(dst) / relative), "size": obj["size"]})
+
+        def download(uri: str, path: str) -> str:
+            return self._download_file(bucket, self._get_key(uri), path)
+
+        return self._transfer_many(download, transfers, self.config.max_workers)
+
+    def list(self, src: str) -> list[dict]:
+        """
+        List objects under a prefix on S3 based storage. The prefix is a
+        directory, so "s3://bucket/data" does not match "data2/...". Listing
+        pages are followed until every object is returned. Directory marker
+        objects (keys ending with "/") are skipped.
+
+        Parameters
+        ----------
+        src : str
+            The prefix on S3.
+
+        Returns
+        -------
+        list[dict]
+            List of objects, with keys "path", "size", "last_modified" and "etag".
+        """
+        client = self._get_client()
+        bucket = urlparse(src).netloc
+        self._check_access_to_storage(client, bucket)
+
+        listing = []
+        paginator = client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=self._get_prefix(src)):
+            for obj in page.get("Contents", []):
+                if obj["Key"].endswith("/"):
+                    continue
+                listing.append(
+                    {
+                        "path": f"s3://{bucket}/{obj['Key']}",
+                        "size": obj.get("Size"),
+                        "last_modified": obj.get("LastModified"),
+                        "etag": obj.get("ETag"),
+                    }
+                )
+        return listing
+
+    ############################
+    # Transfer settings
+    ############################
+
+    def set_progress_callback(self, callback: Callable[[TransferProgress], None] | None) -> None:
+        """
+        Set a function called during uploads and downloads with a
+        TransferProgress object, which exposes the transferred bytes,
+        the total size (if known) and the throughput of the transfer.
+
+        Parameters
+        ----------
+        callback : Callable
+            Progress callback. None unsets the callback.
+
+        Returns
+        -------
+        None
+        """
+        self._progress_callback = callback
+
+    ############################
+    # Download cache methods
+    ############################
+
+    def _get_fingerprint(self, src: str) -> str | None:
+        """
+        Get a fingerprint of an S3 object from its ETag, size and
+        last modified date.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact on S3.
+
+        Returns
+        -------
+        str | None
+            The fingerprint or None if the object cannot be fingerprinted.
+        """
+        try:
+            head = self._get_client().head_object(Bucket=urlparse(src).netloc, Key=self._get_key(src))
+        except (BotoCoreError, ClientError):
+            return None
+        return f"{head.get('ETag')}:{head.get('ContentLength')}:{head.get('LastModified')}"
+
+    ############################
+    # Read methods
+    ############################
+
+    def _open_source(self, src: str) -> tuple[str, S3FileSystem]:
+        """
+        Open an S3 object for in place reading.
+
+        Parameters
+        ----------
+        src : str
+            The source location of the artifact on S3.
+
+        Returns
+        -------
+        tuple[str, S3FileSystem]
+            Path of the object on the filesystem and the filesystem.
+        """
+        return f"{urlparse(src).netloc}/{self._get_key(src)}", self._get_filesystem()
+
+    def _get_filesystem(self) -> S3FileSystem:
+        """
+        Get the pyarrow S3 filesystem, used to read byte ranges of objects.
+
+        Returns
+        -------
+        S3FileSystem
+            The S3 filesystem.
+        """
+        if self._filesystem is None:
+            endpoint = urlparse(self.config.endpoint_url)
+            self._filesystem = S3FileSystem(
+                access_key=self.config.aws_access_key_id,
+                secret_key=self.config.aws_secret_access_key,
+                endpoint_override=endpoint.netloc or endpoint.path,
+                scheme=endpoint.scheme or "https",
+            )
+        return self._filesystem
 
     ############################
     # Private helper methods
@@ -170,7 +397,25 @@ class S3Store(Store):
 
     def _get_client(self) -> S3Client:
         """
-        Get an S3 client object.
+        Get the S3 client object. The client is built once and reused
+        by every operation. Its connection pool size is set by the
+        max_pool_connections configuration parameter.
+
+        Returns
+        -------
+        S3Client
+            Returns a client object that interacts with the S3 storage service.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._build_client()
+        return self._client
+
+    def _build_client(self) -> S3Client:
+        """
+        Build a new S3 client object. A dedicated session is used
+        because the boto3 default session is not thread safe.
 
         Returns
         -------
@@ -181,8 +426,9 @@ class S3Store(Store):
             "endpoint_url": self.config.endpoint_url,
             "aws_access_key_id": self.config.aws_access_key_id,
             "aws_secret_access_key": self.config.aws_secret_access_key,
+            "config": Config(max_pool_connections=self.config.max_pool_connections),
         }
-        return boto3.client("s3", **cfg)
+        return boto3.session.Session().client("s3", **cfg)
 
     @staticmethod
     def _get_key(path: str) -> str:
@@ -204,6 +450,26 @@ class S3Store(Store):
             key = key[1:]
         return key
 
+    def _get_prefix(self, path: str) -> str:
+        """
+        Build a directory prefix, i.e. a key ending with "/" (empty for the
+        bucket root), so that sibling keys sharing its name are not matched.
+
+        Parameters
+        ----------
+        path : str
+            The source path to get the prefix from.
+
+        Returns
+        -------
+        str
+            The prefix.
+        """
+        prefix = self._get_key(path)
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        return prefix
+
     def _check_factory(self) -> tuple[S3Client, str]:
         """
         Check if the S3 bucket is accessible by sending a head_bucket request.
@@ -221,6 +487,7 @@ class S3Store(Store):
     def _check_access_to_storage(self, client: S3Client, bucket: str) -> None:
         """
         Check if the S3 bucket is accessible by sending a head_bucket request.
+        Successful checks are memoized for bucket_check_ttl seconds.
 
         Parameters
         ----------
@@ -238,16 +505,54 @@ class S3Store(Store):
         StoreError:
             If access to the specified bucket is not available.
         """
+        checked = self._verified_buckets.get(bucket)
+        if checked is not None and time.monotonic() - checked < self.config.bucket_check_ttl:
+            return
         try:
             client.head_bucket(Bucket=bucket)
         except ClientError as exc:
+            self._verified_buckets.pop(bucket, None)
             raise StoreError("No access to s3 bucket!") from exc
+        self._verified_buckets[bucket] = time.monotonic()
+
+    def _get_transfer_config(self) -> TransferConfig:
+        """
+        Get the transfer configuration for managed uploads and downloads.
+
+        Returns
+        -------
+        TransferConfig
+            Transfer configuration.
+        """
+        return TransferConfig(
+            multipart_threshold=self.config.multipart_threshold,
+            multipart_chunksize=max(self.config.multipart_chunksize, MIN_PART_SIZE),
+            max_concurrency=self.config.max_concurrency,
+        )
+
+    def _get_progress(self, key: str, total: int | None = None) -> TransferProgress:
+        """
+        Get a progress tracker for a transfer.
+
+        Parameters
+        ----------
+        key : str
+            The key of the file on S3 based storage.
+        total : int
+            Total size of the transfer in bytes, if known.
+
+        Returns
+        -------
+        TransferProgress
+            Progress tracker.
+        """
+        return TransferProgress(key, total, self._progress_callback)
 
     def _download_file(self, bucket: str, key: str, dst: str) -> str:
         """
         Download a file from S3 based storage. The function checks if the bucket is accessible
         and if the destination directory exists. If the destination directory does not exist,
-        it will be created.
+        it will be created. Large files are downloaded in concurrent ranged parts.
 
         Parameters
         ----------
@@ -266,12 +571,19 @@ class S3Store(Store):
         client = self._get_client()
         self._check_access_to_storage(client, bucket)
         self._check_local_dst(dst)
-        client.download_file(bucket, key, dst)
+        client.download_file(
+            bucket,
+            key,
+            dst,
+            Config=self._get_transfer_config(),
+            Callback=self._get_progress(key),
+        )
         return dst
 
     def _upload_file(self, src: str, key: str) -> str:
         """
         Upload a file to S3 based storage. The function checks if the bucket is accessible.
+        Large files are uploaded in concurrent multipart chunks.
 
         Parameters
         ----------
@@ -286,27 +598,45 @@ class S3Store(Store):
             The URI of the uploaded file on S3 based storage.
         """
         client, bucket = self._check_factory()
-        client.upload_file(Filename=src, Bucket=bucket, Key=key)
+        client.upload_file(
+            Filename=src,
+            Bucket=bucket,
+            Key=key,
+            Config=self._get_transfer_config(),
+            Callback=self._get_progress(key, Path(src).stat().st_size),
+        )
         return f"s3://{bucket}/{key}"
 
-    def _upload_fileobj(self, fileobj: BytesIO, key: str) -> str:
+    def _upload_df(self, df: pd.DataFrame, key: str, **kwargs) -> str:
         """
-        Upload a fileobject to S3 based storage. The function checks if the bucket is accessible.
+        Stream a dataframe as parquet to S3 based storage. The parquet file is
+        uploaded in concurrent multipart chunks while it is written, so it is
+        never held entirely in memory. The function checks if the bucket is accessible.
 
         Parameters
         ----------
-        fileobj : BytesIO
-            The fileobject to be uploaded.
+        df : pd.DataFrame
+            The dataframe.
         key : str
             The key of the file on S3 based storage.
+        **kwargs
+            Keyword arguments passed to df.to_parquet().
 
         Returns
         -------
         str
-            The URI of the uploaded fileobject on S3 based storage.
+            The URI of the uploaded dataframe on S3 based storage.
         """
         client, bucket = self._check_factory()
-        client.put_object(Bucket=bucket, Key=key, Body=fileobj.getvalue())
+        with S3MultipartWriter(
+            client,
+            bucket,
+            key,
+            part_size=max(self.config.multipart_chunksize, MIN_PART_SIZE),
+            max_concurrency=self.config.max_concurrency,
+            progress=self._get_progress(key),
+        ) as writer:
+            df.to_parquet(writer, index=False, **kwargs)
         return f"s3://{bucket}/{key}"
 
     ############################
@@ -3,15 +3,26 @@ SQLStore module.
 """
 from __future__ import annotations
 
+import datetime
+import threading
+import typing
+from decimal import Decimal
+from io import StringIO
 from pathlib import Path
+from typing import Any, Iterable
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from digitalhub_core.stores.objects.base import Store, StoreConfig
 from digitalhub_core.utils.exceptions import StoreError
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import MetaData, Table, create_engine, func, literal_column, select
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
 
+if typing.TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
 
 class SQLStoreConfig(StoreConfig):
     """
@@ -33,6 +44,70 @@ class SQLStoreConfig(StoreConfig):
     database: str
     """SQL database name."""
 
+    pool_size: int = 5
+    """Number of connections kept in the engine connection pool."""
+
+    max_overflow: int = 10
+    """Number of connections allowed beyond the pool size."""
+
+    chunk_size: int = 100_000
+    """Number of rows read (and written) per chunk when transferring tables."""
+
+
+# Arrow types used for columns whose type cannot be inferred
+# from data (e.g. all NULL), by python type of the SQL column
+ARROW_TYPES = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    Decimal: pa.float64(),
+    str: pa.string(),
+    bytes: pa.binary(),
+    datetime.datetime: pa.timestamp("ns"),
+    datetime.date: pa.date32(),
+    datetime.time: pa.time64("us"),
+}
+
+
+def _quote_identifier(name: str) -> str:
+    """
+    Quote a Postgres identifier.
+
+    Parameters
+    ----------
+    name : str
+        Identifier.
+
+    Returns
+    -------
+    str
+        Quoted identifier.
+    """
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _copy_field(value: Any) -> str:
+    """
+    Serialize a value as a field of a CSV COPY. Values are always quoted
+    and NULL is an unquoted empty field, so no string value (e.g. an empty
+    string or "\\N") can be loaded as NULL.
+
+    Parameters
+    ----------
+    value : Any
+        Value to serialize.
+
+    Returns
+    -------
+    str
+        CSV field.
+    """
+    if value is None:
+        return ""
+    escaped = str(value).replace('"', '""')
+    return f'"{escaped}"'
+
 
 class SqlStore(Store):
     """
@@ -56,6 +131,10 @@ class SqlStore(Store):
         super().__init__(name, store_type)
         self.config = config
 
+        # Pooled engine shared by every operation
+        self._engine: Engine | None = None
+        self._engine_lock = threading.Lock()
+
     ############################
     # IO methods
     ############################
@@ -68,7 +147,7 @@ class SqlStore(Store):
         --------
         fetch_artifact
         """
-        return self._registry.get(src, self.fetch_artifact(src, dst))
+        return self._download_cached(src, dst)
 
     def fetch_artifact(self, src: str, dst: str | None = None) -> str:
         """
@@ -87,8 +166,7 @@ class SqlStore(Store):
         str
             Returns a file path.
         """
-        dst = dst if dst is not None else self._build_temp(src)
-        dst = str(Path(dst) / "data.parquet")
+        dst = self._get_download_dst(src, dst)
         schema = self._get_schema(src)
         table = self._get_table_name(src)
         return self._download_table(schema, table, dst)
@@ -120,6 +198,8 @@ class SqlStore(Store):
     def write_df(self, df: pd.DataFrame, dst: str | None = None, **kwargs) -> str:
         """
         Write a dataframe to a database. Kwargs are passed to df.to_sql().
+        Pass method="copy" to bulk load rows with the Postgres COPY command
+        instead of INSERT statements, which is much faster on large dataframes.
 
         Parameters
         ----------
@@ -143,6 +223,102 @@ class SqlStore(Store):
             table = self._get_table_name(dst)
         return self._upload_table(df, schema, table, **kwargs)
 
+    ############################
+    # Bulk IO methods
+    ############################
+
+    def upload_dir(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Method to upload a directory. Note that this method is not implemented
+        since the sql store is not meant to upload artifacts.
+
+        Raises
+        ------
+        NotImplementedError
+            This method is not implemented.
+        """
+        raise NotImplementedError("SQL store does not support upload_dir.")
+
+    def download_prefix(self, src: str, dst: str | None = None) -> list[dict]:
+        """
+        Method to download every artifact under a prefix. Note that this method
+        is not implemented since the sql store cannot list artifacts.
+
+        Raises
+        ------
+        NotImplementedError
+            This method is not implemented.
+        """
+        raise NotImplementedError("SQL store does not support download_prefix.")
+
+    def list(self, src: str) -> list[dict]:
+        """
+        Method to list artifacts under a prefix. Note that this method
+        is not implemented since the sql store cannot list artifacts.
+
+        Raises
+        ------
+        NotImplementedError
+            This method is not implemented.
+        """
+        raise NotImplementedError("SQL store does not support list.")
+
+    ############################
+    # Download cache methods
+    ############################
+
+    def _get_fingerprint(self, src: str) -> str | None:
+        """
+        Get a fingerprint of a table from its row count and the sum of
+        the transaction ids (xmin) that wrote its rows. Inserts, updates
+        and deletes change the count or, since new transaction ids are
+        greater than the existing ones, the sum.
+
+        Parameters
+        ----------
+        src : str
+            Table name.
+
+        Returns
+        -------
+        str | None
+            The fingerprint or None if the table cannot be fingerprinted.
+        """
+        try:
+            schema = self._get_schema(src)
+            table = self._get_table_name(src)
+            engine = self._check_factory()
+        except (StoreError, ValueError):
+            return None
+        try:
+            tbl = Table(table, MetaData(), schema=schema)
+            with engine.connect() as conn:
+                xmin = literal_column("xmin::text::bigint")
+                rows, xmins = conn.execute(select(func.count(), func.sum(xmin)).select_from(tbl)).one()
+        except SQLAlchemyError:
+            return None
+        return f"rows:{rows}:xmin:{xmins}"
+
+    def _get_download_dst(self, src: str, dst: str | None = None) -> str:
+        """
+        Get the local file path a table is downloaded to.
+        If the destination is not provided, a temporary directory will be created.
+
+        Parameters
+        ----------
+        src : str
+            Table name.
+        dst : str
+            The destination of the artifact on local filesystem.
+
+        Returns
+        -------
+        str
+            The local file path.
+        """
+        dst = dst if dst is not None else self._build_temp(src)
+        return str(Path(dst) / "data.parquet")
+
     ############################
     # Private helper methods
     ############################
@@ -163,7 +339,24 @@ class SqlStore(Store):
 
     def _get_engine(self) -> Engine:
         """
-        Create engine from connection string.
+        Get the engine. The engine is built once and reused by every
+        operation, so connections are pooled across calls.
+
+        Returns
+        -------
+        Engine
+            An SQLAlchemy engine.
+        """
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    self._engine = self._build_engine()
+        return self._engine
+
+    def _build_engine(self) -> Engine:
+        """
+        Create engine from connection string. The connection pool is bounded
+        by the pool_size and max_overflow configuration parameters.
 
         Returns
         -------
@@ -174,7 +367,12 @@ class SqlStore(Store):
         if not isinstance(connection_string, str):
             raise StoreError("Connection string must be a string.")
         try:
-            return create_engine(connection_string)
+            return create_engine(
+                connection_string,
+                pool_size=self.config.pool_size,
+                max_overflow=self.config.max_overflow,
+                pool_pre_ping=True,
+            )
         except Exception as ex:
             raise StoreError(f"Something wrong with connection string. Arguments: {str(ex.args)}")
 
@@ -271,14 +469,18 @@ class SqlStore(Store):
             If there is no access to the storage.
         """
         try:
-            engine.connect()
+            with engine.connect():
+                pass
         except SQLAlchemyError:
             engine.dispose()
             raise StoreError("No access to db!")
 
     def _download_table(self, schema: str, table: str, dst: str) -> str:
         """
-        Download a table from SQL based storage.
+        Download a table from SQL based storage. The table is read with a
+        server side cursor in chunks of chunk_size rows and each chunk is
+        appended to the parquet file as a row group, so the table is never
+        held entirely in memory.
 
         Parameters
         ----------
@@ -296,13 +498,66 @@ class SqlStore(Store):
         """
         engine = self._check_factory()
         self._check_local_dst(dst)
-        pd.read_sql_table(table, engine, schema=schema).to_parquet(dst, index=False)
-        engine.dispose()
+        with engine.connect() as conn:
+            tbl = Table(table, MetaData(), schema=schema, autoload_with=conn)
+            result = conn.execution_options(stream_results=True).execute(select(tbl))
+            columns = list(result.keys())
+            writer = None
+            try:
+                rows = result.fetchmany(self.config.chunk_size)
+                while True:
+                    chunk = pa.Table.from_pandas(pd.DataFrame.from_records(rows, columns=columns), preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(dst, self._get_arrow_schema(chunk, tbl))
+                    try:
+                        chunk = chunk.cast(writer.schema)
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as ex:
+                        raise StoreError(f"Incompatible data types in table {schema}.{table}: {ex}")
+                    writer.write_table(chunk)
+                    rows = result.fetchmany(self.config.chunk_size)
+                    if not rows:
+                        break
+            finally:
+                result.close()
+                if writer is not None:
+                    writer.close()
         return dst
 
+    @staticmethod
+    def _get_arrow_schema(chunk: pa.Table, table: Table) -> pa.Schema:
+        """
+        Get the parquet schema of a table from its first chunk. Columns
+        whose type cannot be inferred from data (e.g. all NULL values)
+        are typed after the SQL column type.
+
+        Parameters
+        ----------
+        chunk : pa.Table
+            First chunk of the table.
+        table : Table
+            Reflected SQL table.
+
+        Returns
+        -------
+        pa.Schema
+            The parquet schema.
+        """
+        fields = []
+        for field in chunk.schema:
+            if pa.types.is_null(field.type):
+                try:
+                    python_type = table.columns[field.name].type.python_type
+                except (KeyError, NotImplementedError):
+                    python_type = str
+                field = field.with_type(ARROW_TYPES.get(python_type, pa.string()))
+            fields.append(field)
+        return pa.schema(fields)
+
     def _upload_table(self, df: pd.DataFrame, schema: str, table: str, **kwargs) -> str:
         """
-        Upload a table to SQL based storage.
+        Upload a table to SQL based storage. Rows are written in chunks
+        of chunk_size rows unless otherwise specified. If method is "copy",
+        each chunk is streamed to the database with COPY FROM STDIN.
 
         Parameters
         ----------
@@ -321,10 +576,50 @@ class SqlStore(Store):
             The SQL URI where the dataframe was saved.
         """
         engine = self._check_factory()
+        kwargs.setdefault("chunksize", self.config.chunk_size)
+        if kwargs.get("method") == "copy":
+            kwargs["method"] = self._copy_insert
         df.to_sql(table, engine, schema=schema, index=False, **kwargs)
-        engine.dispose()
         return f"sql://{engine.url.database}/{schema}/{table}"
 
+    @staticmethod
+    def _copy_insert(table: SQLTable, conn: Connection, keys: list[str], data_iter: Iterable[tuple]) -> int:
+        """
+        Insert a chunk of rows with COPY FROM STDIN in CSV format.
+        It is meant to be used as df.to_sql() insertion method.
+
+        Parameters
+        ----------
+        table : SQLTable
+            Pandas table object.
+        conn : Connection
+            SQLAlchemy connection.
+        keys : list[str]
+            Column names.
+        data_iter : Iterable[tuple]
+            Rows to insert.
+
+        Returns
+        -------
+        int
+            Number of inserted rows.
+        """
+        buffer = StringIO()
+        for row in data_iter:
+            buffer.write(",".join(_copy_field(i) for i in row))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        columns = ", ".join(_quote_identifier(k) for k in keys)
+        target = _quote_identifier(table.name)
+        if table.schema is not None:
+            target = f"{_quote_identifier(table.schema)}.{target}"
+        sql = f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '')"
+
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(sql, buffer)
+            return cursor.rowcount
+
     ############################
     # Store interface methods
     ############################
@@ -0,0 +1,172 @@
+"""
+DataFrame readers module.
+"""
+from __future__ import annotations
+
+import io
+import os
+import typing
+from typing import Iterator
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow.fs import LocalFileSystem
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+    from pyarrow.fs import FileSystem
+
+
+# Default number of rows of each batch returned by iterators
+DEFAULT_BATCH_SIZE = 65_536
+
+
+def read_parquet(
+    source: str | typing.IO,
+    filesystem: FileSystem | None = None,
+    columns: list[str] | None = None,
+    filters: list | ds.Expression | None = None,
+) -> pd.DataFrame:
+    """
+    Read a parquet file with column projection and row group filtering.
+    Only the footer and the column chunks of the selected columns in the
+    row groups whose statistics match the filters are read.
+
+    Parameters
+    ----------
+    source : str | IO
+        Path of the file (on the given filesystem) or file-like object.
+    filesystem : FileSystem
+        Filesystem the path refers to. None for local paths and file objects.
+    columns : list[str]
+        Columns to read. None reads every column.
+    filters : list | ds.Expression
+        Row filters, as pyarrow expression or in the DNF format used by
+        pandas.read_parquet (e.g. [("year", ">=", 2020)]).
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame.
+    """
+    return _build_scanner(source, filesystem, columns, filters).to_table().to_pandas()
+
+
+def iter_parquet(
+    source: str | typing.IO,
+    filesystem: FileSystem | None = None,
+    columns: list[str] | None = None,
+    filters: list | ds.Expression | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a parquet file in batches of at most batch_size rows,
+    with column projection and row group filtering.
+
+    Parameters
+    ----------
+    source : str | IO
+        Path of the file (on the given filesystem) or file-like object.
+    filesystem : FileSystem
+        Filesystem the path refers to. None for local paths and file objects.
+    columns : list[str]
+        Columns to read. None reads every column.
+    filters : list | ds.Expression
+        Row filters.
+    batch_size : int
+        Maximum number of rows of each batch.
+
+    Yields
+    ------
+    pd.DataFrame
+        Pandas DataFrame batches.
+    """
+    for batch in _build_scanner(source, filesystem, columns, filters, batch_size).to_batches():
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+def filter_df(df: pd.DataFrame, filters: list | ds.Expression | None = None) -> pd.DataFrame:
+    """
+    Filter an in-memory DataFrame with the same filters accepted by the
+    parquet readers. Used for formats that do not support pushdown.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to filter.
+    filters : list | ds.Expression
+        Row filters.
+
+    Returns
+    -------
+    pd.DataFrame
+        Filtered DataFrame.
+    """
+    expression = _to_expression(filters)
+    if expression is None:
+        return df
+    return pa.Table.from_pandas(df, preserve_index=False).filter(expression).to_pandas()
+
+
+def _build_scanner(
+    source: str | typing.IO,
+    filesystem: FileSystem | None,
+    columns: list[str] | None,
+    filters: list | ds.Expression | None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ds.Scanner:
+    """
+    Build a scanner over a single parquet file.
+
+    Parameters
+    ----------
+    source : str | IO
+        Path of the file or file-like object.
+    filesystem : FileSystem
+        Filesystem the path refers to.
+    columns : list[str]
+        Columns to read.
+    filters : list | ds.Expression
+        Row filters.
+    batch_size : int
+        Maximum number of rows of each batch.
+
+    Returns
+    -------
+    ds.Scanner
+        The scanner.
+    """
+    if isinstance(source, io.IOBase):
+        source = pa.PythonFile(source, mode="r")
+    elif filesystem is None:
+        source, filesystem = os.path.abspath(source), LocalFileSystem()
+    fragment = ds.ParquetFileFormat().make_fragment(source, filesystem=filesystem)
+    return ds.Scanner.from_fragment(
+        fragment,
+        columns=columns,
+        filter=_to_expression(filters),
+        batch_size=batch_size,
+    )
+
+
+def _to_expression(filters: list | ds.Expression | None) -> ds.Expression | None:
+    """
+    Convert filters to a pyarrow expression.
+
+    Parameters
+    ----------
+    filters : list | ds.Expression
+        Row filters.
+
+    Returns
+    -------
+    ds.Expression | None
+        The expression or None if there are no filters.
+    """
+    if filters is None or isinstance(filters, ds.Expression):
+        return filters
+    if not filters:
+        return None
+    return pq.filters_to_expression(filters)
@@ -0,0 +1,474 @@
+"""
+Transfer utilities module.
+"""
+from __future__ import annotations
+
+import io
+import threading
+import time
+import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+if typing.TYPE_CHECKING:
+    import requests
+    from digitalhub_core.stores.objects.s3 import S3Client
+
+
+# Minimum multipart part size allowed by S3 (except the last part)
+MIN_PART_SIZE = 5 * 1024**2
+
+
+class TransferProgress:
+    """
+    Transfer progress class.
+
+    It is a thread safe callable that accumulates the number of bytes
+    transferred by one or more concurrent workers and forwards itself
+    to an optional user callback, which can read the transferred bytes,
+    the elapsed time and the throughput of the transfer.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        total: int | None = None,
+        callback: Callable[[TransferProgress], None] | None = None,
+    ) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        name : str
+            Name of the transferred object.
+        total : int
+            Total size of the transfer in bytes, if known.
+        callback : Callable
+            Function called with the progress object every time new bytes
+            are transferred.
+        """
+        self.name = name
+        self.total = total
+        self.transferred = 0
+        self._callback = callback
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __call__(self, bytes_amount: int) -> None:
+        """
+        Register transferred bytes.
+
+        Parameters
+        ----------
+        bytes_amount : int
+            Number of bytes transferred since the last call.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self.transferred += bytes_amount
+            if self._callback is not None:
+                self._callback(self)
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds elapsed since the transfer started.
+
+        Returns
+        -------
+        float
+            Elapsed seconds.
+        """
+        return time.monotonic() - self._start
+
+    @property
+    def throughput(self) -> float:
+        """
+        Average throughput of the transfer in bytes per second.
+
+        Returns
+        -------
+        float
+            Throughput.
+        """
+        elapsed = self.elapsed
+        return self.transferred / elapsed if elapsed > 0 else 0.0
+
+
+class S3MultipartWriter(io.RawIOBase):
+    """
+    Streaming S3 writer.
+
+    Written bytes are buffered up to the part size and each full part is
+    uploaded as a multipart upload part by a pool of workers. At most
+    max_concurrency parts are kept in memory at the same time, so writing
+    a large object never requires holding the whole file in memory.
+    Objects smaller than a part are uploaded with a single put_object call.
+    If the writer is exited because of an exception, the multipart upload
+    is aborted.
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        bucket: str,
+        key: str,
+        part_size: int,
+        max_concurrency: int = 1,
+        progress: TransferProgress | None = None,
+    ) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        client : S3Client
+            The S3 client object.
+        bucket : str
+            The name of the S3 bucket.
+        key : str
+            The key of the object.
+        part_size : int
+            Size in bytes of each part.
+        max_concurrency : int
+            Maximum number of parts uploaded concurrently.
+        progress : TransferProgress
+            Progress tracker.
+        """
+        super().__init__()
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._max_concurrency = max(max_concurrency, 1)
+        self._progress = progress
+
+        self._buffer = bytearray()
+        self._position = 0
+        self._upload_id: str | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._parts: list[Future] = []
+        self._slots = threading.BoundedSemaphore(self._max_concurrency)
+
+    ############################
+    # IO interface
+    ############################
+
+    def writable(self) -> bool:
+        """
+        The writer is writable.
+
+        Returns
+        -------
+        bool
+            True
+        """
+        return True
+
+    def tell(self) -> int:
+        """
+        Number of bytes written so far.
+
+        Returns
+        -------
+        int
+            Current position.
+        """
+        return self._position
+
+    def write(self, b: bytes) -> int:
+        """
+        Write bytes to the object. Full parts are submitted for upload.
+
+        Parameters
+        ----------
+        b : bytes
+            Bytes to write.
+
+        Returns
+        -------
+        int
+            Number of bytes written.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed writer.")
+        data = memoryview(b).cast("B")
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit_part(part)
+        return len(data)
+
+    def close(self) -> None:
+        """
+        Upload remaining bytes and complete the upload.
+
+        Returns
+        -------
+        None
+        """
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                data = bytes(self._buffer)
+                self._client.put_object(Bucket=self._bucket, Key=self._key, Body=data)
+                self._update_progress(len(data))
+            else:
+                if self._buffer:
+                    self._submit_part(bytes(self._buffer))
+                parts = [f.result() for f in self._parts]
+                self._client.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            self._shutdown()
+            super().close()
+
+    def abort(self) -> None:
+        """
+        Abort the upload, discarding uploaded parts.
+
+        Returns
+        -------
+        None
+        """
+        if self._upload_id is not None:
+            self._shutdown()
+            self._client.abort_multipart_upload(Bucket=self._bucket, Key=self._key, UploadId=self._upload_id)
+            self._upload_id = None
+        self._buffer = bytearray()
+        super().close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Complete the upload or abort it if an exception was raised.
+        """
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    ############################
+    # Private helper methods
+    ############################
+
+    def _submit_part(self, data: bytes) -> None:
+        """
+        Submit a part for upload, blocking while max_concurrency parts
+        are already in flight.
+
+        Parameters
+        ----------
+        data : bytes
+            Part content.
+
+        Returns
+        -------
+        None
+        """
+        if self._upload_id is None:
+            resp = self._client.create_multipart_upload(Bucket=self._bucket, Key=self._key)
+            self._upload_id = resp["UploadId"]
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+
+        self._slots.acquire()
+        part_number = len(self._parts) + 1
+        future = self._executor.submit(self._upload_part, part_number, data)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._parts.append(future)
+
+    def _upload_part(self, part_number: int, data: bytes) -> dict:
+        """
+        Upload a single part.
+
+        Parameters
+        ----------
+        part_number : int
+            Number of the part.
+        data : bytes
+            Part content.
+
+        Returns
+        -------
+        dict
+            Part descriptor for upload completion.
+        """
+        resp = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        self._update_progress(len(data))
+        return {"PartNumber": part_number, "ETag": resp["ETag"]}
+
+    def _update_progress(self, bytes_amount: int) -> None:
+        """
+        Update progress tracker if any.
+
+        Parameters
+        ----------
+        bytes_amount : int
+            Bytes transferred.
+
+        Returns
+        -------
+        None
+        """
+        if self._progress is not None:
+            self._progress(bytes_amount)
+
+    def _shutdown(self) -> None:
+        """
+        Shutdown upload workers, waiting for running uploads.
+
+        Returns
+        -------
+        None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class HttpRangeReader(io.RawIOBase):
+    """
+    Seekable reader over a remote HTTP file.
+
+    Every read is served by an HTTP Range request, so readers that only
+    need some parts of a file (e.g. the footer and a few column chunks
+    of a parquet file) transfer only those bytes. The server must
+    accept byte ranges.
+    """
+
+    def __init__(self, session: requests.Session, url: str, size: int, timeout: float = 60) -> None:
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        session : requests.Session
+            HTTP session.
+        url : str
+            URL of the file.
+        size : int
+            Size of the file in bytes.
+        timeout : float
+            Seconds to wait for the server before giving up.
+        """
+        super().__init__()
+        self._session = session
+        self._url = url
+        self._size = size
+        self._timeout = timeout
+        self._position = 0
+
+    def readable(self) -> bool:
+        """
+        The reader is readable.
+
+        Returns
+        -------
+        bool
+            True
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """
+        The reader is seekable.
+
+        Returns
+        -------
+        bool
+            True
+        """
+        return True
+
+    def tell(self) -> int:
+        """
+        Current position in the file.
+
+        Returns
+        -------
+        int
+            Current position.
+        """
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Move to a new position in the file.
+
+        Parameters
+        ----------
+        offset : int
+            Offset relative to whence.
+        whence : int
+            Reference position (io.SEEK_SET, io.SEEK_CUR or io.SEEK_END).
+
+        Returns
+        -------
+        int
+            New position.
+        """
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence value: {whence}.")
+        if position < 0:
+            raise ValueError("Negative seek position.")
+        self._position = position
+        return position
+
+    def readinto(self, b: bytearray | memoryview) -> int:
+        """
+        Read bytes into a buffer with a ranged request.
+
+        Parameters
+        ----------
+        b : bytearray | memoryview
+            Buffer to fill.
+
+        Returns
+        -------
+        int
+            Number of bytes read.
+
+        Raises
+        ------
+        OSError
+            If the server does not honour the range request.
+        """
+        end = min(self._position + len(b), self._size)
+        if end <= self._position:
+            return 0
+        headers = {"Accept-Encoding": "identity", "Range": f"bytes={self._position}-{end - 1}"}
+        r = self._session.get(self._url, headers=headers, timeout=self._timeout)
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise OSError(f"Server did not honour range request for {self._url}.")
+        data = r.content
+        n = len(data)
+        memoryview(b).cast("B")[:n] = data
+        self._position += n
+        return n
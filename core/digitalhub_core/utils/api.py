@@ -33,6 +33,28 @@ def api_ctx_create(
     return f"{API_CONTEXT}/{proj}/{dto}"
 
 
+def api_ctx_list(
+    proj: str,
+    dto: str,
+) -> str:
+    """
+    List context API.
+
+    Parameters
+    ----------
+    proj : str
+        Name of the project.
+    dto : str
+        The name of the DTO.
+
+    Returns
+    -------
+    str
+        The API string formatted.
+    """
+    return f"{API_CONTEXT}/{proj}/{dto}"
+
+
 def api_ctx_read(
     proj: str,
     dto: str,
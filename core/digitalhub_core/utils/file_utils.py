@@ -0,0 +1,120 @@
+"""
+File utilities module.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Literal
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# Linux ioctl request to clone a file (reflink), from linux/fs.h
+FICLONE = 0x40049409
+
+# Buffer size for plain copies
+COPY_BUFSIZE = 1024**2
+
+
+def link_or_copy(
+    src: str | Path,
+    dst: str | Path,
+    strategy: Literal["link", "clone", "copy"] = "clone",
+) -> str:
+    """
+    Make a file available at destination path with the cheapest available
+    operation. With the "link" strategy the file is hardlinked, falling back
+    to a clone if source and destination are on different filesystems. With
+    the "clone" strategy the file is reflinked or copied in kernel space
+    (copy_file_range), falling back to a plain copy. The "copy" strategy
+    always copies the file.
+    Hardlinked files share their content with the source file, so they must
+    not be modified in place.
+
+    Parameters
+    ----------
+    src : str | Path
+        Source file.
+    dst : str | Path
+        Destination file or directory. If it is a directory, the file is
+        placed inside it with the source name.
+    strategy : Literal["link", "clone", "copy"]
+        Strategy to use.
+
+    Returns
+    -------
+    str
+        Destination file path.
+    """
+    src, dst = Path(src), Path(dst)
+    if dst.is_dir():
+        dst = dst / src.name
+
+    if strategy == "copy":
+        return str(shutil.copy(src, dst))
+
+    if dst.exists():
+        if os.path.samefile(src, dst):
+            return str(dst)
+        dst.unlink()
+
+    if strategy == "link":
+        try:
+            os.link(src, dst)
+            return str(dst)
+        except OSError:
+            pass
+
+    clone_file(src, dst)
+    shutil.copymode(src, dst)
+    return str(dst)
+
+
+def clone_file(src: str | Path, dst: str | Path) -> None:
+    """
+    Copy a file content trying, in order, a reflink (copy-on-write clone,
+    supported by e.g. btrfs and XFS), an in-kernel copy_file_range and a
+    plain buffered copy.
+
+    Parameters
+    ----------
+    src : str | Path
+        Source file.
+    dst : str | Path
+        Destination file.
+
+    Returns
+    -------
+    None
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass
+
+        if hasattr(os, "copy_file_range"):
+            size = os.fstat(fsrc.fileno()).st_size
+            copied = 0
+            try:
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+                if copied >= size:
+                    return
+            except OSError:
+                pass
+            # Restart from scratch with a plain copy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
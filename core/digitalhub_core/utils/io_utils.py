@@ -3,10 +3,21 @@ Common IO utils.
 """
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import yaml
 
+# Use libyaml bindings if available
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# Suffixes of the files read and written as JSON
+JSON_SUFFIXES = (".json",)
+
 ####################
 # Writers
 ####################
@@ -29,10 +40,51 @@ def write_yaml(filepath: str | Path, obj: dict | list[dict]) -> None:
     """
     if isinstance(obj, list):
         with open(filepath, "w", encoding="utf-8") as out_file:
-            yaml.dump_all(obj, out_file, sort_keys=False, default_flow_style=False)
+            yaml.dump_all(obj, out_file, Dumper=SafeDumper, sort_keys=False, default_flow_style=False)
     else:
         with open(filepath, "w", encoding="utf-8") as out_file:
-            yaml.dump(obj, out_file, sort_keys=False)
+            yaml.dump(obj, out_file, Dumper=SafeDumper, sort_keys=False)
+
+
+def write_json(filepath: str | Path, obj: dict | list[dict]) -> None:
+    """
+    Write a dict or a list of dict to a json file.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        The json file path to write.
+    obj : dict
+        The dict to write.
+
+    Returns
+    -------
+    None
+    """
+    with open(filepath, "w", encoding="utf-8") as out_file:
+        json.dump(obj, out_file, default=str)
+
+
+def write_file(filepath: str | Path, obj: dict | list[dict]) -> None:
+    """
+    Write a dict or a list of dict to a json file if the file has a
+    json suffix, to a yaml file otherwise.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        The file path to write.
+    obj : dict
+        The dict to write.
+
+    Returns
+    -------
+    None
+    """
+    if Path(filepath).suffix.lower() in JSON_SUFFIXES:
+        write_json(filepath, obj)
+    else:
+        write_yaml(filepath, obj)
 
 
 ####################
@@ -54,17 +106,53 @@ def read_yaml(filepath: str | Path) -> dict | list[dict]:
     dict | list[dict]
         The yaml file content.
     """
-    try:
-        with open(filepath, "r", encoding="utf-8") as in_file:
-            data = yaml.load(in_file, Loader=yaml.SafeLoader)
-
-    # If yaml contains multiple documents
-    except yaml.composer.ComposerError:
-        with open(filepath, "r", encoding="utf-8") as in_file:
-            data = list(yaml.load_all(in_file, Loader=yaml.SafeLoader))
+    with open(filepath, "r", encoding="utf-8") as in_file:
+        data = list(yaml.load_all(in_file, Loader=SafeLoader))
+
+    # If yaml contains a single document
+    if len(data) < 2:
+        return data[0] if data else None
     return data
 
 
+def read_json(filepath: str | Path) -> dict | list[dict]:
+    """
+    Read a json file and return a dict or a list of dict.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        The json file path to read.
+
+    Returns
+    -------
+    dict | list[dict]
+        The json file content.
+    """
+    with open(filepath, "r", encoding="utf-8") as in_file:
+        return json.load(in_file)
+
+
+def read_file(filepath: str | Path) -> dict | list[dict]:
+    """
+    Read a json file if the file has a json suffix, a yaml file
+    otherwise.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        The file path to read.
+
+    Returns
+    -------
+    dict | list[dict]
+        The file content.
+    """
+    if Path(filepath).suffix.lower() in JSON_SUFFIXES:
+        return read_json(filepath)
+    return read_yaml(filepath)
+
+
 def read_text(filepath: str | Path) -> str:
     """
     Read a file and return the text.
@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from digitalhub_core.client.objects.dhcore import ClientDHCore
+from digitalhub_core.utils.exceptions import BackendError
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("DIGITALHUB_CORE_ENDPOINT", "http://localhost:8080")
+    return ClientDHCore({"endpoint": "http://localhost:8080", "timeout": 5, "max_retries": 2})
+
+
+def test_session_cached(client):
+    session = client._get_session()
+    assert client._get_session() is session
+    retry = session.get_adapter("http://localhost:8080").max_retries
+    assert retry.total == 2
+    assert "POST" not in retry.allowed_methods
+    assert "GET" in retry.allowed_methods
+
+
+def test_call_timeout(client):
+    session = MagicMock()
+    session.request.return_value.json.return_value = {"id": "id"}
+    with patch.object(client, "_get_session", return_value=session):
+        assert client.read_object("/api/v1/projects/test") == {"id": "id"}
+        client._call("GET", "/api/v1/projects/test", timeout=1)
+    assert session.request.call_args_list[0].kwargs["timeout"] == 5
+    assert session.request.call_args_list[1].kwargs["timeout"] == 1
+    session.request.assert_called_with("GET", "http://localhost:8080/api/v1/projects/test", timeout=1)
+
+
+def test_call_error(client):
+    session = MagicMock()
+    session.request.side_effect = requests.exceptions.ConnectionError
+    with patch.object(client, "_get_session", return_value=session), pytest.raises(BackendError):
+        client.read_object("/api/v1/projects/test")
+
+
+def test_read_object_conditional(client):
+    session = MagicMock()
+    session.request.return_value.status_code = 304
+    with patch.object(client, "_get_session", return_value=session):
+        assert client.read_object_conditional("/api/v1/projects/test", '"v1"') == (None, '"v1"')
+    assert session.request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    session.request.return_value.status_code = 200
+    session.request.return_value.headers = {"ETag": '"v2"'}
+    session.request.return_value.json.return_value = {"id": "id"}
+    with patch.object(client, "_get_session", return_value=session):
+        assert client.read_object_conditional("/api/v1/projects/test") == ({"id": "id"}, '"v2"')
+    assert "headers" not in session.request.call_args.kwargs
+
+
+def test_list_objects(client):
+    pages = [
+        {"content": [{"id": "1"}, {"id": "2"}], "last": False},
+        {"content": [{"id": "3"}], "last": True},
+    ]
+    with patch.object(client, "_call", side_effect=pages) as mock_call:
+        objs = client.list_objects("/api/v1/-/test/runs", filters={"state": "COMPLETED"}, page_size=2)
+        assert next(objs) == {"id": "1"}
+        assert mock_call.call_count == 1
+        assert [obj["id"] for obj in objs] == ["2", "3"]
+    assert mock_call.call_count == 2
+    assert mock_call.call_args.kwargs["params"] == {"state": "COMPLETED", "size": 2, "page": 1}
@@ -0,0 +1,67 @@
+import asyncio
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from digitalhub_core.client.objects.dhcore_async import AsyncClientDHCore
+from digitalhub_core.utils.exceptions import BackendError
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("DIGITALHUB_CORE_ENDPOINT", "http://localhost:8080")
+    return AsyncClientDHCore({"endpoint": "http://localhost:8080", "timeout": 5, "max_retries": 2, "backoff_factor": 0})
+
+
+def test_build_session_requires_httpx(client):
+    with patch.dict(sys.modules, {"httpx": None}), pytest.raises(ImportError):
+        client._build_session()
+
+
+def test_call_retries(client):
+    httpx = pytest.importorskip("httpx")
+    ok = MagicMock(status_code=200)
+    ok.json.return_value = {"id": "id"}
+    session = MagicMock()
+    session.request = AsyncMock(side_effect=[httpx.ConnectError("down"), MagicMock(status_code=503), ok])
+    with patch.object(client, "_get_session", return_value=session):
+        assert asyncio.run(client.read_object("/api/v1/projects/test")) == {"id": "id"}
+    assert session.request.await_count == 3
+    assert session.request.call_args.kwargs["timeout"] == 5
+
+
+def test_call_not_retried(client):
+    httpx = pytest.importorskip("httpx")
+    session = MagicMock()
+    session.request = AsyncMock(side_effect=httpx.ConnectError("down"))
+    with patch.object(client, "_get_session", return_value=session), pytest.raises(BackendError):
+        asyncio.run(client.create_object({}, "/api/v1/projects"))
+    assert session.request.await_count == 1
+
+
+def test_session_per_loop(client):
+    async def get_session():
+        session = client._get_session()
+        assert client._get_session() is session
+        await client.aclose()
+        return session
+
+    with patch.object(client, "_build_session", side_effect=lambda: MagicMock(aclose=AsyncMock())):
+        first = asyncio.run(get_session())
+        second = asyncio.run(get_session())
+
+    assert first is not second
+    first.aclose.assert_awaited_once()
+    second.aclose.assert_awaited_once()
+    assert len(client._sessions) == 0
+
+
+def test_list_objects(client):
+    pages = [{"content": [{"id": "a"}, {"id": "b"}], "last": False}, {"content": [{"id": "c"}], "last": True}]
+
+    async def list_ids():
+        return [obj["id"] async for obj in client.list_objects("/api/v1/-/test/runs", page_size=2)]
+
+    with patch.object(client, "_call", AsyncMock(side_effect=pages)) as mock_call:
+        assert asyncio.run(list_ids()) == ["a", "b", "c"]
+    assert mock_call.await_count == 2
@@ -36,7 +36,70 @@ def test_read_object(client, api_base, api_context):
     assert actual_result == expected_result
 
     expected_result = {"id": "test", "name": "test"}
-    client._db.setdefault(FUNC, {}).setdefault("test", {}).setdefault("test", expected_result)
+    client._db.setdefault(FUNC, {}).setdefault(("test", "test"), {}).setdefault("test", expected_result)
     api = f"{api_context}/test/{FUNC}/test/test"
     actual_result = client.read_object(api)
     assert actual_result == expected_result
+
+
+def test_list_objects(client, api_context):
+    for i, state in enumerate(["COMPLETED", "ERROR", "COMPLETED"]):
+        obj = {"id": f"run-{i}", "project": "test", "kind": "job", "status": {"state": state}}
+        client.create_object(obj, f"{api_context}/test/{RUNS}")
+    client.create_object({"id": "other", "project": "other"}, f"{api_context}/other/{RUNS}")
+
+    objs = client.list_objects(f"{api_context}/test/{RUNS}")
+    assert [obj["id"] for obj in objs] == ["run-0", "run-1", "run-2"]
+    objs = client.list_objects(f"{api_context}/test/{RUNS}", filters={"state": "COMPLETED"})
+    assert [obj["id"] for obj in objs] == ["run-0", "run-2"]
+
+
+def test_latest_pointer(client, api_context):
+    for uuid in ("v1", "v2"):
+        client.create_object({"id": uuid, "name": "func", "project": "test"}, f"{api_context}/test/{FUNC}")
+    assert client.read_object(f"{api_context}/test/{FUNC}/func/latest")["id"] == "v2"
+
+    client.delete_object(f"{api_context}/test/{FUNC}/func/v2")
+    assert client.read_object(f"{api_context}/test/{FUNC}/func/latest")["id"] == "v1"
+
+    client.delete_object(f"{api_context}/test/{FUNC}/func/v1")
+    assert list(client.list_objects(f"{api_context}/test/{FUNC}")) == []
+
+
+def test_project_spec_indexed(client, api_base, api_context):
+    client.create_object({"name": "test", "spec": {}}, f"{api_base}/{PROJ}")
+    client.create_object({"name": "other", "spec": {}}, f"{api_base}/{PROJ}")
+    func = {"id": "v1", "name": "func", "project": "test", "metadata": {"embedded": False}, "spec": {}}
+    client.create_object(func, f"{api_context}/test/{FUNC}")
+    client.create_object({"id": "v1", "name": "func-2", "project": "other"}, f"{api_context}/other/{FUNC}")
+
+    project = client.read_object(f"{api_base}/{PROJ}/test")
+    assert project["spec"][FUNC] == [{"id": "v1", "name": "func", "project": "test", "metadata": {"embedded": False}}]
+    assert client._db[PROJ]["test"]["spec"] == {}
+
+
+def test_same_name_in_projects(client, api_base, api_context):
+    for project in ("a", "b"):
+        client.create_object({"name": project, "spec": {}}, f"{api_base}/{PROJ}")
+        client.create_object(
+            {"id": f"{project}-v1", "name": "f", "project": project}, f"{api_context}/{project}/{FUNC}"
+        )
+
+    assert client.read_object(f"{api_context}/a/{FUNC}/f/latest")["id"] == "a-v1"
+    project = client.read_object(f"{api_base}/{PROJ}/a")
+    assert project["spec"][FUNC] == [{"id": "a-v1", "name": "f", "project": "a"}]
+
+    # The project spec does not expose the stored objects
+    project["spec"][FUNC][0]["name"] = "changed"
+    assert client.read_object(f"{api_context}/a/{FUNC}/f/a-v1")["name"] == "f"
+
+    client.delete_object(f"{api_context}/b/{FUNC}/f/b-v1")
+    assert client.read_object(f"{api_context}/a/{FUNC}/f/latest")["id"] == "a-v1"
+
+
+def test_copy_on_read(api_context):
+    client = ClientLocal(copy_on_read=True)
+    client.create_object({"id": "v1", "name": "func", "project": "test"}, f"{api_context}/test/{FUNC}")
+    obj = client.read_object(f"{api_context}/test/{FUNC}/func/v1")
+    obj["name"] = "changed"
+    assert client.read_object(f"{api_context}/test/{FUNC}/func/v1")["name"] == "func"
@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+from digitalhub_core.client.objects.local_sqlite import ClientLocalSQLite
+from digitalhub_core.utils.exceptions import BackendError
+
+FUNC = "functions"
+PROJ = "projects"
+RUNS = "runs"
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = ClientLocalSQLite(tmp_path / "db.sqlite")
+    yield client
+    client.close()
+
+
+def test_crud(client, api_base, api_context):
+    client.create_object({"name": "test", "spec": {}}, f"{api_base}/{PROJ}")
+    with pytest.raises(BackendError):
+        client.create_object({"name": "test"}, f"{api_base}/{PROJ}")
+
+    for uuid in ("v1", "v2"):
+        func = {"id": uuid, "name": "func", "project": "test", "metadata": {"embedded": True}}
+        client.create_object(func, f"{api_context}/test/{FUNC}")
+    assert client.read_object(f"{api_context}/test/{FUNC}/func/latest")["id"] == "v2"
+
+    client.update_object({"id": "v1", "name": "func", "updated": True}, f"{api_context}/test/{FUNC}/func/v1")
+    assert client.read_object(f"{api_context}/test/{FUNC}/func/v1")["updated"]
+
+    project = client.read_object(f"{api_base}/{PROJ}/test")
+    assert [obj["id"] for obj in project["spec"][FUNC]] == ["v2"]
+
+    client.delete_object(f"{api_context}/test/{FUNC}/func/v2")
+    assert client.read_object(f"{api_context}/test/{FUNC}/func/latest")["id"] == "v1"
+    client.delete_object(f"{api_context}/test/{FUNC}/func?cascade=true")
+    with pytest.raises(BackendError):
+        client.read_object(f"{api_context}/test/{FUNC}/func/latest")
+
+
+def test_runs(client, api_context):
+    client.create_object({"id": "run", "project": "test", "status": {"state": "RUNNING"}}, f"{api_context}/test/{RUNS}")
+    client.update_object(
+        {"id": "run", "project": "test", "status": {"state": "COMPLETED"}}, f"{api_context}/test/{RUNS}/run"
+    )
+    assert client.read_object(f"{api_context}/test/{RUNS}/run")["status"]["state"] == "COMPLETED"
+    objs = client.list_objects(f"{api_context}/test/{RUNS}", filters={"state": "COMPLETED"})
+    assert [obj["id"] for obj in objs] == ["run"]
+
+
+def test_persistence_and_threads(client, api_context):
+    def create(i):
+        client.create_object({"id": f"v{i}", "name": f"func-{i}", "project": "test"}, f"{api_context}/test/{FUNC}")
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reopened = ClientLocalSQLite(client.path)
+    assert len(list(reopened.list_objects(f"{api_context}/test/{FUNC}"))) == 8
+    reopened.close()
+
+
+def test_same_name_in_projects(client, api_base, api_context):
+    for project in ("a", "b"):
+        client.create_object({"name": project, "spec": {}}, f"{api_base}/{PROJ}")
+        client.create_object(
+            {"id": f"{project}-v1", "name": "f", "project": project}, f"{api_context}/{project}/{FUNC}"
+        )
+
+    assert client.read_object(f"{api_context}/a/{FUNC}/f/latest")["id"] == "a-v1"
+    assert client.read_object(f"{api_context}/b/{FUNC}/f/latest")["id"] == "b-v1"
+    project = client.read_object(f"{api_base}/{PROJ}/a")
+    assert [obj["id"] for obj in project["spec"][FUNC]] == ["a-v1"]
+
+    client.delete_object(f"{api_context}/b/{FUNC}/f/b-v1")
+    assert client.read_object(f"{api_context}/a/{FUNC}/f/latest")["id"] == "a-v1"
+
+
+def test_concurrent_create(tmp_path, api_base):
+    path = tmp_path / "db.sqlite"
+    barrier = threading.Barrier(4)
+    created = []
+    errors = []
+
+    def create(i):
+        client = ClientLocalSQLite(path)
+        barrier.wait()
+        try:
+            client.create_object({"name": "p", "spec": {"n": i}}, f"{api_base}/{PROJ}")
+            created.append(i)
+        except BackendError:
+            errors.append(i)
+        client.close()
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1 and len(errors) == 3
+    reopened = ClientLocalSQLite(path)
+    assert reopened.read_object(f"{api_base}/{PROJ}/p")["spec"]["n"] == created[0]
+    reopened.close()
@@ -1,7 +1,14 @@
 import os
 from unittest import mock
 
-from digitalhub_core.client.builder import ClientBuilder, ClientDHCore, ClientLocal, client_builder, get_client
+from digitalhub_core.client.builder import (
+    ClientBuilder,
+    ClientDHCore,
+    ClientLocal,
+    ClientLocalSQLite,
+    client_builder,
+    get_client,
+)
 
 
 @mock.patch.dict(os.environ, {"DIGITALHUB_CORE_ENDPOINT": "http://localhost:8000"})
@@ -52,3 +59,9 @@ def test_get_client_same_instance():
 
     # Reset client_builder instance
     client_builder._dhcore_client = None
+
+
+def test_client_builder_local_sqlite(tmp_path):
+    with mock.patch.dict(os.environ, {"DIGITALHUB_CORE_LOCAL_DB": str(tmp_path / "db.sqlite")}):
+        local_client = ClientBuilder().build(local=True)
+    assert isinstance(local_client, ClientLocalSQLite)
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from digitalhub_core.context.cache import ReadCache
+
+API = "/api/v1/-/test"
+
+
+def make_client(etag=None):
+    client = MagicMock()
+    client.read_object_conditional.side_effect = lambda api, tag: (
+        (None, tag) if tag is not None else ({"api": api}, etag)
+    )
+    return client
+
+
+def test_immutable_read_cached():
+    cache = ReadCache()
+    client = make_client()
+    api = f"{API}/functions/func/uuid"
+    obj = cache.read(api, client)
+    obj["changed"] = True
+    assert cache.read(api, client) == {"api": api}
+    assert client.read_object_conditional.call_count == 1
+    assert cache.info() == {"hits": 1, "misses": 1, "revalidations": 0, "size": 1}
+
+
+def test_latest_read_revalidated():
+    cache = ReadCache()
+    client = make_client(etag='"v1"')
+    api = f"{API}/functions/func/latest"
+    cache.read(api, client)
+    assert cache.read(api, client) == {"api": api}
+    client.read_object_conditional.assert_called_with(api, '"v1"')
+    assert cache.info()["revalidations"] == 1
+
+
+def test_read_without_etag_not_cached():
+    cache = ReadCache()
+    client = make_client()
+    cache.read(f"{API}/runs/run-id", client)
+    cache.read(f"{API}/runs/run-id", client)
+    assert client.read_object_conditional.call_count == 2
+    assert cache.info()["size"] == 0
+
+
+def test_invalidate():
+    cache = ReadCache()
+    client = make_client()
+    for api in ("functions/func/uuid", "functions/func-2/uuid", "tasks/task-id"):
+        cache.read(f"{API}/{api}", client)
+    cache.invalidate(f"{API}/functions/func/uuid?cascade=true")
+    cache.invalidate(f"{API}/tasks", keep_immutable=True)
+    assert cache.info()["size"] == 2
+    cache.invalidate(f"{API}/tasks/task-id")
+    assert cache.info()["size"] == 1
+
+
+def test_eviction():
+    cache = ReadCache(max_entries=2)
+    client = make_client()
+    for name in ("a", "b", "a", "c"):
+        cache.read(f"{API}/functions/{name}/uuid", client)
+    assert list(cache._entries) == [f"{API}/functions/a/uuid", f"{API}/functions/c/uuid"]
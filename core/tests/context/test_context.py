@@ -1,3 +1,6 @@
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
 from digitalhub_core.context.context import Context
 
@@ -36,3 +39,44 @@ def test_delete_object(context, api_base):
     context.create_object(obj, api)
     api = f"{api_base}/runs/4?cascade=false"
     assert context.delete_object(api) == {"deleted": obj}
+
+
+def test_read_object_async(context, api_context):
+    obj = {"name": "test-async", "id": "5"}
+    api = f"{api_context}/test/artifacts"
+    asyncio.run(context.create_object_async(obj, api))
+    api = f"{api_context}/test/artifacts/test-async/5"
+    assert asyncio.run(context.read_object_async(api)) == obj
+
+
+def test_read_objects(context, api_context):
+    for i in range(2):
+        obj = {"name": f"test-batch-{i}", "id": str(i)}
+        context.create_object(obj, f"{api_context}/test/artifacts")
+    apis = [f"{api_context}/test/artifacts/test-batch-{i}/{i}" for i in (1, 0, 1)]
+    objs = context.read_objects(apis)
+    assert [obj["id"] for obj in objs] == ["1", "0", "1"]
+
+
+def test_read_objects_concurrent(monkeypatch):
+    monkeypatch.setenv("DIGITALHUB_CORE_READ_CACHE_SIZE", "0")
+    project = MagicMock()
+    project._client.is_local.return_value = False
+    project._client.read_object.side_effect = lambda api: {"api": api}
+    context = Context(project)
+    apis = ["a", "b", "a", "c"]
+    assert context.read_objects(apis, max_workers=2) == [{"api": api} for api in apis]
+    assert project._client.read_object.call_count == 3
+
+
+def test_read_cache_invalidated_on_update():
+    project = MagicMock()
+    project._client.is_local.return_value = False
+    project._client.read_object_conditional.return_value = ({"v": 1}, None)
+    context = Context(project)
+    api = "/api/v1/-/test/functions/func/uuid"
+    context.read_object(api)
+    context.read_object(api)
+    context.update_object({"v": 2}, api)
+    context.read_object(api)
+    assert project._client.read_object_conditional.call_count == 2
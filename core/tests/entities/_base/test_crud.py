@@ -0,0 +1,26 @@
+from unittest.mock import MagicMock, patch
+
+from digitalhub_core.entities._base.crud import get_entities_from_keys
+
+
+def test_get_entities_from_keys():
+    contexts = {}
+
+    def get_context(project):
+        ctx = contexts.setdefault(project, MagicMock())
+        ctx.read_objects.side_effect = lambda apis, max_workers=None: [{"api": api} for api in apis]
+        return ctx
+
+    keys = [
+        "store://a/artifacts/artifact/x:1",
+        "store://b/artifacts/artifact/y:2",
+        "store://a/artifacts/artifact/x:1",
+        "store://a/artifacts/artifact/z:3",
+    ]
+    with patch("digitalhub_core.entities._base.crud.get_context", side_effect=get_context):
+        entities = get_entities_from_keys(keys, "artifacts", lambda obj, lazy: (obj["api"], lazy), lazy=True)
+
+    assert [e[0].rsplit("/", 2)[-2] for e in entities] == ["x", "y", "x", "z"]
+    assert all(e[1] for e in entities)
+    assert len(contexts["a"].read_objects.call_args.args[0]) == 2
+    assert len(contexts["b"].read_objects.call_args.args[0]) == 1
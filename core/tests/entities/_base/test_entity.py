@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import pytest
+from digitalhub_core.entities._base.entity import Entity
+from digitalhub_core.entities.artifacts.entity import Artifact
+from digitalhub_core.entities.artifacts.spec import ArtifactSpec
+
+ARTIFACT = {
+    "id": "uuid",
+    "project": "test",
+    "name": "artifact",
+    "kind": "artifact",
+    "metadata": {"project": "test", "name": "artifact", "created": "2024-01-01T00:00:00"},
+    "spec": {"target_path": "s3://bucket/file.csv"},
+    "status": {"state": "CREATED"},
+}
+
+
+def test_from_dict_lazy():
+    with patch("digitalhub_core.entities._builders.spec._build_spec", wraps=lambda *a, **k: None) as mock_build:
+        Artifact.from_dict(ARTIFACT, lazy=True)
+        mock_build.assert_not_called()
+
+    artifact = Artifact.from_dict(ARTIFACT, lazy=True)
+    assert "spec" not in artifact.__dict__
+    assert isinstance(artifact.spec, ArtifactSpec)
+    assert artifact.spec.target_path == "s3://bucket/file.csv"
+    assert artifact.spec is artifact.spec
+
+
+def test_from_dict_lazy_to_dict():
+    artifact = Artifact.from_dict(ARTIFACT, lazy=True)
+    assert artifact.to_dict() == Artifact.from_dict(ARTIFACT).to_dict()
+
+
+def test_from_dict_lazy_spec_replaced():
+    artifact = Artifact.from_dict(ARTIFACT, lazy=True)
+    artifact.spec = ArtifactSpec(target_path="s3://bucket/other.csv")
+    assert artifact.to_dict()["spec"]["target_path"] == "s3://bucket/other.csv"
+
+
+def test_from_dict_lazy_validation_on_access():
+    artifact = Artifact.from_dict({**ARTIFACT, "spec": {"size": "large"}}, lazy=True)
+    with pytest.raises(ValueError) as err:
+        _ = artifact.spec
+    assert "size" in str(err.value)
+    with pytest.raises(AttributeError) as err:
+        _ = artifact.missing
+    assert "missing" in str(err.value)
+
+
+def test_obj_attr_not_shared():
+    Artifact.from_dict(ARTIFACT)
+    Artifact.from_dict(ARTIFACT)
+    assert Artifact._obj_attr == ["kind", "metadata", "spec", "status", "project", "name", "id"]
+    assert Entity._obj_attr == ["kind", "metadata", "spec", "status"]
@@ -0,0 +1,28 @@
+from unittest.mock import patch
+
+import pytest
+from digitalhub_core.entities._builders.spec import build_spec, clear_spec_cache, resolve_spec_classes
+from digitalhub_core.entities.artifacts.spec import ArtifactSpec
+
+
+def test_resolve_spec_classes_cached():
+    clear_spec_cache()
+    with patch(
+        "digitalhub_core.entities._builders.spec.check_layer_existence",
+        wraps=lambda layer: None,
+    ) as mock_check:
+        spec = build_spec("artifact", layer_digitalhub="digitalhub_core", path="s3://bucket/file.csv")
+        build_spec("artifact", layer_digitalhub="digitalhub_core", path="s3://bucket/file.csv")
+        assert mock_check.call_count == 1
+
+        clear_spec_cache()
+        resolve_spec_classes("artifact", "digitalhub_core")
+        assert mock_check.call_count == 2
+    assert isinstance(spec, ArtifactSpec)
+
+
+def test_resolve_spec_classes_errors_not_cached():
+    clear_spec_cache()
+    with pytest.raises(ValueError):
+        resolve_spec_classes("missing", "digitalhub_core")
+    assert resolve_spec_classes.cache_info().currsize == 0
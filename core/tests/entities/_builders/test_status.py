@@ -0,0 +1,11 @@
+from digitalhub_core.entities._builders.status import build_status, clear_status_cache, resolve_status_class
+from digitalhub_core.entities.artifacts.status import ArtifactStatus
+
+
+def test_resolve_status_class_cached():
+    clear_status_cache()
+    status = build_status("artifact", layer_digitalhub="digitalhub_core")
+    build_status("artifact", layer_digitalhub="digitalhub_core", state="READY")
+    assert isinstance(status, ArtifactStatus)
+    info = resolve_status_class.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
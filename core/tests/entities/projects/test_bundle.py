@@ -0,0 +1,65 @@
+import json
+import tarfile
+
+import pytest
+from digitalhub_core.entities.projects.bundle import (
+    INDEX_FILE,
+    read_bundle,
+    read_project_file,
+    write_bundle,
+)
+from digitalhub_core.entities.projects.crud import get_or_create_project, import_project
+from digitalhub_core.utils.exceptions import EntityError
+from digitalhub_core.utils.io_utils import write_yaml
+
+PROJECT = {"name": "test", "kind": "project", "spec": {"artifacts": [{"name": "a", "id": "1"}]}}
+OBJECTS = {"artifacts": [{"name": "a", "id": "1", "spec": {"target_path": "s3://bucket/a.csv"}}], "functions": []}
+
+
+def test_bundle_roundtrip(tmp_path):
+    path = tmp_path / "bundle.tar.gz"
+    write_bundle(path, PROJECT, OBJECTS)
+    assert read_bundle(path) == (PROJECT, OBJECTS)
+
+    with tarfile.open(path, "r:gz") as tar:
+        index = json.load(tar.extractfile(INDEX_FILE))
+    assert index["objects"]["artifacts"] == {"file": "artifacts.jsonl", "count": 1}
+
+
+def test_read_bundle_unsupported_format(tmp_path):
+    path = tmp_path / "bundle.tar.gz"
+    with tarfile.open(path, "w:gz") as tar:
+        index = tmp_path / INDEX_FILE
+        index.write_text(json.dumps({"format": 0}))
+        tar.add(index, arcname=INDEX_FILE)
+    with pytest.raises(EntityError):
+        read_bundle(path)
+
+
+def test_read_project_file(tmp_path):
+    yaml_path = tmp_path / "project.yml"
+    write_yaml(yaml_path, PROJECT)
+    assert read_project_file(yaml_path) == PROJECT
+
+    bundle_path = tmp_path / "bundle.tar.gz"
+    write_bundle(bundle_path, PROJECT, OBJECTS)
+    obj = read_project_file(bundle_path)
+    assert obj["spec"]["artifacts"] == OBJECTS["artifacts"]
+    assert obj["spec"]["functions"] == []
+
+
+def test_export_import_bundle(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    project = get_or_create_project(name="test-bundle", local=True)
+    project.new_artifact(name="embedded", target_path="s3://bucket/embedded.csv", embedded=True)
+    project.new_artifact(name="referenced", target_path="s3://bucket/referenced.csv", embedded=False)
+
+    project.export(bundle=True)
+    imported = import_project(tmp_path / "test-bundle" / "project_test-bundle.tar.gz", local=True)
+    artifacts = {a.name: a for a in imported.spec.artifacts.entities()}
+    assert artifacts["referenced"].spec.target_path == "s3://bucket/referenced.csv"
+    assert artifacts["embedded"].spec.target_path == "s3://bucket/embedded.csv"
+
+    project.export()
+    assert (tmp_path / "test-bundle" / "project_test-bundle.yml").exists()
+    assert len(list((tmp_path / "test-bundle").glob("artifact_referenced_*.yml"))) == 1
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import pytest
+from digitalhub_core.context.context import Context
+from digitalhub_core.entities.artifacts.crud import list_artifacts
+from digitalhub_core.entities.artifacts.entity import Artifact
+from digitalhub_core.entities.projects.crud import get_or_create_project, get_project
+from digitalhub_core.entities.projects.objects import ProjectObjects
+from digitalhub_core.entities.projects.spec import ProjectSpec
+from digitalhub_core.utils.exceptions import EntityError
+
+
+@pytest.fixture
+def project():
+    project = get_or_create_project(name="test-objects", local=True)
+    project.new_artifact(name="embedded", target_path="s3://bucket/embedded.csv", embedded=True)
+    project.new_artifact(name="referenced", target_path="s3://bucket/referenced.csv", embedded=False)
+    return project
+
+
+def test_spec_objects(project):
+    artifacts = get_project("test-objects", local=True).spec.artifacts
+    assert isinstance(artifacts, ProjectObjects)
+    assert {a["name"] for a in artifacts} == {"embedded", "referenced"}
+    assert "spec" not in artifacts[[a["name"] for a in artifacts].index("referenced")]
+
+    spec_dict = ProjectSpec(artifacts=list(artifacts)).to_dict()
+    assert type(spec_dict["artifacts"]) is list
+
+
+def test_get_resolves_once(project):
+    artifacts = get_project("test-objects", local=True).spec.artifacts
+    with patch.object(Context, "read_objects", side_effect=Context.read_objects, autospec=True) as mock_read:
+        embedded = artifacts.get("embedded")
+        assert mock_read.call_count == 0
+        referenced = artifacts.get("referenced")
+        assert artifacts.get("referenced") is referenced
+        assert mock_read.call_count == 1
+    assert isinstance(embedded, Artifact)
+    assert referenced.spec.target_path == "s3://bucket/referenced.csv"
+
+    with pytest.raises(EntityError):
+        artifacts.get("missing")
+
+
+def test_prefetch(project):
+    artifacts = get_project("test-objects", local=True).spec.artifacts
+    with patch.object(Context, "read_objects", side_effect=Context.read_objects, autospec=True) as mock_read:
+        artifacts.prefetch()
+        entities = artifacts.entities()
+        assert mock_read.call_count == 1
+    assert [e.name for e in entities] == [a["name"] for a in artifacts]
+
+
+def test_get_project_lazy(project):
+    lazy = get_project("test-objects", local=True, lazy=True)
+    assert "spec" not in lazy.__dict__
+    assert lazy.to_dict() == get_project("test-objects", local=True).to_dict()
+
+
+def test_bulk_reads_lazy(project):
+    entities = get_project("test-objects", local=True).spec.artifacts.entities(lazy=True)
+    assert all("spec" not in e.__dict__ for e in entities)
+    assert {e.spec.target_path for e in entities} == {"s3://bucket/embedded.csv", "s3://bucket/referenced.csv"}
+
+    listed = list(list_artifacts("test-objects", lazy=True))
+    assert listed and all("spec" not in e.__dict__ for e in listed)
@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from digitalhub_core.entities.functions.entity import Function
+from digitalhub_core.entities.runs.futures import RunFuture, get_executor, submit_run, wait_all
+
+
+class FakeRun:
+    def __init__(self, project, uuid, states):
+        self.project = project
+        self.id = uuid
+        self.states = list(states)
+        self.status = SimpleNamespace(state=self.states.pop(0))
+
+    def _refresh_from_dict(self, obj):
+        self.status = SimpleNamespace(state=obj["status"]["state"])
+
+
+@pytest.fixture
+def context():
+    runs = {}
+
+    def read_objects(apis):
+        objs = []
+        for api in apis:
+            run = runs[api.rsplit("/", 1)[-1]]
+            state = run.states.pop(0) if run.states else run.status.state
+            objs.append({"status": {"state": state}})
+        return objs
+
+    ctx = MagicMock()
+    ctx.read_objects.side_effect = read_objects
+    with patch("digitalhub_core.entities.runs.futures.get_context", return_value=ctx):
+        yield ctx, runs
+
+
+def test_wait_all_batches_reads(context):
+    ctx, runs = context
+    for i in range(3):
+        runs[f"run-{i}"] = FakeRun("test", f"run-{i}", ["RUNNING", "RUNNING", "COMPLETED"])
+    runs["done"] = FakeRun("test", "done", ["ERROR"])
+
+    result = wait_all(list(runs.values()), poll_interval=0.001)
+
+    assert [r.status.state for r in result] == ["COMPLETED"] * 3 + ["ERROR"]
+    assert ctx.read_objects.call_count == 2
+    assert all(len(call.args[0]) == 3 for call in ctx.read_objects.call_args_list)
+
+
+def test_wait_all_timeout(context):
+    _, runs = context
+    runs["run"] = FakeRun("test", "run", ["RUNNING"])
+    with pytest.raises(TimeoutError):
+        wait_all([runs["run"]], timeout=0.05, poll_interval=0.01)
+
+
+def test_wait_all_futures(context):
+    ctx, _ = context
+    run = FakeRun("test", "local", ["COMPLETED"])
+    future = RunFuture(run, get_executor().submit(lambda: run))
+
+    assert wait_all([future]) == [run]
+    assert future.done()
+    assert ctx.read_objects.call_count == 0
+
+
+def test_run_future_timeout():
+    future = RunFuture(FakeRun("test", "local", ["RUNNING"]), Future())
+    assert not future.done()
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0.01)
+
+
+def test_shared_executor():
+    assert get_executor() is get_executor()
+
+
+def test_local_runs_serialized():
+    active, overlaps = [], []
+
+    def execute():
+        active.append(1)
+        overlaps.append(len(active))
+        time.sleep(0.01)
+        active.pop()
+
+    futures = [get_executor().submit(execute) for _ in range(4)]
+    for future in futures:
+        future.result()
+    assert overlaps == [1] * 4
+
+
+def test_nested_local_run():
+    inner = MagicMock()
+    inner.run.return_value = inner
+    function = MagicMock()
+    function._tasks = {"job": MagicMock()}
+    function._tasks["job"].run.return_value = inner
+
+    # A queued local execution running a function locally and waiting for it
+    outer = MagicMock()
+    outer.run.side_effect = lambda: Function.run(function, "job", local_execution=True)
+
+    assert submit_run(outer).result(timeout=5) is inner
+    inner.build.assert_called_once()
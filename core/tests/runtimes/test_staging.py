@@ -0,0 +1,42 @@
+import threading
+import time
+
+import pytest
+from digitalhub_core.runtimes.staging import stage_inputs
+
+
+def test_stage_inputs_order_and_report():
+    tasks = {key: (lambda key=key, delay=delay: time.sleep(delay) or key) for key, delay in [("a", 0.03), ("b", 0)]}
+    results, report = stage_inputs(tasks)
+    assert list(results.items()) == [("a", "a"), ("b", "b")]
+    assert [r["key"] for r in report] == ["a", "b"]
+    assert report[0]["seconds"] >= 0.03
+
+
+def test_stage_inputs_bounded():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def task():
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.pop()
+
+    stage_inputs({str(i): task for i in range(10)}, max_workers=3)
+    assert max(peak) <= 3
+
+
+def test_stage_inputs_error():
+    def fail():
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        stage_inputs({"ok": lambda: 1, "ko": fail})
+
+
+def test_stage_inputs_empty():
+    assert stage_inputs({}) == ({}, [])
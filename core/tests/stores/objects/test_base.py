@@ -26,6 +26,15 @@ class TestStore(Store):
     def write_df(self, df: pd.DataFrame, dst: str | None = None, **kwargs) -> str:
         ...
 
+    def upload_dir(self, src: str, dst: str | None = None) -> list[dict]:
+        ...
+
+    def download_prefix(self, src: str, dst: str | None = None) -> list[dict]:
+        ...
+
+    def list(self, src: str) -> list[dict]:
+        ...
+
     def is_local(self) -> bool:
         ...
 
@@ -88,3 +97,21 @@ def test_read_df_parquet(tmp_path):
 def test_read_df_not_supported():
     with pytest.raises(ValueError, match="Format txt not supported."):
         Store.read_df("data.txt", "txt")
+
+
+def test_transfer_many(store):
+    transfers = [{"src": "a", "dst": "x/a", "size": 1}, {"src": "b", "dst": "x/b", "size": 2}]
+    manifest = store._transfer_many(lambda src, dst: f"done/{dst}", transfers, 2)
+    assert [i["dst"] for i in manifest] == ["done/x/a", "done/x/b"]
+    assert [i["size"] for i in manifest] == [1, 2]
+
+
+def test_scan_df_downloads_without_source(store, tmp_path):
+    tmp = tmp_path / "tmp"
+    tmp.mkdir()
+    pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]}).to_parquet(tmp / "data.parquet", index=False)
+    with patch.object(store, "download", return_value=str(tmp / "data.parquet")) as mock_download:
+        result = store.scan_df("s3://bucket/data.parquet", "parquet", columns=["B"], filters=[("A", "=", 2)])
+    mock_download.assert_called_once_with("s3://bucket/data.parquet")
+    assert result["B"].tolist() == [5]
+    assert not tmp.exists()
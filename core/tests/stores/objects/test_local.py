@@ -27,19 +27,27 @@ def test_upload_raises_not_implemented_error(local_store):
         local_store.upload("src", "dst")
 
 
-@patch("shutil.copy")
+@patch("digitalhub_core.stores.objects.local.link_or_copy")
 def test_fetch_artifact(mock_copy, local_store):
     assert local_store.fetch_artifact("src") == "src"
     mock_copy.return_value = "/tmp/dst"
     assert local_store.fetch_artifact("src", "/tmp/dst") == "/tmp/dst"
-    mock_copy.assert_called_once_with("src", "/tmp/dst")
+    mock_copy.assert_called_once_with("src", "/tmp/dst", "clone")
 
 
-@patch("shutil.copy")
+def test_fetch_artifact_mmap(local_store, tmp_path):
+    src = tmp_path / "model.bin"
+    src.write_bytes(b"weights")
+    mapped = local_store.fetch_artifact(str(src), str(tmp_path / "dst" / "model.bin"), as_mmap=True)
+    assert mapped[:] == b"weights"
+    mapped.close()
+
+
+@patch("digitalhub_core.stores.objects.local.link_or_copy")
 def test_persist_artifact(mock_copy, local_store):
     mock_copy.return_value = "/tmp/dst"
     assert local_store.persist_artifact("src", "/tmp/dst") == "/tmp/dst"
-    mock_copy.assert_called_once_with("src", "/tmp/dst")
+    mock_copy.assert_called_once_with("src", "/tmp/dst", "clone")
 
 
 @patch("pandas.DataFrame.to_parquet")
@@ -51,3 +59,47 @@ def test_write_df(mock_to_parquet, local_store):
 
 def test_is_local(local_store):
     assert local_store.is_local()
+
+
+def test_list(local_store, tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.csv").write_text("a")
+    (tmp_path / "sub" / "b.csv").write_text("bb")
+    listing = local_store.list(str(tmp_path))
+    assert [i["path"] for i in listing] == [str(tmp_path / "a.csv"), str(tmp_path / "sub" / "b.csv")]
+    assert [i["size"] for i in listing] == [1, 2]
+
+
+def test_upload_dir(tmp_path):
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.csv").write_text("a")
+    (src / "sub" / "b.csv").write_text("bb")
+    store = LocalStore("test_store", "local", LocalStoreConfig(path=str(tmp_path / "store")))
+    manifest = store.upload_dir(str(src))
+    assert [i["dst"] for i in manifest] == [
+        str(tmp_path / "store" / "src" / "a.csv"),
+        str(tmp_path / "store" / "src" / "sub" / "b.csv"),
+    ]
+    assert (tmp_path / "store" / "src" / "sub" / "b.csv").read_text() == "bb"
+
+
+def test_download_prefix(local_store, tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.csv").write_text("a")
+    manifest = local_store.download_prefix(str(tmp_path / "src"))
+    assert manifest[0]["dst"] == str(tmp_path / "src" / "a.csv")
+    manifest = local_store.download_prefix(str(tmp_path / "src"), str(tmp_path / "dst"))
+    assert (tmp_path / "dst" / "a.csv").read_text() == "a"
+
+
+def test_scan_df(local_store, tmp_path):
+    df = pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]})
+    df.to_parquet(tmp_path / "data.parquet", index=False)
+    df.to_csv(tmp_path / "data.csv", index=False)
+    for extension in ("parquet", "csv"):
+        result = local_store.scan_df(str(tmp_path / f"data.{extension}"), extension, ["A"], [("A", ">", 1)])
+        assert result["A"].tolist() == [2, 3]
+        assert list(result.columns) == ["A"]
+        batches = list(local_store.iter_df(str(tmp_path / f"data.{extension}"), extension, batch_size=2))
+        assert [len(i) for i in batches] == [2, 1]
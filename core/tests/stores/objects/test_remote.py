@@ -1,8 +1,10 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
+import requests
 from digitalhub_core.stores.objects.remote import RemoteStore, RemoteStoreConfig
+from digitalhub_core.utils.exceptions import StoreError
 
 
 @pytest.fixture
@@ -16,8 +18,9 @@ def test_init(remote_store):
     assert remote_store.type == "remote"
 
 
+@patch("digitalhub_core.stores.objects.remote.RemoteStore._get_fingerprint", return_value=None)
 @patch("digitalhub_core.stores.objects.remote.RemoteStore._download_file")
-def test_download(mock_download_file, remote_store):
+def test_download(mock_download_file, _, remote_store):
     mock_download_file.return_value = "dst.csv"
     assert remote_store.download("http://test.com/src.csv", "dst.csv") == "dst.csv"
     mock_download_file.assert_called_once_with("http://test.com/src.csv", "dst.csv")
@@ -47,3 +50,163 @@ def test_write_df_raises_not_implemented_error(remote_store):
 
 def test_is_local(remote_store):
     assert not remote_store.is_local()
+
+
+def test_bulk_methods_raise_not_implemented_error(remote_store):
+    with pytest.raises(NotImplementedError):
+        remote_store.upload_dir("src", "dst")
+    with pytest.raises(NotImplementedError):
+        remote_store.download_prefix("src", "dst")
+    with pytest.raises(NotImplementedError):
+        remote_store.list("src")
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, headers: dict, status_code: int = 200):
+        self.content = content
+        self.headers = headers
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(self.status_code)
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeSession:
+    def __init__(self, content: bytes, ranges: bool = True, etag: str = '"v1"'):
+        self.content = content
+        self.ranges = ranges
+        self.etag = etag
+        self.requested = []
+
+    def head(self, url, **kwargs):
+        headers = {"Content-Length": str(len(self.content)), "ETag": self.etag}
+        if self.ranges:
+            headers["Accept-Ranges"] = "bytes"
+        return FakeResponse(b"", headers)
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        rng = headers.get("Range")
+        self.requested.append(rng)
+        # If-Range with a weak validator never matches (RFC 9110)
+        if rng is None or not self.ranges or headers.get("If-Range", "").startswith("W/"):
+            return FakeResponse(self.content, {})
+        start, end = rng[len("bytes=") :].split("-")
+        if int(start) >= len(self.content):
+            return FakeResponse(b"", {}, 416)
+        end = int(end) if end else len(self.content) - 1
+        return FakeResponse(self.content[int(start) : end + 1], {}, 206)
+
+
+def test_download_file_stream(remote_store, tmp_path):
+    session = FakeSession(b"0123456789", ranges=False)
+    dst = str(tmp_path / "data.csv")
+    with patch.object(remote_store, "_get_session", return_value=session):
+        assert remote_store._download_file("http://test.com/data.csv", dst) == dst
+    assert (tmp_path / "data.csv").read_bytes() == b"0123456789"
+    assert not (tmp_path / "data.csv.part").exists()
+
+
+def test_download_file_resume(remote_store, tmp_path):
+    session = FakeSession(b"0123456789")
+    (tmp_path / "data.csv.part").write_bytes(b"0123")
+    dst = str(tmp_path / "data.csv")
+    with patch.object(remote_store, "_get_session", return_value=session):
+        remote_store._download_file("http://test.com/data.csv", dst)
+    assert session.requested == ["bytes=4-"]
+    assert (tmp_path / "data.csv").read_bytes() == b"0123456789"
+
+
+def test_download_file_segments(remote_store, tmp_path):
+    content = bytes(range(256)) * 4
+    session = FakeSession(content)
+    remote_store.config.parallel_threshold = 0
+    remote_store.config.segment_size = 100
+    remote_store.config.chunk_size = 10
+    dst = str(tmp_path / "data.bin")
+    with patch.object(remote_store, "_get_session", return_value=session):
+        remote_store._download_file("http://test.com/data.bin", dst)
+    assert len(session.requested) == 11
+    assert (tmp_path / "data.bin").read_bytes() == content
+    assert not (tmp_path / "data.bin.part.json").exists()
+
+
+def test_download_file_segments_resume(remote_store, tmp_path):
+    content = b"a" * 100 + b"b" * 100
+    session = FakeSession(content)
+    remote_store.config.parallel_threshold = 0
+    remote_store.config.segment_size = 100
+    part = tmp_path / "data.bin.part"
+    part.write_bytes(b"a" * 100 + b"\0" * 100)
+    (tmp_path / "data.bin.part.json").write_text('{"size": 200, "validator": "\\"v1\\"", "done": [0]}')
+    with patch.object(remote_store, "_get_session", return_value=session):
+        remote_store._download_file("http://test.com/data.bin", str(tmp_path / "data.bin"))
+    assert session.requested == ["bytes=100-199"]
+    assert (tmp_path / "data.bin").read_bytes() == content
+
+
+@pytest.mark.parametrize("etag", ['"v1"', 'W/"v1"'])
+def test_download_file_segments_etag(remote_store, tmp_path, etag):
+    content = bytes(range(256))
+    session = FakeSession(content, etag=etag)
+    remote_store.config.parallel_threshold = 0
+    remote_store.config.segment_size = 100
+    dst = str(tmp_path / "data.bin")
+    with patch.object(remote_store, "_get_session", return_value=session):
+        remote_store._download_file("http://test.com/data.bin", dst)
+    assert (tmp_path / "data.bin").read_bytes() == content
+    assert all(rng is not None for rng in session.requested)
+
+
+def test_download_file_segments_fallback(remote_store, tmp_path):
+    content = bytes(range(256))
+    session = FakeSession(content)
+    session.get = MagicMock(side_effect=lambda url, headers=None, **kwargs: FakeResponse(content, {}))
+    remote_store.config.parallel_threshold = 0
+    remote_store.config.segment_size = 100
+    dst = str(tmp_path / "data.bin")
+    with patch.object(remote_store, "_get_session", return_value=session):
+        remote_store._download_file("http://test.com/data.bin", dst)
+    assert (tmp_path / "data.bin").read_bytes() == content
+    assert "Range" not in session.get.call_args.kwargs["headers"]
+
+
+def test_download_file_resume_rejected(remote_store, tmp_path):
+    session = FakeSession(b"0123456789")
+    (tmp_path / "data.csv.part").write_bytes(b"0123456789abc")
+    dst = str(tmp_path / "data.csv")
+    with patch.object(remote_store, "_get_session", return_value=session):
+        remote_store._download_file("http://test.com/data.csv", dst)
+    assert session.requested == ["bytes=13-", None]
+    assert (tmp_path / "data.csv").read_bytes() == b"0123456789"
+
+
+def test_download_file_segments_incomplete(remote_store, tmp_path):
+    content = b"a" * 100 + b"b" * 100
+    session = FakeSession(content)
+    get = session.get
+
+    def truncated(url, headers=None, **kwargs):
+        response = get(url, headers=headers, **kwargs)
+        if headers["Range"] == "bytes=100-199":
+            response.content = response.content[:50]
+        return response
+
+    session.get = truncated
+    remote_store.config.parallel_threshold = 0
+    remote_store.config.segment_size = 100
+    with patch.object(remote_store, "_get_session", return_value=session):
+        with pytest.raises(StoreError):
+            remote_store._download_file("http://test.com/data.bin", str(tmp_path / "data.bin"))
+    assert '"done": [0]' in (tmp_path / "data.bin.part.json").read_text()
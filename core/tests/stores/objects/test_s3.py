@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
@@ -22,8 +22,9 @@ def test_init(s3_store):
     assert s3_store.config.bucket_name == "test_bucket"
 
 
+@patch("digitalhub_core.stores.objects.s3.S3Store._get_fingerprint", return_value=None)
 @patch("digitalhub_core.stores.objects.s3.S3Store._download_file")
-def test_download(mock_download_file, s3_store):
+def test_download(mock_download_file, _, s3_store):
     mock_download_file.return_value = "dst"
     assert s3_store.download("s3://test_bucket/src", "dst") == "dst"
     mock_download_file.assert_called_once_with("test_bucket", "src", "dst")
@@ -50,9 +51,79 @@ def test_persist_artifact(mock_upload_file, s3_store):
     mock_upload_file.assert_called_once_with("src", "dst")
 
 
-@patch("digitalhub_core.stores.objects.s3.S3Store._upload_fileobj")
-def test_write_df(mock_upload_fileobj, s3_store):
+@patch("digitalhub_core.stores.objects.s3.S3Store._upload_df")
+def test_write_df(mock_upload_df, s3_store):
     df = pd.DataFrame({"A": [1, 2, 3]})
-    mock_upload_fileobj.return_value = "dst.parquet"
+    mock_upload_df.return_value = "dst.parquet"
     assert s3_store.write_df(df, "dst.parquet") == "dst.parquet"
-    mock_upload_fileobj.assert_called_once()
+    mock_upload_df.assert_called_once()
+
+
+@patch("digitalhub_core.stores.objects.s3.S3Store._build_client")
+def test_get_client_cached(mock_build_client, s3_store):
+    client = s3_store._get_client()
+    assert s3_store._get_client() is client
+    mock_build_client.assert_called_once()
+
+
+def test_check_access_to_storage_memo(s3_store):
+    client = MagicMock()
+    s3_store._check_access_to_storage(client, "test_bucket")
+    s3_store._check_access_to_storage(client, "test_bucket")
+    client.head_bucket.assert_called_once_with(Bucket="test_bucket")
+
+    # Expired memo triggers a new check
+    s3_store.config.bucket_check_ttl = 0
+    s3_store._check_access_to_storage(client, "test_bucket")
+    assert client.head_bucket.call_count == 2
+
+
+def test_list(s3_store):
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "model/", "Size": 0}, {"Key": "model/a.bin", "Size": 1}]},
+        {"Contents": [{"Key": "model/sub/b.bin", "Size": 2}]},
+    ]
+    with patch.object(s3_store, "_get_client", return_value=client):
+        listing = s3_store.list("s3://test_bucket/model")
+    assert [i["path"] for i in listing] == ["s3://test_bucket/model/a.bin", "s3://test_bucket/model/sub/b.bin"]
+    client.get_paginator.return_value.paginate.assert_called_once_with(Bucket="test_bucket", Prefix="model/")
+
+
+@patch("digitalhub_core.stores.objects.s3.S3Store._download_file", side_effect=lambda bucket, key, dst: dst)
+def test_download_prefix(mock_download_file, s3_store):
+    listing = [
+        {"path": "s3://test_bucket/model/a.bin", "size": 1},
+        {"path": "s3://test_bucket/model/sub/b.bin", "size": 2},
+    ]
+    with patch.object(s3_store, "list", return_value=listing):
+        manifest = s3_store.download_prefix("s3://test_bucket/model", "/tmp/model")
+    assert [i["dst"] for i in manifest] == ["/tmp/model/a.bin", "/tmp/model/sub/b.bin"]
+    assert [i["size"] for i in manifest] == [1, 2]
+    mock_download_file.assert_any_call("test_bucket", "model/sub/b.bin", "/tmp/model/sub/b.bin")
+
+
+@patch("digitalhub_core.stores.objects.s3.S3Store._download_file", side_effect=lambda bucket, key, dst: dst)
+def test_download_prefix_sibling(mock_download_file, s3_store):
+    objects = ["data/a.csv", "data2/b.csv", "data.csv"]
+
+    def paginate(Bucket, Prefix):
+        return [{"Contents": [{"Key": key, "Size": 1} for key in objects if key.startswith(Prefix)]}]
+
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    with patch.object(s3_store, "_get_client", return_value=client):
+        manifest = s3_store.download_prefix("s3://test_bucket/data", "/tmp/data")
+    assert [i["dst"] for i in manifest] == ["/tmp/data/a.csv"]
+
+
+@patch("digitalhub_core.stores.objects.s3.S3Store._check_factory")
+@patch("digitalhub_core.stores.objects.s3.S3Store._upload_file", side_effect=lambda src, key: f"s3://test_bucket/{key}")
+def test_upload_dir(mock_upload_file, _, s3_store, tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.bin").write_bytes(b"a")
+    (tmp_path / "sub" / "b.bin").write_bytes(b"bb")
+    manifest = s3_store.upload_dir(str(tmp_path), "s3://test_bucket/model")
+    assert [i["dst"] for i in manifest] == ["s3://test_bucket/model/a.bin", "s3://test_bucket/model/sub/b.bin"]
+    assert [i["size"] for i in manifest] == [1, 2]
+    assert mock_upload_file.call_count == 2
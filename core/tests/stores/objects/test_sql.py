@@ -1,8 +1,10 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from digitalhub_core.stores.objects.sql import SqlStore, SQLStoreConfig
+from sqlalchemy import create_engine, text
 
 
 @pytest.fixture
@@ -19,8 +21,9 @@ def test_init(sql_store):
     assert sql_store.config.user == "test"
 
 
+@patch("digitalhub_core.stores.objects.sql.SqlStore._get_fingerprint", return_value=None)
 @patch("digitalhub_core.stores.objects.sql.SqlStore._download_table")
-def test_download(mock_download_table, sql_store):
+def test_download(mock_download_table, _, sql_store):
     mock_download_table.return_value = "table.parquet"
     assert sql_store.download("sql://database/schema/table", "table.parquet") == "table.parquet"
     mock_download_table.assert_called_once()
@@ -49,3 +52,91 @@ def test_write_df(mock_upload_table, sql_store):
     mock_upload_table.return_value = "sql://database/schema/table"
     assert sql_store.write_df(df, "sql://database/schema/table") == "sql://database/schema/table"
     mock_upload_table.assert_called_once()
+
+
+def test_bulk_methods_raise_not_implemented_error(sql_store):
+    with pytest.raises(NotImplementedError):
+        sql_store.upload_dir("src", "dst")
+    with pytest.raises(NotImplementedError):
+        sql_store.download_prefix("src", "dst")
+    with pytest.raises(NotImplementedError):
+        sql_store.list("src")
+
+
+@patch("digitalhub_core.stores.objects.sql.SqlStore._build_engine")
+def test_get_engine_cached(mock_build_engine, sql_store):
+    engine = sql_store._get_engine()
+    assert sql_store._get_engine() is engine
+    mock_build_engine.assert_called_once()
+
+
+def test_download_table_chunked(sql_store, tmp_path):
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE data (a INTEGER, b VARCHAR)"))
+        conn.execute(text("INSERT INTO data VALUES (1, NULL), (2, NULL), (3, 'x'), (4, 'y'), (5, NULL)"))
+    sql_store.config.chunk_size = 2
+    dst = str(tmp_path / "data.parquet")
+
+    with patch.object(sql_store, "_build_engine", return_value=engine):
+        assert sql_store._download_table("main", "data", dst) == dst
+
+    parquet = pq.ParquetFile(dst)
+    assert parquet.num_row_groups == 3
+    df = parquet.read().to_pandas()
+    assert df["a"].tolist() == [1, 2, 3, 4, 5]
+    assert df["b"].isna().tolist() == [True, True, False, False, True]
+    assert df["b"].dropna().tolist() == ["x", "y"]
+
+
+def test_download_table_empty(sql_store, tmp_path):
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE data (a INTEGER)"))
+    dst = str(tmp_path / "data.parquet")
+
+    with patch.object(sql_store, "_build_engine", return_value=engine):
+        sql_store._download_table("main", "data", dst)
+    assert pq.read_table(dst).num_rows == 0
+
+
+@patch("pandas.DataFrame.to_sql")
+@patch("digitalhub_core.stores.objects.sql.SqlStore._check_factory")
+def test_upload_table_copy(_, mock_to_sql, sql_store):
+    sql_store._upload_table(pd.DataFrame({"A": [1]}), "public", "table", method="copy")
+    assert mock_to_sql.call_args.kwargs["method"] == SqlStore._copy_insert
+    assert mock_to_sql.call_args.kwargs["chunksize"] == sql_store.config.chunk_size
+
+
+def test_copy_insert():
+    table = MagicMock()
+    table.name = "my_table"
+    table.schema = "public"
+    conn = MagicMock()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    copied = []
+    cursor.copy_expert.side_effect = lambda sql, buffer: copied.append((sql, buffer.read()))
+
+    SqlStore._copy_insert(table, conn, ["a", "b"], iter([(1, 'x,"y"'), (2, None)]))
+
+    sql, data = copied[0]
+    assert sql == 'COPY "public"."my_table" ("a", "b") FROM STDIN WITH (FORMAT csv, NULL \'\')'
+    assert data == '"1","x,""y"""\n"2",\n'
+
+
+def test_copy_insert_null_markers():
+    table = MagicMock()
+    table.name = "my_table"
+    table.schema = None
+    conn = MagicMock()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    copied = []
+    cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(buffer.read())
+
+    rows = [("\\N",), ("",), (None,)]
+    SqlStore._copy_insert(table, conn, ["a"], iter(rows))
+
+    # Postgres loads as NULL only the unquoted empty field
+    fields = copied[0].splitlines()
+    loaded = [None if field == "" else field[1:-1].replace('""', '"') for field in fields]
+    assert loaded == [row[0] for row in rows]
@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from digitalhub_core.stores.cache import DEFAULT_CACHE_MAX_SIZE, DownloadCache, get_download_cache
+from digitalhub_core.stores.objects.s3 import S3Store, S3StoreConfig
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DownloadCache(tmp_path / "cache", 1024)
+
+
+@pytest.fixture
+def src_file(tmp_path):
+    pth = tmp_path / "src" / "data.csv"
+    pth.parent.mkdir()
+    pth.write_text("a,b\n1,2\n")
+    return pth
+
+
+def test_get_miss(cache):
+    assert cache.get("s3://bucket/data.csv", "etag") is None
+
+
+def test_put_get(cache, src_file, tmp_path):
+    cache.put("s3://bucket/data.csv", "etag", str(src_file))
+    cached = cache.get("s3://bucket/data.csv", "etag")
+    assert cached is not None
+    assert cached.name == "data.csv"
+
+    # Different fingerprint is a miss
+    assert cache.get("s3://bucket/data.csv", "other") is None
+
+    dst = tmp_path / "dst" / "data.csv"
+    assert cache.materialize(cached, str(dst)) == str(dst)
+    assert dst.read_text() == "a,b\n1,2\n"
+
+
+def test_put_too_large(tmp_path, src_file):
+    cache = DownloadCache(tmp_path / "cache", 1)
+    cache.put("s3://bucket/data.csv", "etag", str(src_file))
+    assert cache.get("s3://bucket/data.csv", "etag") is None
+
+
+def test_evict_lru(tmp_path, src_file):
+    size = src_file.stat().st_size
+    cache = DownloadCache(tmp_path / "cache", size * 2)
+    cache.put("s3://bucket/a.csv", "etag", str(src_file))
+    cache.put("s3://bucket/b.csv", "etag", str(src_file))
+
+    # Touch "a" so that "b" becomes the least recently used entry
+    entry_b = cache._entry_path("s3://bucket/b.csv", "etag")
+    os.utime(entry_b / "meta.json", (0, 0))
+    cache.get("s3://bucket/a.csv", "etag")
+
+    cache.put("s3://bucket/c.csv", "etag", str(src_file))
+    assert cache.get("s3://bucket/b.csv", "etag") is None
+    assert cache.get("s3://bucket/a.csv", "etag") is not None
+    assert cache.get("s3://bucket/c.csv", "etag") is not None
+    assert cache.size() == size * 2
+
+
+def test_clear(cache, src_file):
+    cache.put("s3://bucket/data.csv", "etag", str(src_file))
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_store_download_cached(cache, tmp_path):
+    config = S3StoreConfig(
+        bucket_name="test_bucket",
+        endpoint_url="http://localhost:9000",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    store = S3Store("test_store", "s3", config)
+
+    def download_file(bucket, key, dst):
+        store._check_local_dst(dst)
+        with open(dst, "w") as f:
+            f.write("content")
+        return dst
+
+    with patch("digitalhub_core.stores.objects.base.get_download_cache", return_value=cache), patch.object(
+        store, "_get_fingerprint", return_value="etag"
+    ), patch.object(store, "_download_file", side_effect=download_file) as mock_download_file:
+        first = store.download("s3://test_bucket/data.csv", str(tmp_path / "first" / "data.csv"))
+        second = store.download("s3://test_bucket/data.csv", str(tmp_path / "second" / "data.csv"))
+
+    mock_download_file.assert_called_once()
+    assert first != second
+    assert Path(second).read_text() == "content"
+
+
+def test_entries_do_not_share_content(cache, src_file, tmp_path):
+    cache.put("s3://bucket/data.csv", "etag", str(src_file))
+    cached = cache.get("s3://bucket/data.csv", "etag")
+    dst = Path(cache.materialize(cached, str(tmp_path / "dst" / "data.csv")))
+
+    # Downloaded files stay writable and editing them does not change the entry
+    for pth in (src_file, dst):
+        assert os.access(pth, os.W_OK)
+        pth.write_text("changed")
+    assert cached.read_text() == "a,b\n1,2\n"
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("DIGITALHUB_CACHE_DIR", raising=False)
+    monkeypatch.delenv("DIGITALHUB_CACHE_MAX_SIZE", raising=False)
+    monkeypatch.setattr("digitalhub_core.stores.cache._download_cache", None)
+    assert not get_download_cache().is_enabled()
+
+    monkeypatch.setattr("digitalhub_core.stores.cache._download_cache", None)
+    monkeypatch.setenv("DIGITALHUB_CACHE_DIR", "/tmp/cache")
+    assert get_download_cache().max_size == DEFAULT_CACHE_MAX_SIZE
@@ -0,0 +1,40 @@
+from io import BytesIO
+
+import pandas as pd
+import pytest
+from digitalhub_core.stores.readers import filter_df, iter_parquet, read_parquet
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"a": range(100), "b": [i % 3 for i in range(100)], "c": ["x"] * 100})
+
+
+@pytest.fixture
+def parquet_path(df, tmp_path):
+    pth = tmp_path / "data.parquet"
+    df.to_parquet(pth, index=False, row_group_size=10)
+    return str(pth)
+
+
+def test_read_parquet_pushdown(parquet_path):
+    result = read_parquet(parquet_path, columns=["a", "b"], filters=[("a", ">=", 90), ("b", "=", 0)])
+    assert list(result.columns) == ["a", "b"]
+    assert result["a"].tolist() == [90, 93, 96, 99]
+
+
+def test_read_parquet_file_object(df, parquet_path):
+    with open(parquet_path, "rb") as f:
+        buffer = BytesIO(f.read())
+    pd.testing.assert_frame_equal(read_parquet(buffer), df, check_dtype=False)
+
+
+def test_iter_parquet(parquet_path):
+    batches = list(iter_parquet(parquet_path, columns=["a"], filters=[("a", "<", 25)], batch_size=10))
+    assert sum(len(i) for i in batches) == 25
+    assert all(len(i) <= 10 for i in batches)
+
+
+def test_filter_df(df):
+    assert filter_df(df, None) is df
+    assert filter_df(df, [[("a", "<", 2)], [("a", ">", 98)]])["a"].tolist() == [0, 1, 99]
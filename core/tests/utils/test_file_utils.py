@@ -0,0 +1,45 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from digitalhub_core.utils.file_utils import clone_file, link_or_copy
+
+
+@pytest.fixture
+def src(tmp_path):
+    pth = tmp_path / "src.bin"
+    pth.write_bytes(b"content" * 1000)
+    return pth
+
+
+@pytest.mark.parametrize("strategy", ["link", "clone", "copy"])
+def test_link_or_copy(strategy, src, tmp_path):
+    dst = tmp_path / "dst" / "dst.bin"
+    dst.parent.mkdir()
+    assert link_or_copy(src, dst, strategy) == str(dst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert os.path.samefile(src, dst) == (strategy == "link")
+
+
+def test_link_or_copy_dir_and_overwrite(src, tmp_path):
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    (dst_dir / "src.bin").write_bytes(b"old")
+    assert link_or_copy(src, dst_dir) == str(dst_dir / "src.bin")
+    assert (dst_dir / "src.bin").read_bytes() == src.read_bytes()
+    assert not os.path.samefile(src, dst_dir / "src.bin")
+
+
+def test_link_fallback_to_clone(src, tmp_path):
+    dst = tmp_path / "dst.bin"
+    with patch("os.link", side_effect=OSError):
+        link_or_copy(src, dst, "link")
+    assert not os.path.samefile(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_clone_file_plain_copy_fallback(src, tmp_path):
+    dst = tmp_path / "dst.bin"
+    with patch("fcntl.ioctl", side_effect=OSError), patch("os.copy_file_range", side_effect=OSError, create=True):
+        clone_file(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
@@ -1,4 +1,7 @@
-from digitalhub_core.utils.io_utils import read_text, read_yaml, write_yaml
+import json
+
+import pytest
+from digitalhub_core.utils.io_utils import read_file, read_text, read_yaml, write_file, write_yaml
 
 
 def test_write_read_yaml(tmp_path):
@@ -14,6 +17,37 @@ def test_write_read_yaml(tmp_path):
     assert read_data == data
 
 
+def test_write_read_yaml_multiple_documents(tmp_path):
+    data = [{"key": "value"}, {"other": "value"}]
+    file_path = tmp_path / "data.yaml"
+
+    write_yaml(file_path, data)
+    assert read_yaml(file_path) == data
+
+
+def test_read_yaml_empty(tmp_path):
+    file_path = tmp_path / "data.yaml"
+    file_path.write_text("")
+
+    assert read_yaml(file_path) is None
+
+
+@pytest.mark.parametrize("filename", ["data.json", "data.yaml"])
+def test_write_read_file(tmp_path, filename):
+    data = {"key": "value", "nested": {"list": [1, 2]}}
+    file_path = tmp_path / filename
+
+    write_file(file_path, data)
+    assert read_file(file_path) == data
+
+
+def test_write_file_json(tmp_path):
+    file_path = tmp_path / "data.json"
+
+    write_file(file_path, {"key": "value"})
+    assert json.loads(file_path.read_text()) == {"key": "value"}
+
+
 def test_read_text(tmp_path):
     text = "Hello, World!"
     file_path = tmp_path / "text.txt"
@@ -1,6 +1,7 @@
 from digitalhub_data.entities.dataitems.crud import (
     delete_dataitem,
     get_dataitem,
+    get_dataitem_async,
     import_dataitem,
     new_dataitem,
     update_dataitem,
@@ -6,9 +6,10 @@ from __future__ import annotations
 import typing
 
 from digitalhub_core.context.builder import check_context, get_context
+from digitalhub_core.entities._base.crud import get_entities_from_keys
 from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read, api_ctx_update
 from digitalhub_core.utils.generic_utils import parse_entity_key
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.io_utils import read_file
 from digitalhub_data.entities.dataitems.entity import dataitem_from_dict, dataitem_from_parameters
 
 if typing.TYPE_CHECKING:
@@ -32,7 +33,7 @@ def create_dataitem(**kwargs) -> Dataitem:
     return dataitem_from_parameters(**kwargs)
 
 
-def create_dataitem_from_dict(obj: dict) -> Dataitem:
+def create_dataitem_from_dict(obj: dict, lazy: bool = False) -> Dataitem:
     """
     Create a new Dataitem instance from a dictionary.
 
@@ -40,6 +41,8 @@ def create_dataitem_from_dict(obj: dict) -> Dataitem:
     ----------
     obj : dict
         Dictionary to create the Dataitem from.
+    lazy : bool
+        If True, the dataitem spec is built when first accessed.
 
     Returns
     -------
@@ -47,7 +50,7 @@ def create_dataitem_from_dict(obj: dict) -> Dataitem:
         Dataitem object.
     """
     check_context(obj.get("project"))
-    return dataitem_from_dict(obj)
+    return dataitem_from_dict(obj, lazy=lazy)
 
 
 def new_dataitem(
@@ -136,6 +139,29 @@ def get_dataitem(project: str, name: str, uuid: str | None = None) -> Dataitem:
     return create_dataitem_from_dict(obj)
 
 
+async def get_dataitem_async(project: str, name: str, uuid: str | None = None) -> Dataitem:
+    """
+    Asynchronously retrieve dataitem details from the backend.
+
+    Parameters
+    ----------
+    project : str
+        Name of the project.
+    name : str
+        The name of the dataitem.
+    uuid : str
+        UUID.
+
+    Returns
+    -------
+    Dataitem
+        Object instance.
+    """
+    api = api_ctx_read(project, "dataitems", name, uuid=uuid)
+    obj = await get_context(project).read_object_async(api)
+    return create_dataitem_from_dict(obj)
+
+
 def get_dataitem_from_key(key: str) -> Dataitem:
     """
     Get dataitem from key.
@@ -150,6 +176,33 @@ def get_dataitem_from_key(key: str) -> Dataitem:
     return get_dataitem(project, name, uuid)
 
 
+def get_dataitems_from_keys(
+    keys: list[str],
+    max_workers: int | None = None,
+    lazy: bool = False,
+) -> list[Dataitem]:
+    """
+    Get many dataitems from keys. Duplicated keys are read once and
+    the dataitems of each project are read concurrently.
+
+    Parameters
+    ----------
+    keys : list[str]
+        Keys of the dataitems.
+        Their format is store://<project>/dataitems/<kind>/<name>:<uuid>.
+    max_workers : int
+        Maximum number of concurrent reads.
+    lazy : bool
+        If True, the dataitem specs are built when first accessed.
+
+    Returns
+    -------
+    list[Dataitem]
+        Object instances, in the same order as the keys.
+    """
+    return get_entities_from_keys(keys, "dataitems", create_dataitem_from_dict, max_workers, lazy)
+
+
 def import_dataitem(file: str) -> Dataitem:
     """
     Get object from file.
@@ -157,14 +210,14 @@ def import_dataitem(file: str) -> Dataitem:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Dataitem
         Object instance.
     """
-    obj: dict = read_yaml(file)
+    obj: dict = read_file(file)
     return create_dataitem_from_dict(obj)
 
 
@@ -4,8 +4,10 @@ Dataitem module.
 from __future__ import annotations
 
 import shutil
+import tempfile
 import typing
 from pathlib import Path
+from typing import Iterator
 
 from digitalhub_core.context.builder import get_context
 from digitalhub_core.entities._base.entity import Entity
@@ -16,7 +18,7 @@ from digitalhub_core.stores.builder import get_default_store, get_store
 from digitalhub_core.utils.api import api_ctx_create, api_ctx_update
 from digitalhub_core.utils.exceptions import EntityError
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 from digitalhub_core.utils.uri_utils import map_uri_scheme
 from digitalhub_data.entities.dataitems.metadata import DataitemMetadata
 from digitalhub_data.entities.dataitems.status import DataitemStatus
@@ -32,6 +34,9 @@ class Dataitem(Entity):
     A class representing a dataitem.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "project", "name", "id"]
+
     def __init__(
         self,
         project: str,
@@ -71,9 +76,6 @@ class Dataitem(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.extend(["project", "name", "id"])
-
     #############################
     #  Save / Export
     #############################
@@ -109,7 +111,8 @@ class Dataitem(Entity):
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export file, written as JSON if it has a .json suffix, as YAML otherwise.
+            If not specified, the default value is used.
 
         Returns
         -------
@@ -120,13 +123,19 @@ class Dataitem(Entity):
             filename = f"{self.kind}_{self.name}_{self.id}.yml"
         pth = Path(self.project) / filename
         pth.parent.mkdir(parents=True, exist_ok=True)
-        write_yaml(pth, obj)
+        write_file(pth, obj)
 
     #############################
     #  Dataitem Methods
     #############################
 
-    def as_df(self, file_format: str | None = None, **kwargs) -> pd.DataFrame:
+    def as_df(
+        self,
+        file_format: str | None = None,
+        columns: list[str] | None = None,
+        filters: list | None = None,
+        **kwargs,
+    ) -> pd.DataFrame:
         """
         Read dataitem as a pandas DataFrame. If the dataitem is not local, it will be downloaded
         to a temporary folder and deleted after the method is executed. If no file_format is passed,
@@ -135,11 +144,17 @@ class Dataitem(Entity):
         If the dataitem is stored on s3 bucket, the path must be s3://<bucket>/<path_to_dataitem>.
         If the dataitem is stored on database (Postgres is the only one supported), the path must
         be sql://postgres/<database>/<schema>/<table/view>.
+        If columns or filters are passed, parquet dataitems are read in place when the store
+        supports it, transferring only the selected columns and the row groups matching the filters.
 
         Parameters
         ----------
         file_format : str
             Format of the file. (Supported csv and parquet).
+        columns : list[str]
+            Columns to read. If None, every column is read.
+        filters : list
+            Row filters in the format used by pandas.read_parquet, e.g. [("year", ">=", 2020)].
         **kwargs
             Keyword arguments.
 
@@ -152,6 +167,12 @@ class Dataitem(Entity):
             raise EntityError("Path is not specified.")
 
         store = get_store(self.spec.path)
+        extension = self._get_extension(self.spec.path, file_format)
+
+        # Read only selected columns and rows
+        if columns is not None or filters is not None:
+            return store.scan_df(self.spec.path, extension, columns=columns, filters=filters, **kwargs)
+
         tmp_path = False
 
         # Download dataitem if not local
@@ -162,7 +183,6 @@ class Dataitem(Entity):
             path = self.spec.path
 
         # Check file format and get dataitem as DataFrame
-        extension = self._get_extension(self.spec.path, file_format)
         df = store.read_df(path, extension, **kwargs)
 
         # Delete tmp folder
@@ -174,6 +194,126 @@ class Dataitem(Entity):
 
         return df
 
+    def iter_df(
+        self,
+        batch_size: int = 65_536,
+        file_format: str | None = None,
+        columns: list[str] | None = None,
+        filters: list | None = None,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the dataitem as pandas DataFrame batches, so that large
+        dataitems can be processed without loading them entirely in memory.
+        Parquet dataitems are read in place when the store supports it.
+
+        Parameters
+        ----------
+        batch_size : int
+            Maximum number of rows of each batch.
+        file_format : str
+            Format of the file. (Supported csv and parquet).
+        columns : list[str]
+            Columns to read. If None, every column is read.
+        filters : list
+            Row filters in the format used by pandas.read_parquet, e.g. [("year", ">=", 2020)].
+        **kwargs
+            Keyword arguments.
+
+        Yields
+        ------
+        pd.DataFrame
+            Pandas DataFrame batches.
+        """
+        if self.spec.path is None:
+            raise EntityError("Path is not specified.")
+        store = get_store(self.spec.path)
+        extension = self._get_extension(self.spec.path, file_format)
+        yield from store.iter_df(
+            self.spec.path,
+            extension,
+            columns=columns,
+            filters=filters,
+            batch_size=batch_size,
+            **kwargs,
+        )
+
+    def as_file(
+        self,
+        dst_dir: str | None = None,
+        formats: list[str] | None = None,
+        filename: str | None = None,
+    ) -> str:
+        """
+        Get dataitem as a local file, named after the dataitem unless a
+        filename is passed. If no formats are passed
+        or the dataitem format is one of them, the dataitem is handed over unchanged:
+        local dataitems are linked or copied, remote ones are downloaded as they are
+        and tables of SQL stores are exported as parquet. Otherwise the dataitem is
+        converted in the first of the formats, reading it in batches when converting
+        to csv.
+
+        Parameters
+        ----------
+        dst_dir : str
+            Destination directory. If None, a temporary directory is created.
+        formats : list[str]
+            Formats accepted by the caller (Supported csv and parquet).
+        filename : str
+            Name of the file, without extension. Callers staging several
+            versions of a dataitem in the same directory must pass distinct
+            names.
+
+        Returns
+        -------
+        str
+            Path of the dataitem file.
+
+        Raises
+        ------
+        EntityError
+            If path is not specified or the format is not supported.
+        """
+        if self.spec.path is None:
+            raise EntityError("Path is not specified.")
+
+        store = get_store(self.spec.path)
+        extension = self._get_extension(self.spec.path)
+        if dst_dir is None:
+            dst_dir = tempfile.mkdtemp()
+        filename = filename if filename is not None else self.name
+
+        # Hand over the original file
+        if formats is None or extension in formats:
+            dst = Path(dst_dir) / f"{filename}.{extension}"
+            if store.is_local():
+                return store.fetch_artifact(self.spec.path, str(dst))
+            if map_uri_scheme(self.spec.path) != "sql":
+                return store.download(self.spec.path, str(dst))
+
+            # SQL stores export tables in a directory, move the export to the destination
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            export_dir = tempfile.mkdtemp(dir=dst.parent)
+            try:
+                shutil.move(store.download(self.spec.path, export_dir), dst)
+            finally:
+                shutil.rmtree(export_dir, ignore_errors=True)
+            return str(dst)
+
+        # Convert dataitem in the requested format
+        file_format = formats[0]
+        dst = Path(dst_dir) / f"{filename}.{file_format}"
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if file_format == "csv":
+            with open(dst, "w", encoding="utf-8", newline="") as out_file:
+                for idx, df in enumerate(self.iter_df()):
+                    df.to_csv(out_file, sep=",", index=False, header=idx == 0)
+        elif file_format == "parquet":
+            self.as_df().to_parquet(dst, index=False)
+        else:
+            raise EntityError(f"Format {file_format} not supported. Only csv and parquet are supported.")
+        return str(dst)
+
     def write_df(self, target_path: str | None = None, df: pd.DataFrame | None = None, **kwargs) -> str:
         """
         Write pandas DataFrame as parquet.
@@ -397,7 +537,7 @@ def dataitem_from_parameters(
     )
 
 
-def dataitem_from_dict(obj: dict) -> Dataitem:
+def dataitem_from_dict(obj: dict, lazy: bool = False) -> Dataitem:
     """
     Create dataitem from dictionary.
 
@@ -405,10 +545,12 @@ def dataitem_from_dict(obj: dict) -> Dataitem:
     ----------
     obj : dict
         Dictionary to create dataitem from.
+    lazy : bool
+        If True, the dataitem spec is built when first accessed.
 
     Returns
     -------
     Dataitem
         Dataitem object.
     """
-    return Dataitem.from_dict(obj, validate=False)
+    return Dataitem.from_dict(obj, validate=False, lazy=lazy)
@@ -6,9 +6,9 @@ from __future__ import annotations
 import typing
 
 from digitalhub_core.client.builder import get_client, build_client
+from digitalhub_core.entities.projects.bundle import read_project_file
 from digitalhub_core.utils.api import api_base_read
 from digitalhub_core.utils.exceptions import BackendError, EntityError
-from digitalhub_core.utils.io_utils import read_yaml
 from digitalhub_data.entities.projects.entity import project_from_dict, project_from_parameters
 
 if typing.TYPE_CHECKING:
@@ -32,7 +32,7 @@ def create_project(**kwargs) -> Project:
     return project_from_parameters(**kwargs)
 
 
-def create_project_from_dict(obj: dict) -> Project:
+def create_project_from_dict(obj: dict, lazy: bool = False) -> Project:
     """
     Create a new Project instance from a dictionary.
 
@@ -40,13 +40,15 @@ def create_project_from_dict(obj: dict) -> Project:
     ----------
     obj : dict
         Dictionary to create the Project from.
+    lazy : bool
+        If True, the project spec is built when first accessed.
 
     Returns
     -------
     Project
         Project object.
     """
-    return project_from_dict(obj)
+    return project_from_dict(obj, lazy=lazy)
 
 
 def new_project(
@@ -220,7 +222,7 @@ def new_project(
     return obj
 
 
-def get_project(name: str, local: bool = False, config: dict | None = None) -> Project:
+def get_project(name: str, local: bool = False, config: dict | None = None, lazy: bool = False) -> Project:
     """
     Retrieves project details from the backend.
 
@@ -232,6 +234,10 @@ def get_project(name: str, local: bool = False, config: dict | None = None) -> P
         Flag to determine if backend is local.
     config : dict
         DHCore env configuration.
+    lazy : bool
+        If True, the project spec (i.e. the lists of project objects) is
+        built when first accessed. The project is still read from the
+        backend with its embedded objects.
 
     Returns
     -------
@@ -243,17 +249,18 @@ def get_project(name: str, local: bool = False, config: dict | None = None) -> P
     client = get_client(local)
     obj = client.read_object(api)
     obj["local"] = local
-    return create_project_from_dict(obj)
+    return create_project_from_dict(obj, lazy=lazy)
 
 
 def import_project(file: str, local: bool = False, config: dict | None = None) -> Project:
     """
     Import an Project object from a file using the specified file path.
+    The file is either a YAML or JSON file or a bundle written by Project.export.
 
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
     local : bool
         Flag to determine if backend is local.
     config : dict
@@ -265,6 +272,6 @@ def import_project(file: str, local: bool = False, config: dict | None = None) -
         Object instance.
     """
     build_client(local, config)
-    obj: dict = read_yaml(file)
+    obj: dict = read_project_file(file)
     obj["local"] = local
     return create_project_from_dict(obj)
@@ -5,17 +5,23 @@ import typing
 from digitalhub_core.entities._builders.metadata import build_metadata
 from digitalhub_core.entities._builders.spec import build_spec
 from digitalhub_core.entities._builders.status import build_status
-from digitalhub_core.entities.projects.entity import CTX_ENTITIES, FUNC_MAP, Project
+from digitalhub_core.entities.projects.entity import CTX_ENTITIES, Project
 from digitalhub_core.entities.projects.metadata import ProjectMetadata
+from digitalhub_core.entities.projects.objects import DICT_MAP
 from digitalhub_core.utils.generic_utils import build_uuid
-from digitalhub_data.entities.dataitems.crud import delete_dataitem, get_dataitem, new_dataitem
+from digitalhub_data.entities.dataitems.crud import (
+    create_dataitem_from_dict,
+    delete_dataitem,
+    get_dataitem,
+    new_dataitem,
+)
 
 if typing.TYPE_CHECKING:
     from digitalhub_data.entities.dataitems.entity import Dataitem
 
 
 CTX_ENTITIES.append("dataitems")
-FUNC_MAP["dataitems"] = get_dataitem
+DICT_MAP["dataitems"] = create_dataitem_from_dict
 
 
 class ProjectData(Project):
@@ -212,7 +218,7 @@ def project_from_parameters(
     )
 
 
-def project_from_dict(obj: dict) -> ProjectData:
+def project_from_dict(obj: dict, lazy: bool = False) -> ProjectData:
     """
     Create project from dictionary.
 
@@ -220,10 +226,12 @@ def project_from_dict(obj: dict) -> ProjectData:
     ----------
     obj : dict
         Dictionary to create project from.
+    lazy : bool
+        If True, the project spec is built when first accessed.
 
     Returns
     -------
     ProjectData
         ProjectData object.
     """
-    return ProjectData.from_dict(obj, validate=False)
+    return ProjectData.from_dict(obj, validate=False, lazy=lazy)
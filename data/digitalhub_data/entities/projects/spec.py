@@ -3,6 +3,7 @@ Project base specification module.
 """
 from __future__ import annotations
 
+from digitalhub_core.entities.projects.objects import ProjectObjects
 from digitalhub_core.entities.projects.spec import ProjectParams, ProjectSpec
 
 
@@ -29,7 +30,7 @@ class ProjectSpecData(ProjectSpec):
             List of project's dataitems.
         """
         super().__init__(context, functions, artifacts, workflows, **kwargs)
-        self.dataitems = dataitems if dataitems is not None else []
+        self.dataitems = ProjectObjects("dataitems", dataitems)
 
 
 class ProjectParamsData(ProjectParams):
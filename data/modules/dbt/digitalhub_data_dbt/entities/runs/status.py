@@ -14,6 +14,7 @@ class RunStatusDbt(RunStatus):
         message: str | None = None,
         results: dict | None = None,
         outputs: dict | None = None,
+        inputs: list[dict] | None = None,
         **kwargs,
     ) -> None:
         """
@@ -25,6 +26,8 @@ class RunStatusDbt(RunStatus):
             Runtime results.
         outputs : dict
             Runtime entities outputs.
+        inputs : list[dict]
+            Runtime inputs staging report.
         **kwargs
             Keyword arguments.
 
@@ -36,3 +39,4 @@ class RunStatusDbt(RunStatus):
         super().__init__(state, message)
         self.results = results
         self.outputs = outputs
+        self.inputs = inputs
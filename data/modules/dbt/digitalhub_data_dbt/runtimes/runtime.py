@@ -4,13 +4,15 @@ Runtime Dbt module.
 from __future__ import annotations
 
 import typing
+from functools import partial
 from pathlib import Path
 from typing import Callable
 
 from digitalhub_core.runtimes.base import Runtime
+from digitalhub_core.runtimes.staging import stage_inputs
 from digitalhub_core.utils.generic_utils import build_uuid
 from digitalhub_core.utils.logger import LOGGER
-from digitalhub_data.entities.dataitems.crud import get_dataitem_from_key
+from digitalhub_data.entities.dataitems.crud import get_dataitems_from_keys
 from digitalhub_data.runtimes.results import RunResultsData
 from digitalhub_data_dbt.utils.cleanup import cleanup
 from digitalhub_data_dbt.utils.configuration import (
@@ -51,6 +53,7 @@ class RuntimeDbt(Runtime):
         # Registries
         self._input_dataitems: list[dict[str, str]] = []
         self._versioned_tables: list[str] = []
+        self._inputs_report: list[dict] = []
 
     def build(self, function: dict, task: dict, run: dict) -> dict:
         """
@@ -99,21 +102,23 @@ class RuntimeDbt(Runtime):
         spec = run.get("spec")
         project = run.get("project")
 
-        LOGGER.info("Collecting inputs.")
-        self._collect_inputs(spec, project)
+        # Release materialized tables even if the run fails
+        try:
+            LOGGER.info("Collecting inputs.")
+            self._collect_inputs(spec, project)
 
-        LOGGER.info("Configure execution.")
-        output_table = self._configure_execution(spec, project)
+            LOGGER.info("Configure execution.")
+            output_table = self._configure_execution(spec, project)
 
-        LOGGER.info("Executing run.")
-        results = self._execute(executable, output_table, self.root_dir)
+            LOGGER.info("Executing run.")
+            results = self._execute(executable, output_table, self.root_dir)
 
-        LOGGER.info("Collecting outputs.")
-        output = self._collect_outputs(results, output_table, project)
-        status = build_status(output, results)
-
-        LOGGER.info("Clean up environment.")
-        self._cleanup()
+            LOGGER.info("Collecting outputs.")
+            output = self._collect_outputs(results, output_table, project)
+            status = build_status(output, results, self._inputs_report)
+        finally:
+            LOGGER.info("Clean up environment.")
+            self._cleanup()
 
         # Return run status
         LOGGER.info("Task completed, returning run status.")
@@ -149,7 +154,7 @@ class RuntimeDbt(Runtime):
             Run results.
         """
         dataitems = run_status.get("outputs", {}).get("dataitems", [])
-        dataitem_objs = [get_dataitem_from_key(dti.get("id")) for dti in dataitems]
+        dataitem_objs = get_dataitems_from_keys([dti.get("id") for dti in dataitems])
         return RunResultsData(dataitems=dataitem_objs)
 
     ####################
@@ -171,20 +176,36 @@ class RuntimeDbt(Runtime):
         -------
         None
         """
-        # Collect input dataitems
+        # Get and materialize input dataitems concurrently
         inputs = spec.get("inputs", {}).get("dataitems", [])
-        for name in inputs:
-            # Get dataitem objects from core
-            di = get_dataitem_(name, project)
+        tasks = {name: partial(self._stage_dataitem, name, project) for name in inputs}
+        staged, self._inputs_report = stage_inputs(tasks)
 
-            # Register dataitem in a dict to be used for inputs confs generation
-            self._input_dataitems.append({"name": di.name, "id": di.id})
+        # Register dataitem in a dict to be used for inputs confs generation
+        for dataitem in staged.values():
+            self._input_dataitems.append({"name": dataitem.name, "id": dataitem.id})
 
-            # Materialize dataitem in postgres
-            table = materialize_dataitem(di, name)
+    def _stage_dataitem(self, name: str, project: str) -> Dataitem:
+        """
+        Get a dataitem from core and materialize it in postgres. The
+        versioned table name is saved as soon as the table is acquired,
+        to be released at cleanup.
 
-            # Save versioned table name to be used for cleanup
-            self._versioned_tables.append(table)
+        Parameters
+        ----------
+        name : str
+            The dataitem name.
+        project : str
+            The project name.
+
+        Returns
+        -------
+        Dataitem
+            The dataitem.
+        """
+        dataitem = get_dataitem_(name, project)
+        self._versioned_tables.append(materialize_dataitem(dataitem, name))
+        return dataitem
 
     ####################
     # Configuration
@@ -1,35 +1,27 @@
 from __future__ import annotations
 
 from digitalhub_core.utils.logger import LOGGER
-from digitalhub_data_dbt.utils.env import get_connection
-from psycopg2 import sql
+from digitalhub_data_dbt.utils.materializations import release_tables
 
 
 def cleanup(tables: list[str]) -> None:
     """
-    Cleanup environment.
+    Cleanup environment. The tables materialized for the run are released
+    and the tables not used by any run for longer than their TTL are dropped.
+    Cleanup runs after the run even if it failed, so failures are logged and
+    not raised, to never mask the outcome of the run. Tables left referenced
+    are dropped once their stale TTL expires.
 
     Parameters
     ----------
     tables : list[str]
-        List of tables to delete.
+        List of tables to release.
 
     Returns
     -------
     None
     """
     try:
-        connection = get_connection()
-        with connection:
-            with connection.cursor() as cursor:
-                for table in tables:
-                    LOGGER.info(f"Dropping table '{table}'.")
-                    query = sql.SQL("DROP TABLE {table}").format(table=sql.Identifier(table))
-                    cursor.execute(query)
+        release_tables(tables)
     except Exception:
-        msg = "Something got wrong during environment cleanup."
-        LOGGER.exception(msg)
-        raise RuntimeError(msg)
-    finally:
-        LOGGER.info("Closing connection to postgres.")
-        connection.close()
+        LOGGER.exception("Something got wrong during environment cleanup.")
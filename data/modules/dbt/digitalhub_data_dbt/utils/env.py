@@ -12,6 +12,13 @@ POSTGRES_PORT = os.getenv("POSTGRES_PORT")
 POSTGRES_DATABASE = os.getenv("POSTGRES_DATABASE")
 POSTGRES_SCHEMA = os.getenv("POSTGRES_SCHEMA", "public")
 
+# Seconds a materialized dataitem table is kept after its last use
+MATERIALIZATION_TTL = int(os.getenv("DBT_MATERIALIZATION_TTL", "3600"))
+
+# Seconds after which a table still referenced is considered leaked
+# by a failed run and dropped anyway
+MATERIALIZATION_STALE_TTL = int(os.getenv("DBT_MATERIALIZATION_STALE_TTL", "86400"))
+
 
 def get_connection() -> psycopg2.extensions.connection:
     """
@@ -7,6 +7,7 @@ from digitalhub_core.utils.generic_utils import decode_string
 from digitalhub_core.utils.logger import LOGGER
 from digitalhub_data.entities.dataitems.crud import get_dataitem
 from digitalhub_data_dbt.utils.env import POSTGRES_DATABASE, POSTGRES_SCHEMA
+from digitalhub_data_dbt.utils.materializations import acquire_table
 
 if typing.TYPE_CHECKING:
     from digitalhub_data.entities.dataitems.entity import Dataitem
@@ -44,7 +45,8 @@ def get_dataitem_(name: str, project: str) -> Dataitem:
 
 def materialize_dataitem(dataitem: Dataitem, name: str) -> str:
     """
-    Materialize dataitem in postgres.
+    Materialize dataitem in postgres. The table name encodes the dataitem
+    version, so a table already materialized by a previous run is reused.
 
     Parameters
     ----------
@@ -67,7 +69,7 @@ def materialize_dataitem(dataitem: Dataitem, name: str) -> str:
         table_name = f"{name}_v{dataitem.id}"
         LOGGER.info(f"Materializing dataitem '{name}' as '{table_name}'.")
         target_path = f"sql://{POSTGRES_DATABASE}/{POSTGRES_SCHEMA}/{table_name}"
-        dataitem.write_df(target_path, if_exists="replace")
+        acquire_table(table_name, lambda: dataitem.write_df(target_path, if_exists="replace"))
         return table_name
     except Exception:
         msg = f"Something got wrong during dataitem {name} materialization."
@@ -0,0 +1,185 @@
+"""
+Materializations module.
+
+Input dataitems are materialized in postgres as tables named after
+the dataitem version, which is immutable. Materialized tables are
+kept in a registry with their row count, the number of runs using
+them and the time of their last use, so that a later run can reuse
+a table instead of loading the dataitem again. Tables are dropped
+only when no run uses them and they have not been used for a while.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+from digitalhub_core.utils.logger import LOGGER
+from digitalhub_data_dbt.utils.env import (
+    MATERIALIZATION_STALE_TTL,
+    MATERIALIZATION_TTL,
+    POSTGRES_SCHEMA,
+    get_connection,
+)
+from psycopg2 import sql
+
+# Registry of the materialized tables
+REGISTRY_TABLE = "dhcore_materializations"
+
+
+def acquire_table(table: str, load: Callable[[], None]) -> bool:
+    """
+    Acquire a materialized table for a run. The table is loaded only if
+    it is not registered, does not exist or its row count differs from
+    the registered one. A lock on the table name serializes runs
+    acquiring or dropping the same table.
+
+    Parameters
+    ----------
+    table : str
+        The table name.
+    load : Callable[[], None]
+        Function loading the dataitem in the table, replacing it.
+
+    Returns
+    -------
+    bool
+        True if the table was reused, False if it was loaded.
+    """
+    connection = get_connection()
+    try:
+        _create_registry(connection)
+        with connection:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (table,))
+                row_count = _get_valid_row_count(cursor, table)
+                reused = row_count is not None
+                if reused:
+                    LOGGER.info(f"Reusing materialized table '{table}'.")
+                else:
+                    load()
+                    row_count = _count_rows(cursor, table)
+                _register(cursor, table, row_count)
+        return reused
+    finally:
+        connection.close()
+
+
+def release_tables(
+    tables: list[str],
+    ttl: int = MATERIALIZATION_TTL,
+    stale_ttl: int = MATERIALIZATION_STALE_TTL,
+) -> list[str]:
+    """
+    Release the tables acquired by a run and drop the expired ones,
+    i.e. the tables not used by any run for more than ttl seconds and
+    the tables not used at all for more than stale_ttl seconds.
+
+    Parameters
+    ----------
+    tables : list[str]
+        The tables acquired by the run.
+    ttl : int
+        Seconds an unused table is kept after its last use.
+    stale_ttl : int
+        Seconds after which a table is dropped even if still referenced.
+
+    Returns
+    -------
+    list[str]
+        The dropped tables.
+    """
+    registry = sql.Identifier(POSTGRES_SCHEMA, REGISTRY_TABLE)
+    connection = get_connection()
+    try:
+        _create_registry(connection)
+        with connection:
+            with connection.cursor() as cursor:
+                if tables:
+                    query = sql.SQL(
+                        "UPDATE {registry} SET refcount = GREATEST(refcount - 1, 0), last_used = now() "
+                        "WHERE table_name = ANY(%s)"
+                    ).format(registry=registry)
+                    cursor.execute(query, (list(tables),))
+
+        dropped = []
+        with connection:
+            with connection.cursor() as cursor:
+                query = sql.SQL(
+                    "SELECT table_name FROM {registry} "
+                    "WHERE (refcount = 0 AND last_used < now() - make_interval(secs => %s)) "
+                    "OR last_used < now() - make_interval(secs => %s) "
+                    "FOR UPDATE SKIP LOCKED"
+                ).format(registry=registry)
+                cursor.execute(query, (ttl, stale_ttl))
+                for (table,) in cursor.fetchall():
+                    # Skip tables being acquired by another run
+                    cursor.execute("SELECT pg_try_advisory_xact_lock(hashtext(%s))", (table,))
+                    if not cursor.fetchone()[0]:
+                        continue
+                    LOGGER.info(f"Dropping table '{table}'.")
+                    query = sql.SQL("DROP TABLE IF EXISTS {table}").format(table=sql.Identifier(POSTGRES_SCHEMA, table))
+                    cursor.execute(query)
+                    query = sql.SQL("DELETE FROM {registry} WHERE table_name = %s").format(registry=registry)
+                    cursor.execute(query, (table,))
+                    dropped.append(table)
+        return dropped
+    finally:
+        connection.close()
+
+
+def _create_registry(connection) -> None:
+    """
+    Create the registry table if it does not exist.
+    """
+    with connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (REGISTRY_TABLE,))
+            query = sql.SQL(
+                "CREATE TABLE IF NOT EXISTS {registry} ("
+                "table_name TEXT PRIMARY KEY, "
+                "row_count BIGINT NOT NULL, "
+                "refcount INTEGER NOT NULL DEFAULT 0, "
+                "last_used TIMESTAMPTZ NOT NULL DEFAULT now())"
+            ).format(registry=sql.Identifier(POSTGRES_SCHEMA, REGISTRY_TABLE))
+            cursor.execute(query)
+
+
+def _get_valid_row_count(cursor, table: str) -> int | None:
+    """
+    Get the row count of a table if it is registered, exists and has
+    the registered row count, None otherwise.
+    """
+    query = sql.SQL("SELECT row_count FROM {registry} WHERE table_name = %s").format(
+        registry=sql.Identifier(POSTGRES_SCHEMA, REGISTRY_TABLE)
+    )
+    cursor.execute(query, (table,))
+    registered = cursor.fetchone()
+    if registered is None:
+        return None
+
+    cursor.execute("SELECT to_regclass(%s)", (f'"{POSTGRES_SCHEMA}"."{table}"',))
+    if cursor.fetchone()[0] is None:
+        return None
+
+    row_count = _count_rows(cursor, table)
+    return row_count if row_count == registered[0] else None
+
+
+def _register(cursor, table: str, row_count: int) -> None:
+    """
+    Register a run using a table, recording its row count.
+    """
+    query = sql.SQL(
+        "INSERT INTO {registry} AS r (table_name, row_count, refcount, last_used) VALUES (%s, %s, 1, now()) "
+        "ON CONFLICT (table_name) DO UPDATE SET row_count = EXCLUDED.row_count, "
+        "refcount = r.refcount + 1, last_used = now()"
+    ).format(registry=sql.Identifier(POSTGRES_SCHEMA, REGISTRY_TABLE))
+    cursor.execute(query, (table, row_count))
+
+
+def _count_rows(cursor, table: str) -> int:
+    """
+    Count the rows of a table.
+    """
+    query = sql.SQL("SELECT count(*) FROM {table}").format(table=sql.Identifier(POSTGRES_SCHEMA, table))
+    cursor.execute(query)
+    return cursor.fetchone()[0]
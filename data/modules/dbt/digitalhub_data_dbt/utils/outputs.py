@@ -384,7 +384,7 @@ def _get_data_preview(columns: tuple, data: list[tuple]) -> list[dict]:
         raise RuntimeError(msg)
 
 
-def build_status(dataitem: Dataitem, results: dbtRunnerResult) -> dict:
+def build_status(dataitem: Dataitem, results: dbtRunnerResult, inputs: list[dict] | None = None) -> dict:
     """
     Build status.
 
@@ -394,6 +394,8 @@ def build_status(dataitem: Dataitem, results: dbtRunnerResult) -> dict:
         The dataitem output.
     results : dbtRunnerResult
         The dbt results.
+    inputs : list[dict]
+        The inputs staging report.
 
     Returns
     -------
@@ -406,4 +408,5 @@ def build_status(dataitem: Dataitem, results: dbtRunnerResult) -> dict:
             "dataitems": [get_entity_info(dataitem, "dataitems")],
         },
         "results": results.result[-1].to_dict(),
+        "inputs": inputs,
     }
@@ -5,12 +5,14 @@ from __future__ import annotations
 
 import shutil
 import typing
+from functools import partial
 from pathlib import Path
 from typing import Callable
 
-from digitalhub_core.entities.artifacts.crud import get_artifact_from_key
+from digitalhub_core.entities.artifacts.crud import get_artifacts_from_keys
 from digitalhub_core.runtimes.base import Runtime
 from digitalhub_core.runtimes.results import RunResults
+from digitalhub_core.runtimes.staging import stage_inputs
 from digitalhub_core.utils.generic_utils import build_uuid
 from digitalhub_core.utils.logger import LOGGER
 from digitalhub_data_nefertem_frictionless.utils.configurations import (
@@ -43,6 +45,9 @@ class RuntimeNefertemFrictionless(Runtime):
         self.store = {"name": "local", "store_type": "local"}
         self.nt_id = build_uuid()
 
+        # Inputs staging report
+        self._inputs_report: list[dict] = []
+
     def build(self, function: dict, task: dict, run: dict) -> dict:
         """
         Build run spec.
@@ -102,7 +107,7 @@ class RuntimeNefertemFrictionless(Runtime):
 
         LOGGER.info("Collecting outputs.")
         outputs = self._collect_outputs(results, project)
-        status = build_status(results, outputs)
+        status = build_status(results, outputs, self._inputs_report)
 
         LOGGER.info("Clean up environment.")
         self._cleanup()
@@ -144,7 +149,7 @@ class RuntimeNefertemFrictionless(Runtime):
             Run results.
         """
         artifacts = run_status.get("outputs", {}).get("artifacts", [])
-        artifact_objs = [get_artifact_from_key(art.get("id")) for art in artifacts]
+        artifact_objs = get_artifacts_from_keys([art.get("id") for art in artifacts])
         return RunResults(artifact_objs)
 
     ####################
@@ -169,11 +174,30 @@ class RuntimeNefertemFrictionless(Runtime):
         """
         Path(f"{self.output_path}/tmp").mkdir(parents=True, exist_ok=True)
 
-        mapper = []
-        for name in spec.get("inputs", {}).get("dataitems", []):
-            dataitem = get_dataitem_(name, project)
-            mapper.append(persist_dataitem(dataitem, name, self.output_path))
-        return mapper
+        # Get and persist input dataitems concurrently
+        inputs = spec.get("inputs", {}).get("dataitems", [])
+        tasks = {name: partial(self._stage_dataitem, name, project) for name in inputs}
+        staged, self._inputs_report = stage_inputs(tasks)
+        return list(staged.values())
+
+    def _stage_dataitem(self, name: str, project: str) -> dict:
+        """
+        Get a dataitem from backend and persist it locally.
+
+        Parameters
+        ----------
+        name : str
+            The dataitem name.
+        project : str
+            The project name.
+
+        Returns
+        -------
+        dict
+            The dataitem name and path.
+        """
+        dataitem = get_dataitem_(name, project)
+        return persist_dataitem(dataitem, name, self.output_path)
 
     ####################
     # Configuration
@@ -45,14 +45,16 @@ def get_dataitem_(name: str, project: str) -> Dataitem:
 
 def persist_dataitem(dataitem: Dataitem, name: str, output_path: str) -> dict:
     """
-    Persist dataitem locally.
+    Persist dataitem locally. Nefertem reads inputs as csv, so csv
+    dataitems are handed over unchanged and the others are converted.
+    The file is named after the input name, not after the dataitem.
 
     Parameters
     ----------
     dataitem : Dataitem
         The dataitem to persist.
     name : str
-        The dataitem name.
+        The input name.
     output_path : str
         The dataitem output path.
 
@@ -68,8 +70,7 @@ def persist_dataitem(dataitem: Dataitem, name: str, output_path: str) -> dict:
     """
     try:
         LOGGER.info(f"Persisting dataitem '{name}' locally.")
-        tmp_path = f"{output_path}/tmp/{name}.csv"
-        dataitem.as_df().to_csv(tmp_path, sep=",", index=False)
+        tmp_path = dataitem.as_file(f"{output_path}/tmp", formats=["csv"], filename=name)
         return {"name": name, "path": tmp_path}
     except Exception:
         msg = f"Error during dataitem '{name}' collection."
@@ -84,7 +84,7 @@ def upload_artifact(artifact: Artifact, src_path: str) -> None:
         raise EntityError(msg)
 
 
-def build_status(results: dict, outputs: list[tuple[Artifact, str]]) -> dict:
+def build_status(results: dict, outputs: list[tuple[Artifact, str]], inputs: list[dict] | None = None) -> dict:
     """
     Build run status.
 
@@ -94,6 +94,8 @@ def build_status(results: dict, outputs: list[tuple[Artifact, str]]) -> dict:
         Neferetem run results.
     outputs : list
         Couples of Artifact and their src_path.
+    inputs : list[dict]
+        The inputs staging report.
 
     Returns
     -------
@@ -106,4 +108,5 @@ def build_status(results: dict, outputs: list[tuple[Artifact, str]]) -> dict:
             "artifacts": [get_entity_info(i[0], "artifacts") for i in outputs],
         },
         "results": results,
+        "inputs": inputs,
     }
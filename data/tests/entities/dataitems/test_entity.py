@@ -0,0 +1,37 @@
+from functools import partial
+from types import SimpleNamespace
+
+from digitalhub_core.runtimes.staging import stage_inputs
+from digitalhub_data.entities.dataitems.entity import Dataitem
+
+
+def dataitem(uuid, path):
+    spec = SimpleNamespace(path=str(path))
+    return Dataitem("test", "data", uuid, "table", metadata=None, spec=spec, status=None)
+
+
+def test_as_file_inputs_sharing_name(tmp_path):
+    sources = {}
+    for uuid in ("v1", "v2"):
+        sources[uuid] = tmp_path / f"{uuid}.csv"
+        sources[uuid].write_text(f"version\n{uuid}\n")
+
+    dst_dir = tmp_path / "inputs"
+    tasks = {
+        key: partial(dataitem(key, src).as_file, str(dst_dir), formats=["csv"], filename=key)
+        for key, src in sources.items()
+    }
+    staged, _ = stage_inputs(tasks)
+
+    assert staged["v1"] != staged["v2"]
+    for key, path in staged.items():
+        assert path == str(dst_dir / f"{key}.csv")
+        assert open(path).read() == f"version\n{key}\n"
+
+
+def test_as_file_converted(tmp_path):
+    src = tmp_path / "data.csv"
+    src.write_text("a,b\n1,2\n")
+
+    path = dataitem("v1", src).as_file(str(tmp_path / "inputs"), formats=["parquet"], filename="key")
+    assert path == str(tmp_path / "inputs" / "key.parquet")
@@ -1,2 +1,9 @@
-from digitalhub_ml.entities.models.crud import delete_model, get_model, import_model, new_model, update_model
+from digitalhub_ml.entities.models.crud import (
+    delete_model,
+    get_model,
+    get_model_async,
+    import_model,
+    new_model,
+    update_model,
+)
 from digitalhub_ml.entities.projects.crud import get_or_create_project, get_project, import_project, new_project
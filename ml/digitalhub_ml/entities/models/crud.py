@@ -7,7 +7,7 @@ import typing
 
 from digitalhub_core.context.builder import check_context, get_context
 from digitalhub_core.utils.api import api_ctx_delete, api_ctx_read, api_ctx_update
-from digitalhub_core.utils.io_utils import read_yaml
+from digitalhub_core.utils.io_utils import read_file
 from digitalhub_ml.entities.models.entity import model_from_dict, model_from_parameters
 
 if typing.TYPE_CHECKING:
@@ -31,7 +31,7 @@ def create_model(**kwargs) -> Model:
     return model_from_parameters(**kwargs)
 
 
-def create_model_from_dict(obj: dict) -> Model:
+def create_model_from_dict(obj: dict, lazy: bool = False) -> Model:
     """
     Create a new Model instance from a dictionary.
 
@@ -39,6 +39,8 @@ def create_model_from_dict(obj: dict) -> Model:
     ----------
     obj : dict
         Dictionary to create the Model from.
+    lazy : bool
+        If True, the model spec is built when first accessed.
 
     Returns
     -------
@@ -46,7 +48,7 @@ def create_model_from_dict(obj: dict) -> Model:
         Model object.
     """
     check_context(obj.get("project"))
-    return model_from_dict(obj)
+    return model_from_dict(obj, lazy=lazy)
 
 
 def new_model(
@@ -128,6 +130,30 @@ def get_model(project: str, name: str, uuid: str | None = None) -> Model:
     return create_model_from_dict(obj)
 
 
+async def get_model_async(project: str, name: str, uuid: str | None = None) -> Model:
+    """
+    Asynchronously retrieve model details from the backend.
+
+    Parameters
+    ----------
+
+    project : str
+        Name of the project.
+    name : str
+        The name of the model.
+    uuid : str
+        UUID.
+
+    Returns
+    -------
+    Model
+        Object instance.
+    """
+    api = api_ctx_read(project, "models", name, uuid=uuid)
+    obj = await get_context(project).read_object_async(api)
+    return create_model_from_dict(obj)
+
+
 def import_model(file: str) -> Model:
     """
     Import an Model object from a file using the specified file path.
@@ -135,14 +161,14 @@ def import_model(file: str) -> Model:
     Parameters
     ----------
     file : str
-        Path to the file.
+        Path to the file (YAML, or JSON with a .json suffix).
 
     Returns
     -------
     Model
         Object instance.
     """
-    obj: dict = read_yaml(file)
+    obj: dict = read_file(file)
     return create_model_from_dict(obj)
 
 
@@ -13,7 +13,7 @@ from digitalhub_core.entities._builders.spec import build_spec
 from digitalhub_core.entities._builders.status import build_status
 from digitalhub_core.utils.api import api_ctx_create, api_ctx_update
 from digitalhub_core.utils.generic_utils import build_uuid, get_timestamp
-from digitalhub_core.utils.io_utils import write_yaml
+from digitalhub_core.utils.io_utils import write_file
 from digitalhub_ml.entities.models.metadata import ModelMetadata
 from digitalhub_ml.entities.models.status import ModelStatus
 
@@ -27,6 +27,9 @@ class Model(Entity):
     A class representing a model.
     """
 
+    # Attributes to render as dict
+    _obj_attr = [*Entity._obj_attr, "project", "name", "id"]
+
     def __init__(
         self,
         project: str,
@@ -66,9 +69,6 @@ class Model(Entity):
         self.spec = spec
         self.status = status
 
-        # Add attributes to be used in the to_dict method
-        self._obj_attr.extend(["project", "name", "id"])
-
     #############################
     #  Save / Export
     #############################
@@ -104,7 +104,8 @@ class Model(Entity):
         Parameters
         ----------
         filename : str
-            Name of the export YAML file. If not specified, the default value is used.
+            Name of the export file, written as JSON if it has a .json suffix, as YAML otherwise.
+            If not specified, the default value is used.
 
         Returns
         -------
@@ -115,7 +116,7 @@ class Model(Entity):
             filename = f"{self.kind}_{self.name}_{self.id}.yml"
         pth = Path(self.project) / filename
         pth.parent.mkdir(parents=True, exist_ok=True)
-        write_yaml(pth, obj)
+        write_file(pth, obj)
 
     #############################
     #  Context
@@ -245,7 +246,7 @@ def model_from_parameters(
     )
 
 
-def model_from_dict(obj: dict) -> Model:
+def model_from_dict(obj: dict, lazy: bool = False) -> Model:
     """
     Create Model instance from a dictionary.
 
@@ -253,10 +254,12 @@ def model_from_dict(obj: dict) -> Model:
     ----------
     obj : dict
         Dictionary to create Model from.
+    lazy : bool
+        If True, the model spec is built when first accessed.
 
     Returns
     -------
     Model
         Model instance.
     """
-    return Model.from_dict(obj, validate=False)
+    return Model.from_dict(obj, validate=False, lazy=lazy)
@@ -6,16 +6,17 @@ from digitalhub_core.entities._builders.metadata import build_metadata
 from digitalhub_core.entities._builders.spec import build_spec
 from digitalhub_core.entities._builders.status import build_status
 from digitalhub_core.entities.projects.metadata import ProjectMetadata
+from digitalhub_core.entities.projects.objects import DICT_MAP
 from digitalhub_core.utils.generic_utils import build_uuid
-from digitalhub_data.entities.projects.entity import CTX_ENTITIES, FUNC_MAP, ProjectData
-from digitalhub_ml.entities.models.crud import delete_model, get_model, new_model
+from digitalhub_data.entities.projects.entity import CTX_ENTITIES, ProjectData
+from digitalhub_ml.entities.models.crud import create_model_from_dict, delete_model, get_model, new_model
 
 if typing.TYPE_CHECKING:
     from digitalhub_ml.entities.models.entity import Model
 
 
 CTX_ENTITIES.append("models")
-FUNC_MAP["models"] = get_model
+DICT_MAP["models"] = create_model_from_dict
 
 
 class ProjectMl(ProjectData):
@@ -208,7 +209,7 @@ def project_from_parameters(
     )
 
 
-def project_from_dict(obj: dict) -> ProjectData:
+def project_from_dict(obj: dict, lazy: bool = False) -> ProjectData:
     """
     Create project from dictionary.
 
@@ -216,10 +217,12 @@ def project_from_dict(obj: dict) -> ProjectData:
     ----------
     obj : dict
         Dictionary to create project from.
+    lazy : bool
+        If True, the project spec is built when first accessed.
 
     Returns
     -------
     ProjectData
         ProjectData object.
     """
-    return ProjectData.from_dict(obj, validate=False)
+    return ProjectData.from_dict(obj, validate=False, lazy=lazy)
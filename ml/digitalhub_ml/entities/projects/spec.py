@@ -3,6 +3,7 @@ Project base specification module.
 """
 from __future__ import annotations
 
+from digitalhub_core.entities.projects.objects import ProjectObjects
 from digitalhub_ml.entities.projects.spec import ProjectParamsData, ProjectSpecData
 
 
@@ -30,7 +31,7 @@ class ProjectSpecML(ProjectSpecData):
             List of project's models.
         """
         super().__init__(context, functions, artifacts, workflows, dataitems, **kwargs)
-        self.models = models if models is not None else []
+        self.models = ProjectObjects("models", models)
 
 
 class ProjectParamsML(ProjectParamsData):
@@ -8,10 +8,10 @@ import typing
 from pathlib import Path
 from typing import Callable
 
-from digitalhub_core.entities.artifacts.crud import get_artifact_from_key
+from digitalhub_core.entities.artifacts.crud import get_artifacts_from_keys
 from digitalhub_core.runtimes.base import Runtime
 from digitalhub_core.utils.logger import LOGGER
-from digitalhub_data.entities.dataitems.crud import get_dataitem_from_key
+from digitalhub_data.entities.dataitems.crud import get_dataitems_from_keys
 from digitalhub_data.runtimes.results import RunResultsData
 from digitalhub_ml_mlrun.utils.configurations import (
     get_dhcore_function,
@@ -45,6 +45,9 @@ class RuntimeMlrun(Runtime):
         self.root_path = Path("/tmp/mlrun_run")
         self.function_source = None
 
+        # Inputs staging report
+        self._inputs_report: list[dict] = []
+
         self.root_path.mkdir(parents=True, exist_ok=True)
 
     def build(self, function: dict, task: dict, run: dict) -> dict:
@@ -137,9 +140,9 @@ class RuntimeMlrun(Runtime):
             Run results.
         """
         artifacts = run_status.get("outputs", {}).get("artifacts", [])
-        artifact_objs = [get_artifact_from_key(art.get("id")) for art in artifacts]
+        artifact_objs = get_artifacts_from_keys([art.get("id") for art in artifacts])
         datatatems = run_status.get("outputs", {}).get("dataitems", [])
-        dataitem_objs = [get_dataitem_from_key(dti.get("id")) for dti in datatatems]
+        dataitem_objs = get_dataitems_from_keys([dti.get("id") for dti in datatatems])
         return RunResultsData(artifact_objs, dataitem_objs)
 
     ####################
@@ -165,7 +168,8 @@ class RuntimeMlrun(Runtime):
         LOGGER.info("Getting inputs.")
         inputs = spec.get("inputs", {})
         parameters = spec.get("parameters", {})
-        return get_inputs_parameters(inputs, parameters, project, tmp_dir)
+        function_args, self._inputs_report = get_inputs_parameters(inputs, parameters, project, tmp_dir)
+        return function_args
 
     ####################
     # Configuration
@@ -220,7 +224,7 @@ class RuntimeMlrun(Runtime):
             Status of the executed run.
         """
         outputs = parse_mlrun_artifacts(results.status.artifacts)
-        return build_status(results, outputs)
+        return build_status(results, outputs, self._inputs_report)
 
     ####################
     # Cleanup
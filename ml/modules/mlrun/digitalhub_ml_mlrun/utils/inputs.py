@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import typing
+from functools import partial
 from pathlib import Path
 
 from digitalhub_core.entities.artifacts.crud import get_artifact
+from digitalhub_core.runtimes.staging import stage_inputs
 from digitalhub_core.utils.exceptions import BackendError, EntityError
 from digitalhub_core.utils.logger import LOGGER
 from digitalhub_data.entities.dataitems.crud import get_dataitem
@@ -43,9 +45,12 @@ def get_dataitem_(name: str, project: str) -> Dataitem:
         raise BackendError(msg)
 
 
-def persist_dataitem(dataitem: Dataitem, name: str, tmp_dir: str) -> str:
+def persist_dataitem(dataitem: Dataitem, name: str, tmp_dir: str, key: str) -> str:
     """
-    Persist dataitem locally.
+    Persist dataitem locally. Mlrun reads csv and parquet inputs, so
+    dataitems are handed over in their original format. The file is
+    named after the input key, so inputs sharing a dataitem do not
+    overwrite each other.
 
     Parameters
     ----------
@@ -55,6 +60,8 @@ def persist_dataitem(dataitem: Dataitem, name: str, tmp_dir: str) -> str:
         The dataitem name.
     tmp_dir : str
         Temporary download directory.
+    key : str
+        The input key.
 
     Returns
     -------
@@ -68,9 +75,7 @@ def persist_dataitem(dataitem: Dataitem, name: str, tmp_dir: str) -> str:
     """
     try:
         LOGGER.info(f"Persisting dataitem '{name}' locally.")
-        tmp_path = f"{tmp_dir}/{name}.csv"
-        dataitem.as_df().to_csv(tmp_path, sep=",", index=False)
-        return tmp_path
+        return dataitem.as_file(tmp_dir, formats=["csv", "parquet"], filename=key)
     except Exception:
         msg = f"Error during dataitem '{name}' collection."
         LOGGER.exception(msg)
@@ -140,9 +145,10 @@ def persist_artifact(artifact: Artifact, name: str, tmp_dir: str) -> str:
         raise EntityError(msg)
 
 
-def get_inputs_parameters(inputs: dict, parameters: dict, project: str, tmp_dir: str) -> dict:
+def get_inputs_parameters(inputs: dict, parameters: dict, project: str, tmp_dir: str) -> tuple[dict, list[dict]]:
     """
-    Set inputs.
+    Set inputs. Dataitems and artifacts are fetched and persisted
+    concurrently.
 
     Parameters
     ----------
@@ -157,15 +163,60 @@ def get_inputs_parameters(inputs: dict, parameters: dict, project: str, tmp_dir:
 
     Returns
     -------
-    dict
-        Mlrun inputs.
+    tuple[dict, list[dict]]
+        Mlrun inputs and the inputs staging report.
     """
-    inputs_objects = {}
+    tasks = {}
     for k, v in inputs.get("dataitems", {}).items():
-        di: Dataitem = get_dataitem_(v, project)
-        inputs_objects[k] = persist_dataitem(di, v, tmp_dir)
+        tasks[k] = partial(stage_dataitem, v, project, tmp_dir, k)
     for k, v in inputs.get("artifacts", {}).items():
-        ar: Artifact = get_artifact_(v, project)
-        inputs_objects[k] = persist_artifact(ar, v, tmp_dir)
+        tasks[k] = partial(stage_artifact, v, project, tmp_dir)
+    inputs_objects, report = stage_inputs(tasks)
     input_parameters = parameters.get("inputs", {})
-    return {"inputs": {**inputs_objects, **input_parameters}}
+    return {"inputs": {**inputs_objects, **input_parameters}}, report
+
+
+def stage_dataitem(name: str, project: str, tmp_dir: str, key: str) -> str:
+    """
+    Get a dataitem from core and persist it locally.
+
+    Parameters
+    ----------
+    name : str
+        The dataitem name.
+    project : str
+        The project name.
+    tmp_dir : str
+        Temporary download directory.
+    key : str
+        The input key.
+
+    Returns
+    -------
+    str
+        The dataitem path.
+    """
+    di: Dataitem = get_dataitem_(name, project)
+    return persist_dataitem(di, name, tmp_dir, key)
+
+
+def stage_artifact(name: str, project: str, tmp_dir: str) -> str:
+    """
+    Get an artifact from core and persist it locally.
+
+    Parameters
+    ----------
+    name : str
+        The artifact name.
+    project : str
+        The project name.
+    tmp_dir : str
+        Temporary download directory.
+
+    Returns
+    -------
+    str
+        The artifact path.
+    """
+    ar: Artifact = get_artifact_(name, project)
+    return persist_artifact(ar, name, tmp_dir)
@@ -158,7 +158,11 @@ def _get_data_preview(columns: tuple, data: list[tuple]) -> list[dict]:
         raise RuntimeError(msg)
 
 
-def build_status(execution_results: RunObject, outputs: list[Artifact | Dataitem]) -> dict:
+def build_status(
+    execution_results: RunObject,
+    outputs: list[Artifact | Dataitem],
+    inputs: list[dict] | None = None,
+) -> dict:
     """
     Collect outputs.
 
@@ -168,6 +172,8 @@ def build_status(execution_results: RunObject, outputs: list[Artifact | Dataitem
         Execution results.
     outputs : list[Artifact | Dataitem]
         List of entities to collect outputs from.
+    inputs : list[dict]
+        The inputs staging report.
 
     """
     try:
@@ -185,6 +191,7 @@ def build_status(execution_results: RunObject, outputs: list[Artifact | Dataitem
                 "dataitems": dataitems,
             },
             "results": execution_results.to_json(),
+            "inputs": inputs,
         }
     except Exception:
         msg = "Something got wrong during run status building."